@@ -2,14 +2,23 @@ from fletx.core.controller import FletXController
 from fletx.core.effects import EffectManager, Effect
 from fletx.core.page import FletXPage
 from fletx.core.state import (
-    ReactiveDependencyTracker, Observer,
-    Reactive, Computed, RxBool, RxDict, RxInt, RxList, RxStr
+    ReactiveDependencyTracker, Observer, ReactiveScheduler,
+    ReactiveBatch, batched,
+    Reactive, Computed, RxBool, RxDict, RxInt, RxList, RxStr,
+    ListChange, Insert, Remove, Replace, Move, Reset,
+    identity_equals, shallow_equals, deep_equals, version_equals
 )
 from fletx.core.types import (
     BindingConfig, BindingType,
     ComputedBindingConfig, FormFieldValidationRule
 )
 from fletx.core.widget import FletXWidget
+from fletx.core.validation import FormValidator, ValidationResult
+from fletx.core.scheduling import (
+    FrameScheduler, request_update,
+    RebuildScheduler, RebuildPriority,
+    TimerWheel, DebouncedCall, TrailingCall
+)
 from fletx.core.services import FletXService
 from fletx.core.http import HTTPClient
 
@@ -19,9 +28,21 @@ __all__ = [
     'Effect',
     'FletXPage',
     'FletXService',
+    'FrameScheduler',
+    'request_update',
+    'RebuildScheduler',
+    'RebuildPriority',
+    'TimerWheel',
+    'DebouncedCall',
+    'TrailingCall',
     'HTTPClient',
+    'FormValidator',
+    'ValidationResult',
     'ReactiveDependencyTracker',
     'Observer',
+    'ReactiveBatch',
+    'ReactiveScheduler',
+    'batched',
     'Reactive',
     'Computed',
     'RxBool',
@@ -29,6 +50,16 @@ __all__ = [
     'RxInt',
     'RxList',
     'RxStr',
+    'ListChange',
+    'Insert',
+    'Remove',
+    'Replace',
+    'Move',
+    'Reset',
+    'identity_equals',
+    'shallow_equals',
+    'deep_equals',
+    'version_equals',
     'RouteInfo',
     'BindingConfig',
     'BindingType',
@@ -6,22 +6,28 @@ and to facilitate the creation of robust and maintainable applications.
 """
 
 from typing import (
-    List, Callable, Any, Dict, 
+    List, Callable, Any, Awaitable, Dict, Deque, Set, Tuple,
     Optional, TypeVar, Generic, Union
 )
+from collections import deque
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 import asyncio
+import time
+import inspect
+import itertools
+import threading
 import weakref
 import logging
 from enum import Enum
 from fletx.core.di import DI
 from fletx.core.effects import EffectManager
+from fletx.core.scheduling import run_awaitable
 from fletx.core.state import (
     Reactive, RxInt, RxStr, RxBool, RxList, RxDict, 
-    Computed, Observer, ReactiveDependencyTracker
+    Computed, Observer, ReactiveDependencyTracker, ReactiveBatch
 )
-from fletx.utils import get_logger, get_event_loop
+from fletx.utils import get_logger, get_event_loop, get_running_event_loop
 
 # GENERIC TYPE
 T = TypeVar('T')
@@ -54,44 +60,210 @@ class ControllerEvent:
         self.type = type
         self.data = data
         self.source = source
-        self.timestamp = get_event_loop().time()
+
+        # Loop time is based on the monotonic clock
+        loop = get_event_loop()
+        self.timestamp = loop.time() if loop is not None else time.monotonic()
+
+
+####
+##      TOPIC TRIE NODE
+#####
+class _TopicNode:
+    """Node of the EventBus topics trie, one per pattern segment"""
+
+    __slots__ = ('children', 'pattern')
+
+    def __init__(self):
+        self.children: Dict[str, '_TopicNode'] = {}
+        self.pattern: Optional[str] = None
+
+
+####
+##      EVENT HISTORY VIEW
+#####
+class _HistoryView(RxList[ControllerEvent]):
+    """
+    Read-only reactive list of EventBus history events.
+    Views are shared by every caller and only updated by their bus,
+    modifying them raises a TypeError and `dispose` is left to the bus.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("EventBus history views are read-only")
+    
+    append = insert = remove = clear = pop = extend = move = _read_only
+    __setitem__ = __delitem__ = _read_only
+
+    @property
+    def value(self) -> List[ControllerEvent]:
+        return RxList.value.fget(self)
+    
+    @value.setter
+    def value(self, new_value: List[ControllerEvent]):
+        self._read_only()
+    
+    def dispose(self):
+        """Views are disposed with their bus"""
+
+    # Bus side updates
+    def _push(self, event: ControllerEvent):
+        RxList.append(self, event)
+
+    def _drop_oldest(self):
+        RxList.__delitem__(self, 0)
+
+    def _reset(self):
+        RxList.clear(self)
+
+    def _close(self):
+        RxList.dispose(self)
 
 
 ####
 ##      CONTROLLER EVENT BUS
 #####
 class EventBus:
-    """Reactive Event Bus for inter-controller communication"""
+    """
+    Reactive Event Bus for inter-controller communication.
+    Listeners subscribe to event types or topic patterns (see `on`),
+    compiled into a trie so that emitting only walks the patterns
+    that can match. Matching patterns are cached per event type.
+
+    The bus keeps the last `history_size` emitted events in a ring 
+    buffer (None keeps every event), indexed by event type. Reactive 
+    history views are only maintained once requested, and are updated 
+    incrementally on each emit.
+
+    With async dispatch, emitted events are queued (history and 
+    `last_event` are still updated right away) and dispatched in order 
+    on the event loop, with a bounded queue and a limited number of 
+    running coroutine listeners. `await bus.drain()` waits for them.
+    Without a running loop, events are dispatched synchronously.
+    """
 
-    def __init__(self):
+    def __init__(
+        self, 
+        history_size: Optional[int] = 1000,
+        dispatch: str = 'sync',
+        queue_size: int = 1000,
+        concurrency: int = 8,
+        overflow: str = 'drop',
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Args:
+            history_size: Number of events kept in history, None keeps all
+            dispatch: 'sync' runs listeners in `emit`, 'async' queues 
+                events and dispatches them on the event loop
+            queue_size: Maximum number of queued events (async dispatch)
+            concurrency: Maximum number of coroutine listeners running
+                at once (async dispatch)
+            overflow: What to do with an event emitted while the queue
+                is full: 'drop' it, 'block' the emitting thread until 
+                there is room, or 'coalesce' it with the queued event 
+                of the same type (the oldest event is dropped otherwise)
+            loop: Loop events are dispatched on, defaults to the app loop
+        """
+
+        if history_size is not None and history_size < 0:
+            raise ValueError("history_size must be positive or None")
+        if dispatch not in ('sync', 'async'):
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+        if overflow not in ('drop', 'block', 'coalesce'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if queue_size < 1 or concurrency < 1:
+            raise ValueError("queue_size and concurrency must be at least 1")
+        
         self._listeners: Dict[str, List[Callable]] = {}
         self._once_listeners: Dict[str, List[Callable]] = {}
-        self._event_history: RxList[ControllerEvent] = RxList([])
+        self._topics = _TopicNode()
+        self._topic_order: Dict[str, int] = {}
+        self._topic_sequence = itertools.count()
+        self._dispatch_cache: Dict[str, Tuple[str, ...]] = {}
+        self._dispatch_cache_size = 1024
+        self._history_size = history_size
+        self._history: Deque[ControllerEvent] = deque(maxlen = history_size)
+        self._history_index: Dict[str, Deque[ControllerEvent]] = {}
+        self._event_history: Optional[_HistoryView] = None
+        self._history_views: 'weakref.WeakValueDictionary[str, _HistoryView]' = (
+            weakref.WeakValueDictionary()
+        )
         self._last_event: Reactive[Optional[ControllerEvent]] = Reactive(None)
         self.logger = get_logger('FletX.EventBus')
 
+        # Async dispatch
+        self._dispatch_mode = dispatch
+        self._queue_size = queue_size
+        self._concurrency = concurrency
+        self._overflow = overflow
+        self._loop = loop
+        self._queue: Deque[ControllerEvent] = deque()
+        self._queue_condition = threading.Condition()
+        self._dispatching = False
+        self._dropped = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._drain_waiters: List[asyncio.Future] = []
+
     @property
     def last_event(self) -> Reactive[Optional[ControllerEvent]]:
         """Last emited event (reactive)"""
         return self._last_event
     
+    @property
+    def history_size(self) -> Optional[int]:
+        """Maximum number of events kept in history"""
+        return self._history_size
+    
     @property
     def event_history(self) -> RxList[ControllerEvent]:
-        """Events history (reactive)"""
+        """Events history (reactive, read-only)"""
+
+        if self._event_history is None:
+            self._event_history = _HistoryView(list(self._history))
         return self._event_history
     
+    def get_history(self, event_type: Optional[str] = None) -> List[ControllerEvent]:
+        """Returns the events in history, of a given type or of all types"""
+
+        if event_type is None:
+            return list(self._history)
+        return list(self._history_index.get(event_type, ()))
+    
+    def clear_history(self):
+        """Clears the events history"""
+
+        with ReactiveBatch():
+            self._history.clear()
+            self._history_index.clear()
+            if self._event_history is not None:
+                self._event_history._reset()
+            for view in list(self._history_views.values()):
+                view._reset()
+    
     def on(self, event_type: str, callback: Callable):
-        """Listen to an event"""
+        """
+        Listen to an event.
+        `event_type` may be a topic pattern: dot separated segments where
+        `*` matches exactly one segment and `#` zero or more segments 
+        (`"orders.*"` matches `"orders.created"`, `"orders.#"` matches 
+        `"orders"` and `"orders.item.added"`).
+        """
 
         if event_type not in self._listeners:
             self._listeners[event_type] = []
+            self._add_topic(event_type)
         self._listeners[event_type].append(callback)
     
     def once(self, event_type: str, callback: Callable):
-        """Liste to an event only one time (once)"""
+        """Liste to an event only one time (once), see `on` for patterns"""
 
         if event_type not in self._once_listeners:
             self._once_listeners[event_type] = []
+            self._add_topic(event_type)
         self._once_listeners[event_type].append(callback)
     
     def off(self, event_type: str, callback: Callable = None):
@@ -115,6 +287,87 @@ class EventBus:
                 self._once_listeners[event_type] = [
                     l for l in self._once_listeners[event_type] if l != callback
                 ]
+        
+        self._prune_topic(event_type)
+    
+    def _add_topic(self, pattern: str):
+        """Adds a pattern to the topics trie"""
+
+        if pattern in self._topic_order:
+            return
+        
+        node = self._topics
+        for segment in pattern.split('.'):
+            node = node.children.setdefault(segment, _TopicNode())
+        node.pattern = pattern
+        self._topic_order[pattern] = next(self._topic_sequence)
+        self._dispatch_cache.clear()
+    
+    def _prune_topic(self, pattern: str):
+        """Removes a pattern without listeners from the topics trie"""
+
+        if (
+            pattern not in self._topic_order
+            or self._listeners.get(pattern) 
+            or self._once_listeners.get(pattern)
+        ):
+            return
+        
+        self._listeners.pop(pattern, None)
+        self._once_listeners.pop(pattern, None)
+        del self._topic_order[pattern]
+        self._dispatch_cache.clear()
+
+        # Drop the pattern node and its branch if it became empty
+        path = [self._topics]
+        for segment in pattern.split('.'):
+            path.append(path[-1].children[segment])
+        path[-1].pattern = None
+
+        for parent, segment in zip(reversed(path[:-1]), reversed(pattern.split('.'))):
+            node = parent.children[segment]
+            if node.pattern is not None or node.children:
+                break
+            del parent.children[segment]
+    
+    def _match(self, event_type: str) -> Tuple[str, ...]:
+        """
+        Returns the patterns matching an event type, in subscription 
+        order. Results are cached until the set of patterns changes.
+        """
+
+        patterns = self._dispatch_cache.get(event_type)
+        if patterns is not None:
+            return patterns
+        
+        matched: Set[str] = set()
+        segments = event_type.split('.')
+
+        def visit(node: _TopicNode, index: int):
+            if index == len(segments):
+                if node.pattern is not None:
+                    matched.add(node.pattern)
+            else:
+                child = node.children.get(segments[index])
+                if child is not None:
+                    visit(child, index + 1)
+                child = node.children.get('*')
+                if child is not None:
+                    visit(child, index + 1)
+            
+            # `#` consumes any number of the remaining segments
+            child = node.children.get('#')
+            if child is not None:
+                for next_index in range(index, len(segments) + 1):
+                    visit(child, next_index)
+
+        visit(self._topics, 0)
+        patterns = tuple(sorted(matched, key = self._topic_order.__getitem__))
+
+        if len(self._dispatch_cache) >= self._dispatch_cache_size:
+            self._dispatch_cache.clear()
+        self._dispatch_cache[event_type] = patterns
+        return patterns
     
     def emit(
         self, 
@@ -128,68 +381,285 @@ class EventBus:
             event = ControllerEvent(event, data)
 
         # Update reactive state
-        self._last_event.value = event
-        self._event_history.append(event)
+        with ReactiveBatch():
+            self._last_event.value = event
+            self._record(event)
+        
+        # Sync dispatch, or no running loop to dispatch on
+        loop = self._get_dispatch_loop()
+        if loop is None:
+            for callback in self._take_callbacks(event):
+                self._call(callback, event)
+            return
+        
+        self._enqueue(event, loop)
+
+    def _take_callbacks(self, event: ControllerEvent) -> List[Callable]:
+        """
+        Returns the listeners of an event: normal listeners followed 
+        by once listeners, which are removed.
+        """
+
+        patterns = self._match(event.type)
+        callbacks = [
+            callback
+            for pattern in patterns
+            for callback in self._listeners.get(pattern, ())
+        ]
+        
+        for pattern in patterns:
+            listeners = self._once_listeners.pop(pattern, None)
+            if not listeners:
+                continue
+
+            # Drop the pattern if it has no listener left
+            self._prune_topic(pattern)
+            callbacks.extend(listeners)
         
-        # Execute normal listeners
-        if event.type in self._listeners:
-            for callback in self._listeners[event.type]:
+        return callbacks
+    
+    def _call(self, callback: Callable, event: ControllerEvent):
+        """Calls a listener, coroutine listeners run on the app loop"""
 
-                try:
-                    # Coroutine callback
-                    if asyncio.iscoroutinefunction(callback):
-                        get_event_loop().create_task(callback(event))
+        try:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                run_awaitable(self._guard(callback, result))
+        
+        # Error in the callback
+        except Exception as e:
+            self._log_error(callback, e)
 
-                    # A non coroutine function
-                    else:
-                        callback(event)
+    async def _guard(self, callback: Callable, awaitable: Awaitable):
+        """Awaits a coroutine listener, logging its errors"""
 
-                # Error in the callback
-                except Exception as e:
-                    self.logger.error(
-                        f"Error when executing {callback.__name__} callback: {e}"
-                    )
+        try:
+            await awaitable
+        except Exception as e:
+            self._log_error(callback, e)
+    
+    def _log_error(self, callback: Callable, error: Exception):
+        name = getattr(callback, '__name__', repr(callback))
+        self.logger.error(
+            f"Error when executing {name} callback: {error}", exc_info = error
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be dispatched"""
+
+        with self._queue_condition:
+            return len(self._queue)
+    
+    @property
+    def dropped(self) -> int:
+        """Number of events dropped because the queue was full"""
+        return self._dropped
+
+    def _get_dispatch_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Returns the loop events are dispatched on, None for sync dispatch"""
+
+        if self._dispatch_mode == 'sync':
+            return None
         
-        # Execute Once listeners and then remove them
-        if event.type in self._once_listeners:
-            listeners = self._once_listeners[event.type].copy()
+        return get_running_event_loop(self._loop)
 
-            # Clear event type listeners
-            self._once_listeners[event.type].clear()
+    def _enqueue(self, event: ControllerEvent, loop: asyncio.AbstractEventLoop):
+        """Queues an event, applying the overflow policy when full"""
 
-            # Then Execute each callback
-            for callback in listeners:
+        with self._queue_condition:
+            if len(self._queue) >= self._queue_size:
+                if not self._make_room(event, loop):
+                    return
 
+            self._queue.append(event)
+            if self._dispatching:
+                return
+            self._dispatching = True
+        
+        loop.call_soon_threadsafe(
+            lambda: self._track(loop.create_task(self._dispatch_queue(loop)))
+        )
+    
+    def _make_room(self, event: ControllerEvent, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Applies the overflow policy to a full queue (lock held).
+        Returns whether the event should still be queued.
+        """
+
+        if self._overflow == 'coalesce':
+            # Replace the latest queued event of the same type
+            for index in range(len(self._queue) - 1, -1, -1):
+                if self._queue[index].type == event.type:
+                    self._queue[index] = event
+                    return False
+            self._queue.popleft()
+            self._dropped += 1
+            return True
+        
+        if self._overflow == 'block' and not self._on_loop_thread(loop):
+            while len(self._queue) >= self._queue_size:
+                self._queue_condition.wait()
+            return True
+
+        if self._overflow == 'block':
+            # The dispatcher runs on this thread, it can't be waited for
+            self.logger.debug(f"Event queue full, {event.type} queued anyway")
+            return True
+        
+        self._dropped += 1
+        self.logger.debug(f"Event queue full, {event.type} dropped")
+        return False
+    
+    @staticmethod
+    def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    async def _dispatch_queue(self, loop: asyncio.AbstractEventLoop):
+        """Dispatches queued events, one at a time, on the loop"""
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        while True:
+            with self._queue_condition:
+                if not self._queue:
+                    self._dispatching = False
+                    break
+                event = self._queue.popleft()
+                self._queue_condition.notify_all()
+            
+            for callback in self._take_callbacks(event):
                 try:
-                    # Coroutine callback
-                    if asyncio.iscoroutinefunction(callback):
-                        get_event_loop.create_task(callback(event))
+                    result = callback(event)
+                except Exception as e:
+                    self._log_error(callback, e)
+                    continue
 
-                    # Non coroutine callback
-                    else:
-                        callback(event)
+                if inspect.isawaitable(result):
+                    # Wait for a free slot, the queue fills meanwhile
+                    await self._semaphore.acquire()
+                    self._track(loop.create_task(self._run_handler(callback, result)))
+            
+            # Let the loop breathe between events
+            await asyncio.sleep(0)
+    
+    async def _run_handler(self, callback: Callable, awaitable: Awaitable):
+        try:
+            await self._guard(callback, awaitable)
+        finally:
+            self._semaphore.release()
+    
+    def _track(self, task: asyncio.Task):
+        """
+        Keeps a reference to a dispatch task until it is done,
+        so it can't be collected and `drain`/`dispose` can see it.
+        """
+
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+    
+    def _task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        self._wake_drain_waiters()
+    
+    def _wake_drain_waiters(self):
+        waiters, self._drain_waiters = self._drain_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def drain(self):
+        """
+        Waits until every queued event is dispatched and the coroutine 
+        listeners they started are done. Must be awaited on the loop 
+        events are dispatched on.
+        """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._queue_condition:
+                busy = self._dispatching or bool(self._queue)
+            if not busy and not self._tasks:
+                return
+            
+            waiter = loop.create_future()
+            self._drain_waiters.append(waiter)
+            await waiter
 
-                except Exception as e:
-                    logging.error(
-                        f"Error when executing {callback.__name__} callback: {e}"
-                    )
+    def _record(self, event: ControllerEvent):
+        """Adds an event to history, evicting the oldest one when full"""
+
+        if self._history_size == 0:
+            return
+        
+        evicted = None
+        if len(self._history) == self._history_size:
+            evicted = self._history[0]
+        self._history.append(event)
+        self._history_index.setdefault(event.type, deque()).append(event)
+
+        if self._event_history is not None:
+            self._event_history._push(event)
+            if evicted is not None:
+                self._event_history._drop_oldest()
+        
+        view = self._history_views.get(event.type)
+        if view is not None:
+            view._push(event)
+
+        if evicted is None:
+            return
+        
+        # The evicted event is the oldest one of its type
+        events = self._history_index[evicted.type]
+        events.popleft()
+        if not events:
+            del self._history_index[evicted.type]
+
+        view = self._history_views.get(evicted.type)
+        if view is not None:
+            view._drop_oldest()
 
     def listen_reactive(
         self, 
         event_type: str
-    ) -> Computed[List[ControllerEvent]]:
-        """Return a computed property that filters events by type"""
-
-        return Computed(
-            lambda: [e for e in self._event_history.value if e.type == event_type]
-        )
+    ) -> RxList[ControllerEvent]:
+        """
+        Return a reactive list of the events of a type in history.
+        The list is shared by callers and updated on each emit, it is
+        read-only (modifying it raises a TypeError).
+        """
+
+        view = self._history_views.get(event_type)
+        if view is None:
+            view = _HistoryView(list(self._history_index.get(event_type, ())))
+            self._history_views[event_type] = view
+        return view
     
     def dispose(self):
         """Clean up event bus"""
 
         self._listeners.clear()
         self._once_listeners.clear()
-        self._event_history.dispose()
+        with self._queue_condition:
+            self._queue.clear()
+            self._queue_condition.notify_all()
+        for task in list(self._tasks):
+            task.cancel()
+        self._topics = _TopicNode()
+        self._topic_order.clear()
+        self._dispatch_cache.clear()
+        self._history.clear()
+        self._history_index.clear()
+        if self._event_history is not None:
+            self._event_history._close()
+        for view in list(self._history_views.values()):
+            view._close()
+        self._history_views.clear()
         self._last_event.dispose()
 
 
@@ -236,7 +706,7 @@ class ControllerContext:
     def has_reactive(self, key: str) -> Computed[bool]:
         """Reactive version of has() method"""
 
-        return Computed(lambda: key in self._context.value)
+        return Computed(lambda: key in self._context)
     
     def remove(self, key: str):
         """Removes a given key from context data"""
@@ -258,6 +728,11 @@ class ControllerContext:
         """Handles a context change."""
 
         return self._context.listen(callback)
+
+    def listen_key(self, key: str, callback: Callable[[], None]) -> Observer:
+        """Handles changes of a single context key."""
+
+        return self._context.listen_key(key, callback)
     
     def dispose(self):
         """Dispose context."""
@@ -557,7 +1032,7 @@ class FletXController:
     
     def listen_reactive_local(
         self, event_type: str
-    ) -> Computed[List[ControllerEvent]]:
+    ) -> RxList[ControllerEvent]:
         """Listen reactively to a local event"""
 
         self._check_not_disposed()
@@ -565,7 +1040,7 @@ class FletXController:
     
     def listen_reactive_global(
         self, event_type: str
-    ) -> Computed[List[ControllerEvent]]:
+    ) -> RxList[ControllerEvent]:
         
         """Listen reactively to a global event"""
         self._check_not_disposed()
@@ -749,12 +1224,13 @@ class FletXController:
     
     def create_computed(
         self, 
-        compute_fn: Callable[[], T]
+        compute_fn: Callable[[], T],
+        lazy: bool = False
     ) -> Computed[T]:
-        """Create a reactive property"""
+        """Create a reactive property (recomputed on read only if lazy)"""
 
         self._check_not_disposed()
-        computed = Computed(compute_fn)
+        computed = Computed(compute_fn, lazy = lazy)
         self.add_cleanup(computed.dispose)
         return computed
     
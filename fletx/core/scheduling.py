@@ -0,0 +1,716 @@
+"""
+UI Update Scheduling.
+Coalesces control updates requested by the reactive layer (Obx rebuilds,
+reactive bindings, FletX widgets) and flushes them once per frame,
+with a single `page.update(*controls)` call per page.
+Also runs deferred Obx rebuilds on the event loop, by priority lane.
+"""
+
+import math
+import time
+import asyncio
+import inspect
+import threading
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import flet as ft
+
+from fletx.utils import get_logger, get_running_event_loop
+
+_MISSING = object()
+
+# CALL LATER
+def call_later(delay: float, callback: Callable[[], None]):
+    """
+    Calls `callback` after `delay` seconds, on the app event loop
+    when it is running, on a timer thread otherwise.
+    """
+
+    loop = get_running_event_loop()
+
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.call_later, delay, callback)
+    else:
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+
+
+####
+##      TIMER WHEEL
+#####
+class WheelTimer:
+    """Handle of a timer scheduled on a TimerWheel"""
+
+    __slots__ = ('callback', 'rounds', 'slot', 'wheel')
+
+    def __init__(self, callback: Callable[[], None], rounds: int, slot: int, wheel: 'TimerWheel'):
+        self.callback = callback
+        self.rounds = rounds
+        self.slot = slot
+        self.wheel = wheel
+
+    def cancel(self):
+        """Cancels the timer, if it did not fire yet"""
+        self.wheel._cancel(self)
+
+
+class TimerWheel:
+    """
+    Hashed Timer Wheel.
+    Timers are stored in `size` slots of `tick` seconds, a single driver
+    advances the wheel tick by tick and fires the due timers, so any 
+    number of pending timers costs one callback per tick (instead of one
+    task or timer each). The driver runs on the app event loop when it
+    is running, on a daemon thread otherwise. It is moved to a thread
+    if its loop stops, and stops when no timer is pending (the thread
+    lingers `linger` seconds first). Timers never fire early, and at 
+    most one tick late while the driver runs.
+    """
+
+    _logger = get_logger('FletX.TimerWheel')
+
+    def __init__(
+        self, 
+        tick: float = 0.01, 
+        size: int = 256, 
+        linger: float = 1.0
+    ):
+        if tick <= 0 or size <= 0:
+            raise ValueError("tick and size must be positive")
+        
+        self._tick = tick
+        self._size = size
+        self._linger = linger
+        self._slots: List[Dict[WheelTimer, None]] = [{} for _ in range(size)]
+        self._cursor = 0
+        self._count = 0
+        self._running = False
+        self._driver = 0
+        self._driver_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_tick_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def pending(self) -> int:
+        """Number of pending timers"""
+        return self._count
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> WheelTimer:
+        """Calls `callback` in (at least) `delay` seconds"""
+
+        with self._lock:
+            now = time.monotonic()
+            if not self._running:
+                self._next_tick_at = now + self._tick
+            
+            # Number of ticks until the first tick at or after the deadline
+            ticks = max(1, math.ceil((now + delay - self._next_tick_at) / self._tick) + 1)
+            slot = (self._cursor + ticks) % self._size
+            timer = WheelTimer(callback, (ticks - 1) // self._size, slot, self)
+            self._slots[slot][timer] = None
+            self._count += 1
+            self._ensure_driver()
+        
+        return timer
+
+    def ensure_driver(self):
+        """
+        Restarts the driver if the event loop it ran on has stopped
+        (e.g. after `loop.run_until_complete()`), so that pending timers
+        still fire.
+        """
+
+        loop = self._driver_loop
+        if loop is not None and not loop.is_running():
+            with self._lock:
+                self._ensure_driver()
+
+    def _cancel(self, timer: WheelTimer):
+        with self._lock:
+            if self._slots[timer.slot].pop(timer, _MISSING) is not _MISSING:
+                self._count -= 1
+
+    def _ensure_driver(self):
+        """Starts a driver unless a live one is running, with the lock held"""
+
+        stalled = self._driver_loop is not None and not self._driver_loop.is_running()
+        if self._running and not stalled:
+            return
+        
+        # A new driver supersedes the stalled one
+        self._running = True
+        self._driver += 1
+        driver = self._driver
+
+        loop = get_running_event_loop()
+        self._driver_loop = loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._schedule_loop_tick, loop, driver)
+        else:
+            threading.Thread(
+                target = self._run_thread, 
+                args = (driver,),
+                name = 'FletX-TimerWheel',
+                daemon = True
+            ).start()
+
+    def _schedule_loop_tick(self, loop: asyncio.AbstractEventLoop, driver: int):
+        loop.call_later(
+            max(0.0, self._next_tick_at - time.monotonic()), 
+            self._loop_tick, loop, driver
+        )
+
+    def _loop_tick(self, loop: asyncio.AbstractEventLoop, driver: int):
+        if self._advance(driver) and not self._stop(driver):
+            self._schedule_loop_tick(loop, driver)
+
+    def _run_thread(self, driver: int):
+        idle_since = time.monotonic()
+        while True:
+            time.sleep(max(0.0, self._next_tick_at - time.monotonic()))
+            if not self._advance(driver):
+                return
+            
+            # Linger to spare a new thread to the next timers
+            if self._count:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= self._linger and self._stop(driver):
+                return
+
+    def _advance(self, driver: int) -> bool:
+        """
+        Processes every elapsed tick.
+        Returns False if the driver was superseded.
+        """
+
+        due: List[WheelTimer] = []
+        with self._lock:
+            if driver != self._driver:
+                return False
+            
+            now = time.monotonic()
+            while self._next_tick_at <= now:
+                self._cursor = (self._cursor + 1) % self._size
+                self._next_tick_at += self._tick
+                
+                slot = self._slots[self._cursor]
+                for timer in list(slot):
+                    if timer.rounds:
+                        timer.rounds -= 1
+                    else:
+                        del slot[timer]
+                        self._count -= 1
+                        due.append(timer)
+        
+        for timer in due:
+            try:
+                timer.callback()
+            except Exception as e:
+                self._logger.error(f"Error in timer callback: {e}", exc_info = True)
+        return True
+
+    def _stop(self, driver: int) -> bool:
+        """
+        Stops the driver if no timer is pending.
+        Returns whether it must stop.
+        """
+
+        with self._lock:
+            if driver != self._driver:
+                return True
+            if self._count:
+                return False
+            
+            self._running = False
+            self._driver_loop = None
+            return True
+
+
+# Shared timer wheel
+timer_wheel = TimerWheel()
+
+
+####
+##      FRAME SCHEDULER
+#####
+class FrameScheduler:
+    """
+    requestAnimationFrame-style Update Scheduler.
+    Collects dirty controls and flushes them at most once per frame
+    (`fps` frames per second), so many reactive changes made in the
+    same tick produce a single Flet update message per page.
+    Frames are timed by a TimerWheel, so updates are flushed on the app
+    event loop when it is running, on its driver thread otherwise.
+    """
+
+    _fps: float = 60.0
+    _enabled: bool = True
+    _dirty: Dict[ft.Control, None] = {}
+    _lock = threading.Lock()
+    _wheel = TimerWheel(tick=0.004, size=64)
+    _timer: Optional[WheelTimer] = None
+    _last_flush: float = 0.0
+    _logger = get_logger('FletX.FrameScheduler')
+
+    @classmethod
+    def configure(
+        cls,
+        fps: Optional[float] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Configures the scheduler.
+
+        Args:
+            fps: Target number of flushes per second
+            enabled: Whether updates are coalesced, when disabled every
+                update request is applied immediately
+        """
+
+        if fps is not None:
+            if fps <= 0:
+                raise ValueError("fps must be a positive number")
+            cls._fps = fps
+
+        if enabled is not None:
+            cls._enabled = enabled
+            if not enabled:
+                cls.flush()
+
+    @classmethod
+    def request_update(cls, control: ft.Control, immediate: bool = False):
+        """
+        Requests a control update.
+        The control is updated with the next frame, unless `immediate`
+        is set or the scheduler is disabled.
+        """
+
+        if immediate or not cls._enabled:
+            with cls._lock:
+                cls._dirty.pop(control, None)
+            control.update()
+            return
+
+        with cls._lock:
+            cls._dirty[control] = None
+            if cls._timer is None:
+                cls._schedule_flush()
+                return
+        
+        # The pending frame must not wait for a stopped loop
+        cls._wheel.ensure_driver()
+
+    @classmethod
+    def _schedule_flush(cls):
+        """Schedules a flush for the next frame, with the lock held"""
+
+        delay = max(0.0, cls._last_flush + 1 / cls._fps - time.monotonic())
+        cls._timer = cls._wheel.schedule(delay, cls.flush)
+
+    @classmethod
+    def flush(cls):
+        """Updates all dirty controls, one page.update() call per page"""
+
+        with cls._lock:
+            controls = list(cls._dirty)
+            cls._dirty.clear()
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+            cls._last_flush = time.monotonic()
+
+        pages: Dict[ft.Page, List[ft.Control]] = {}
+        for control in controls:
+            page = control.page
+
+            # Removed from the page in the meantime
+            if page is None:
+                continue
+            pages.setdefault(page, []).append(control)
+
+        for page, page_controls in pages.items():
+            try:
+                page.update(*page_controls)
+            except Exception as e:
+                cls._logger.error(
+                    f"Error while flushing {len(page_controls)} updates: {e}",
+                    exc_info = True
+                )
+
+
+# REQUEST UPDATE
+def request_update(control: ft.Control, immediate: bool = False):
+    """Requests a control update on the next frame (see FrameScheduler)"""
+
+    FrameScheduler.request_update(control, immediate)
+
+
+####
+##      DEBOUNCED CALL
+#####
+class DebouncedCall:
+    """
+    Debounced / Throttled Call.
+    Calls `callback` with the arguments of the latest `trigger()`:
+    - on the leading edge (first trigger of a burst), if `leading`
+    - on the trailing edge, `wait` seconds after the last trigger,
+      if `trailing` and triggers happened since the last call
+    - at least every `max_wait` seconds during a continuous burst
+    A debounce is `(wait)`, a throttle `(wait, leading=True,
+    max_wait=wait)`. Timers live on a shared TimerWheel and a single
+    one is pending per call. Awaitables returned by the callback are
+    run on the app event loop.
+    """
+
+    _logger = get_logger('FletX.DebouncedCall')
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        wait: float,
+        leading: bool = False,
+        trailing: bool = True,
+        max_wait: Optional[float] = None,
+        wheel: Optional[TimerWheel] = None,
+        on_idle: Optional[Callable[[], None]] = None
+    ):
+        self._callback = callback
+        self._wait = wait
+        self._leading = leading
+        self._trailing = trailing
+        self._max_wait = max_wait
+        self._wheel = wheel or timer_wheel
+        self._on_idle = on_idle
+
+        self._call: Tuple[tuple, dict] = ((), {})
+        self._pending = False
+        self._timer: Optional[WheelTimer] = None
+        self._last_trigger = 0.0
+        self._burst_start = 0.0
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    @property
+    def pending(self) -> bool:
+        """Whether a trailing call is pending"""
+        return self._pending
+
+    @property
+    def active(self) -> bool:
+        """Whether a burst of triggers is in progress"""
+        return self._timer is not None
+
+    def trigger(self, *args, **kwargs):
+        """Records a call, run according to the edges configuration"""
+
+        with self._lock:
+            now = time.monotonic()
+            self._call = (args, kwargs)
+            self._last_trigger = now
+            
+            leading_call = False
+            if self._timer is None:
+                # New burst
+                self._burst_start = now
+                leading_call = self._leading
+                self._pending = not leading_call
+                self._arm(self._wait)
+            else:
+                self._pending = True
+                # The burst timer must not wait for a stopped loop
+                self._wheel.ensure_driver()
+            
+            call = self._call
+        
+        if leading_call:
+            self._invoke(call)
+
+    __call__ = trigger
+
+    def _arm(self, delay: float):
+        """Schedules the burst timer, superseding the previous one"""
+
+        self._generation += 1
+        generation = self._generation
+        self._timer = self._wheel.schedule(delay, lambda: self._on_timer(generation))
+
+    def _on_timer(self, generation: int):
+        """Timer callback, ends the burst or waits for the remaining time"""
+
+        with self._lock:
+            # Cancelled or superseded timer
+            if self._timer is None or generation != self._generation:
+                return
+            
+            now = time.monotonic()
+            idle = now - self._last_trigger
+            waited = now - self._burst_start
+            max_wait_reached = self._max_wait is not None and waited >= self._max_wait
+
+            if idle < self._wait and not max_wait_reached:
+                delay = self._wait - idle
+                if self._max_wait is not None:
+                    delay = min(delay, self._max_wait - waited)
+                self._arm(delay)
+                return
+            
+            invoke = self._trailing and self._pending
+            self._pending = False
+            call = self._call
+            
+            if idle < self._wait:
+                # Max wait reached within a burst, start the next window
+                self._burst_start = now
+                self._arm(self._wait - idle)
+                idle_now = False
+            else:
+                self._timer = None
+                self._call = ((), {})
+                idle_now = True
+        
+        if invoke:
+            self._invoke(call)
+        if idle_now and self._on_idle:
+            self._on_idle()
+
+    def flush(self):
+        """Runs the pending call now, if any, and ends the burst"""
+
+        with self._lock:
+            invoke = self._pending
+            call = self._call
+            was_active = self._reset()
+        
+        if invoke:
+            self._invoke(call)
+        if was_active and self._on_idle:
+            self._on_idle()
+
+    def cancel(self):
+        """Drops the pending call, if any, and ends the burst"""
+
+        with self._lock:
+            was_active = self._reset()
+        
+        if was_active and self._on_idle:
+            self._on_idle()
+
+    def _reset(self) -> bool:
+        """Ends the burst, returns whether one was in progress"""
+
+        self._pending = False
+        self._call = ((), {})
+        if self._timer is None:
+            return False
+        
+        self._timer.cancel()
+        self._timer = None
+        return True
+
+    def _invoke(self, call: Tuple[tuple, dict]):
+        args, kwargs = call
+        try:
+            result = self._callback(*args, **kwargs)
+            if inspect.isawaitable(result):
+                run_awaitable(result)
+        except Exception as e:
+            self._logger.error(f"Error in debounced call: {e}", exc_info = True)
+
+
+# RUN AWAITABLE
+def run_awaitable(awaitable: Awaitable):
+    """
+    Runs an awaitable on the app event loop, or on the loop running in 
+    the current thread, or to completion if there is none.
+    """
+
+    loop = get_running_event_loop()
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+    if loop is not None:
+        asyncio.run_coroutine_threadsafe(_await(awaitable), loop)
+    else:
+        asyncio.run(_await(awaitable))
+
+
+async def _await(awaitable: Awaitable):
+    return await awaitable
+
+
+####
+##      TRAILING CALL
+#####
+class TrailingCall(DebouncedCall):
+    """
+    Trailing-edge Debounced Call.
+    Calls `callback` once no trigger happened for `delay_ms`
+    (see DebouncedCall).
+    """
+
+    def __init__(self, callback: Callable[[], None], delay_ms: float):
+        super().__init__(callback, delay_ms / 1000)
+
+
+####
+##      REBUILD PRIORITY
+#####
+class RebuildPriority(IntEnum):
+    """Priority lanes of deferred rebuilds, most urgent first"""
+
+    USER_VISIBLE = 0
+    NORMAL = 1
+    IDLE = 2
+
+
+####
+##      REBUILD SCHEDULER
+#####
+class RebuildScheduler:
+    """
+    Deferred Rebuild Scheduler.
+    Runs rebuild callbacks on the app event loop instead of inside the
+    reactive write that triggered them. Requests are coalesced per
+    callback (keeping the most urgent lane) and run lane by lane:
+    user-visible rebuilds run right away, normal and idle ones run in
+    slices of at most `budget` seconds, yielding to the event loop
+    (input events, other tasks) between slices.
+    When no event loop is running, rebuilds run synchronously.
+    """
+
+    _lanes: Tuple[Dict[Callable[[], None], None], ...] = tuple(
+        {} for _ in RebuildPriority
+    )
+    _lock = threading.Lock()
+    _scheduled: bool = False
+    _budget: float = 0.008
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _logger = get_logger('FletX.RebuildScheduler')
+
+    @classmethod
+    def configure(
+        cls,
+        budget: Optional[float] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Configures the scheduler.
+
+        Args:
+            budget: Maximum time (in seconds) spent on normal and idle
+                rebuilds before yielding to the event loop
+            loop: Event loop to run rebuilds on, defaults to the app loop
+        """
+
+        if budget is not None:
+            if budget <= 0:
+                raise ValueError("budget must be a positive number")
+            cls._budget = budget
+
+        if loop is not None:
+            cls._loop = loop
+
+    @classmethod
+    def _get_loop(cls) -> Optional[asyncio.AbstractEventLoop]:
+        """Returns the running loop rebuilds are scheduled on, if any"""
+
+        return get_running_event_loop(cls._loop)
+
+    @classmethod
+    def schedule(
+        cls,
+        rebuild: Callable[[], None],
+        priority: RebuildPriority = RebuildPriority.NORMAL
+    ):
+        """Schedules a rebuild, coalescing repeated requests"""
+
+        loop = cls._get_loop()
+        if loop is None:
+            cls._run(rebuild)
+            return
+
+        with cls._lock:
+            for lane_priority, lane in zip(RebuildPriority, cls._lanes):
+                if rebuild in lane:
+                    # Already pending in a lane at least as urgent
+                    if lane_priority <= priority:
+                        return
+                    del lane[rebuild]
+                    break
+            
+            cls._lanes[priority][rebuild] = None
+            if cls._scheduled:
+                return
+            cls._scheduled = True
+        
+        loop.call_soon_threadsafe(cls._run_slice)
+
+    @classmethod
+    def _pop(cls) -> Optional[Callable[[], None]]:
+        """Pops the most urgent pending rebuild"""
+
+        for lane in cls._lanes:
+            if lane:
+                rebuild = next(iter(lane))
+                del lane[rebuild]
+                return rebuild
+        return None
+
+    @classmethod
+    def _run_slice(cls):
+        """Runs pending rebuilds until the lanes are empty or the budget is spent"""
+
+        deadline = time.monotonic() + cls._budget
+
+        while True:
+            with cls._lock:
+                # Leave non urgent work for the next loop iteration
+                if (
+                    not cls._lanes[RebuildPriority.USER_VISIBLE]
+                    and time.monotonic() > deadline
+                    and any(cls._lanes)
+                ):
+                    loop = cls._get_loop()
+                    if loop is not None:
+                        loop.call_soon(cls._run_slice)
+                        return
+                
+                rebuild = cls._pop()
+                if rebuild is None:
+                    cls._scheduled = False
+                    return
+            
+            cls._run(rebuild)
+
+    @classmethod
+    def _run(cls, rebuild: Callable[[], None]):
+        """Runs a rebuild, logging its errors"""
+
+        try:
+            rebuild()
+        except Exception as e:
+            cls._logger.error(f"Error while rebuilding: {e}", exc_info = True)
+
+    @classmethod
+    def flush(cls):
+        """Runs every pending rebuild now, in priority order"""
+
+        while True:
+            with cls._lock:
+                rebuild = cls._pop()
+                if rebuild is None:
+                    cls._scheduled = False
+                    return
+            cls._run(rebuild)
+
+    @classmethod
+    def pending(cls) -> int:
+        """Number of pending rebuilds"""
+
+        with cls._lock:
+            return sum(len(lane) for lane in cls._lanes)
@@ -4,17 +4,29 @@ A state management system that uses a reactive approach to
 manage data and application states, inspired by the GetX library.
 """
 
+import asyncio
 import logging
+import threading
+import weakref
 from typing import (
     Any, Callable, ClassVar, List, Generic, TypeVar, Dict, Optional,
     Set, Union
 )
 from abc import ABC, abstractmethod
-from fletx.utils import get_logger
+from dataclasses import dataclass
+from functools import wraps
+from heapq import heappush, heappop
+from itertools import count
+from fletx.utils import get_logger, get_running_event_loop
 
 T = TypeVar('T')
 K = TypeVar("K")
 V = TypeVar("V")
+F = TypeVar('F', bound = Callable[..., Any])
+
+# Guards observer sets mutations and snapshots. Reentrant since weak 
+# observers may be disposed by the garbage collector at any point.
+_observers_lock = threading.RLock()
 
 
 ####
@@ -56,24 +68,69 @@ class Observer:
     An advanced observer that allows tracking changes in data 
     while managing the observation lifecycle, including creation, 
     update, and disposal of subscriptions.
+
+    A weak observer only holds a weak reference to its callback (to the 
+    instance for bound methods) and disposes itself once the callback 
+    owner is garbage collected, pruning it from the observed reactives.
     """
+
+    __slots__ = (
+        '_callback', '_weak', 'active', 'auto_dispose', 
+        'node', '_dependencies', '__weakref__'
+    )
+
+    _logger: ClassVar[logging.Logger] = get_logger("FletX.Observer")
     
     def __init__(
         self, 
         callback: Callable[[], None], 
-        auto_dispose: bool = True
+        auto_dispose: bool = True,
+        weak: bool = False
     ):
+        self._weak = False
         self.callback = callback
         self.active = True
         self.auto_dispose = auto_dispose
+        self.node: Optional['Computed'] = None
         self._dependencies = set()
-        self._logger = get_logger("FletX.Observer")
 
+        if weak and callback is not None:
+            self._make_weak(callback)
+
+    @classmethod
+    @property
+    def logger(cls):
+        if not cls._logger:
+            cls._logger = get_logger('FletX.Observer')
+        return cls._logger
+    
     @property
-    def logger(self):
-        if not self._logger:
-            self._logger = get_logger('FletX.Observer')
-        return self._logger
+    def callback(self) -> Optional[Callable]:
+        """The observer callback (None once disposed or collected)"""
+
+        if self._weak:
+            return self._callback()
+        return self._callback
+    
+    @callback.setter
+    def callback(self, callback: Optional[Callable]):
+        self._weak = False
+        self._callback = callback
+
+    def _make_weak(self, callback: Callable):
+        """Holds the callback through a weak reference"""
+
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            self._callback = weakref.WeakMethod(callback, self._on_collected)
+        else:
+            self._callback = weakref.ref(callback, self._on_collected)
+        self._weak = True
+
+    def _on_collected(self, ref):
+        """Disposes the observer once its callback owner is collected"""
+
+        if self.active:
+            self.dispose()
     
     def add_dependency(self, dependency):
         """
@@ -91,9 +148,10 @@ class Observer:
         triggering an update or appropriate action.
         """
 
-        if self.active and self.callback:
+        callback = self.callback
+        if self.active and callback:
             try:
-                self.callback()
+                callback()
             except Exception as e:
                 self.logger.error(f"Observer error: {e}", exc_info=True)
     
@@ -112,6 +170,361 @@ class Observer:
         self._dependencies.clear()
 
 
+####
+##      CHANGE WAVE STATE
+#####
+class _WaveState(threading.local):
+    """Change wave state, one per thread"""
+
+    def __init__(self):
+        self.depth: int = 0
+        self.dirty: List[tuple] = []
+        self.dirty_nodes: Set['Computed'] = set()
+        self.effects: Dict[Callable, 'Observer'] = {}
+        self.holds: List[bool] = []
+
+
+####
+##      REACTIVE PROPAGATION SCHEDULER
+#####
+class ReactiveScheduler:
+    """
+    Glitch-free Change Propagation Scheduler.
+    Every reactive write starts (or joins) a change wave. Within a wave, 
+    dirty computed values are recomputed in rank order (a computed value 
+    ranks above all of its dependencies), so each one is recomputed at most 
+    once and only after all of its dependencies are settled. Plain observers 
+    are notified once the computed graph is consistent.
+
+    Waves (and batches) are per thread: a write is notified on the thread
+    that made it. With thread dispatch enabled, writes made outside of the
+    UI event loop thread are queued, coalesced and notified in a single 
+    wave on the loop instead.
+    """
+
+    _wave = _WaveState()
+    _sequence = count()
+
+    # Thread dispatch
+    _thread_dispatch: bool = False
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock = threading.RLock()
+    _remote_lock = threading.Lock()
+    _remote: Dict['Reactive', None] = {}
+    _remote_scheduled: bool = False
+
+    @classmethod
+    def set_thread_dispatch(
+        cls, 
+        enabled: bool = True,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Enables or disables thread-aware dispatch.
+        When enabled, notifications for writes made outside of the loop 
+        thread (the app loop from `get_event_loop()` unless `loop` is given)
+        are marshalled onto the loop, and waves started from other threads 
+        while the loop is not running are serialized.
+        """
+
+        cls._thread_dispatch = enabled
+        cls._loop = loop
+
+    @classmethod
+    def _target_loop(cls) -> Optional[asyncio.AbstractEventLoop]:
+        """Gets the running loop notifications should be marshalled onto"""
+
+        return get_running_event_loop(cls._loop)
+    
+    @classmethod
+    def _is_remote(cls) -> bool:
+        """Checks if the current thread must marshal its notifications"""
+
+        loop = cls._target_loop()
+        if loop is None:
+            return False
+        try:
+            return asyncio.get_running_loop() is not loop
+        except RuntimeError:
+            return True
+
+    @classmethod
+    def is_holding(cls) -> bool:
+        """Checks if a wave or a batch is currently open"""
+
+        return cls._wave.depth > 0
+    
+    @classmethod
+    def hold(cls):
+        """Opens a scope in which notifications are only collected"""
+
+        if not cls._thread_dispatch:
+            cls._wave.depth += 1
+            return
+        
+        # Remote threads do not need to hold anything, their 
+        # notifications are coalesced on the loop anyway.
+        remote = cls._is_remote()
+        cls._wave.holds.append(remote)
+        if not remote:
+            cls._lock.acquire()
+            cls._wave.depth += 1
+    
+    @classmethod
+    def release(cls):
+        """Closes a scope and runs the wave when the outermost one exits"""
+
+        holds = cls._wave.holds
+        if not holds:
+            cls._wave.depth -= 1
+            if cls._wave.depth == 0:
+                cls.run()
+            return
+        
+        if holds.pop():
+            return
+        try:
+            cls._wave.depth -= 1
+            if cls._wave.depth == 0:
+                cls.run()
+        finally:
+            cls._lock.release()
+
+    @classmethod
+    def dispatch(cls, reactive: 'Reactive'):
+        """
+        Dispatches a reactive change.
+        Runs (or joins) a wave on the current thread, or queues the 
+        reactive to be notified on the loop when called from another thread.
+        """
+
+        if not cls._thread_dispatch:
+            reactive._schedule_observers()
+            if cls._wave.depth == 0:
+                cls.run()
+            return
+        
+        if cls._is_remote():
+            # Never waits for a wave running on the loop
+            with cls._remote_lock:
+                cls._remote[reactive] = None
+                if cls._remote_scheduled:
+                    return
+                cls._remote_scheduled = True
+            cls._target_loop().call_soon_threadsafe(cls._drain_remote)
+            return
+        
+        with cls._lock:
+            reactive._schedule_observers()
+            if cls._wave.depth == 0:
+                cls.run()
+    
+    @classmethod
+    def _drain_remote(cls):
+        """Notifies, in a single wave, reactives written from other threads"""
+
+        with cls._remote_lock:
+            reactives = list(cls._remote)
+            cls._remote.clear()
+            cls._remote_scheduled = False
+
+        with cls._lock:
+            cls._wave.depth += 1
+            try:
+                for reactive in reactives:
+                    reactive._schedule_observers()
+            finally:
+                cls._wave.depth -= 1
+            
+            if cls._wave.depth == 0:
+                cls.run()
+    
+    @classmethod
+    def schedule(cls, observer: 'Observer'):
+        """
+        Schedules an observer notification.
+        Computed values are marked dirty and queued by rank, other 
+        observers are deduplicated by callback, so a callback subscribed 
+        to several reactives (like an Obx rebuild) runs only once.
+        """
+
+        wave = cls._wave
+        node = observer.node
+        if node is not None:
+            if node not in wave.dirty_nodes:
+                wave.dirty_nodes.add(node)
+                heappush(wave.dirty, (node._rank, next(cls._sequence), node))
+        else:
+            wave.effects.setdefault(observer.callback, observer)
+
+    @classmethod
+    def run(cls):
+        """
+        Runs the pending change wave.
+        Recomputes dirty computed values by ascending rank, then notifies
+        plain observers in scheduling order. Writes made while the wave 
+        runs are collected in the same wave.
+        """
+
+        wave = cls._wave
+        wave.depth += 1
+        try:
+            while wave.dirty or wave.effects:
+                if wave.dirty:
+                    node = heappop(wave.dirty)[2]
+
+                    # Already recomputed by a read
+                    if node not in wave.dirty_nodes:
+                        continue
+                    wave.dirty_nodes.discard(node)
+                    if node._subscriptions:
+                        node._update_value()
+                    continue
+
+                callback = next(iter(wave.effects))
+                observer = wave.effects.pop(callback)
+                if observer.active:
+                    observer.notify()
+        finally:
+            wave.depth -= 1
+
+
+####
+##      REACTIVE BATCH
+#####
+class ReactiveBatch:
+    """
+    Transactional batch of reactive writes.
+    Defers observer notifications until the outermost batch exits, 
+    then runs every affected observer exactly once, whatever the 
+    number of reactives written inside the batch.
+
+    Usage:
+    ```python
+    with Reactive.batch():
+        ctrl.first_name.value = "Jane"
+        ctrl.last_name.value = "Doe"
+        ctrl.age.value = 32
+    # Observers depending on the three fields are notified once here.
+    ```
+    """
+
+    @staticmethod
+    def is_active() -> bool:
+        """Checks if a batch is currently open"""
+
+        return ReactiveScheduler.is_holding()
+
+    def __enter__(self):
+        ReactiveScheduler.hold()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Values written before an error are kept, so observers still 
+        # need to see them.
+        ReactiveScheduler.release()
+
+
+def batched(func: F) -> F:
+    """
+    Runs a function inside a reactive batch.
+    All reactive writes made by the decorated function are 
+    notified once, when the function returns.
+
+    Usage:
+    ```python
+    @batched
+    def load_profile(self, data: dict):
+        self.name.value = data['name']
+        self.email.value = data['email']
+    ```
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with ReactiveBatch():
+            return func(*args, **kwargs)
+    
+    return wrapper
+
+
+####
+##      EQUALITY STRATEGIES
+#####
+EqualityFn = Callable[[Any, Any], bool]
+
+
+def identity_equals(old: Any, new: Any) -> bool:
+    """Values are equal only if they are the same object"""
+
+    return old is new
+
+
+def shallow_equals(old: Any, new: Any) -> bool:
+    """
+    Containers are equal if they hold the same objects.
+    Lists, tuples and dicts are compared item by item by identity,
+    other values fall back to `==`.
+    """
+
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(
+            a is b for a, b in zip(old, new)
+        )
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            old[key] is new[key] for key in old
+        )
+    return old == new
+
+
+def deep_equals(old: Any, new: Any) -> bool:
+    """Values are compared with `==` (the default strategy)"""
+
+    return not (old != new)
+
+
+def version_equals(old: Any, new: Any) -> bool:
+    """
+    Every assignment is a change.
+    Comparison is O(1) whatever the value size, and containers mutated
+    in place then reassigned are detected. Consumers compare 
+    `Reactive.version` instead of values.
+    """
+
+    return False
+
+
+EQUALITY_STRATEGIES: Dict[str, EqualityFn] = {
+    'identity': identity_equals,
+    'shallow': shallow_equals,
+    'deep': deep_equals,
+    'version': version_equals,
+}
+
+
+def resolve_equality(equals: Union[str, EqualityFn, None]) -> EqualityFn:
+    """Resolves an equality strategy name or callable"""
+
+    if equals is None:
+        return deep_equals
+    if callable(equals):
+        return equals
+    
+    try:
+        return EQUALITY_STRATEGIES[equals]
+    except KeyError:
+        raise ValueError(
+            f"Unknown equality strategy '{equals}', expected one of "
+            f"{list(EQUALITY_STRATEGIES)} or a callable"
+        ) from None
+
+
 ####
 ##      REACTIVE CLASS
 #####
@@ -123,11 +536,29 @@ class Reactive(Generic[T]):
     dependencies between data and components.
     """
     
+    __slots__ = ('_value', '_observers', '_equals', '_version', '__weakref__')
+    
     _logger: ClassVar[logging.Logger] = get_logger("FletX.Reactive")
+    _rank: int = 0
+
+    def __init__(
+        self, 
+        initial_value: T, 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        """
+        Args:
+            initial_value: Initial value
+            equals: Equality strategy used by the setter to detect changes,
+                one of 'identity', 'shallow', 'deep' (default), 'version'
+                or a callable `(old, new) -> bool`
+        """
 
-    def __init__(self, initial_value: T):
         self._value = initial_value
-        self._observers: Set[Observer] = set()
+        # Allocated on first subscription, most reactives are never observed
+        self._observers: Optional[Set[Observer]] = None
+        self._equals = resolve_equality(equals)
+        self._version = 0
 
     @classmethod
     @property
@@ -136,6 +567,26 @@ class Reactive(Generic[T]):
             cls._logger = get_logger('FletX.Reactive')
         return cls._logger
     
+    @staticmethod
+    def batch() -> ReactiveBatch:
+        """
+        Opens a reactive batch.
+        Observer notifications are deferred until the outermost 
+        batch exits (see `ReactiveBatch`).
+        """
+
+        return ReactiveBatch()
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic change counter.
+        Incremented on every notified change, in place mutations included,
+        so consumers can detect changes in O(1).
+        """
+
+        return self._version
+    
     @property
     def value(self) -> T:
         """
@@ -156,16 +607,20 @@ class Reactive(Generic[T]):
         triggering automatic updates.
         """
 
-        if self._value != new_value:
+        if not self._equals(self._value, new_value):
             old_value = self._value
             self._value = new_value
             self._notify_observers()
-            self.logger.debug(f"Value changed: {old_value} → {new_value}")
+
+            # Formatting large values is costly, only do it when needed
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Value changed: {old_value} → {new_value}")
     
     def listen(
         self, 
         callback: Callable[[], None], 
-        auto_dispose: bool = True
+        auto_dispose: bool = True,
+        weak: bool = False
     ) -> Observer:
         
         """
@@ -173,38 +628,60 @@ class Reactive(Generic[T]):
         Listens to changes on a property or object while 
         managing the listening lifecycle, including subscription,
         unsubscription, and error handling.
+        With `weak`, the subscription does not keep the callback (or its 
+        instance for bound methods) alive and is pruned once it is collected.
         """
 
-        observer = Observer(callback, auto_dispose)
+        observer = Observer(callback, auto_dispose, weak)
         observer.add_dependency(self)
-        self._observers.add(observer)
+        with _observers_lock:
+            if self._observers is None:
+                self._observers = set()
+            self._observers.add(observer)
         return observer
+
+    def _snapshot_observers(self) -> tuple:
+        """Returns a stable copy of the observer set"""
+
+        with _observers_lock:
+            return tuple(self._observers) if self._observers else ()
     
     def _notify_observers(self):
         """
         Notifies all active observers.
         Sends a notification to all observers that are currently 
         subscribed and listening, allowing them to react to changes or updates.
+        Notifications go through the propagation scheduler and are 
+        deferred while a batch is open.
         """
 
-        for observer in list(self._observers):
+        self._version += 1
+        ReactiveScheduler.dispatch(self)
+
+    def _schedule_observers(self):
+        """Schedules active observers and prunes inactive ones"""
+
+        for observer in self._snapshot_observers():
             if observer.active:
-                observer.notify()
+                ReactiveScheduler.schedule(observer)
             else:
-                self._observers.remove(observer)
+                self._remove_observer(observer)
     
     def _remove_observer(self, observer: Observer):
         """Removes an observer"""
 
-        if observer in self._observers:
-            self._observers.remove(observer)
+        with _observers_lock:
+            if self._observers:
+                self._observers.discard(observer)
     
     def dispose(self):
         """Cleans up all dependencies"""
 
-        for observer in list(self._observers):
+        for observer in self._snapshot_observers():
             observer.dispose()
-        self._observers.clear()
+        with _observers_lock:
+            if self._observers:
+                self._observers.clear()
     
     def __str__(self):
         return str(self._value)
@@ -223,56 +700,233 @@ class Computed(Reactive[T]):
     other values or properties, and that updates reactively 
     when any of these dependencies change.
     """
+
+    __slots__ = (
+        '_compute_fn', '_auto_track', '_subscriptions', 
+        '_rank', '_lazy', '_dirty'
+    )
     
     def __init__(
         self, 
         compute_fn: Callable[[], T], 
-        dependencies: List[Reactive] = None
+        dependencies: List[Reactive] = None,
+        lazy: bool = False,
+        equals: Union[str, EqualityFn, None] = None
     ):
         """
         Args:
             compute_fn: Calculation function
             dependencies: List of dependencies (automatically detected if None)
+            lazy: Only recompute on read, unless the value is observed
+            equals: Equality strategy used to detect value changes
         """
+
+        self._compute_fn = compute_fn
+        self._auto_track = dependencies is None
+        self._subscriptions: Dict[Reactive, Observer] = {}
+        self._rank = 1
+        self._lazy = lazy
+        self._dirty = lazy
+
+        # Lazy values are computed on first read
+        if lazy:
+            super().__init__(None, equals)
+            if not self._auto_track:
+                self._set_dependencies(dependencies)
+            return
+
         # Auto detect dependencies
-        if dependencies is None:
-            _, dependencies = ReactiveDependencyTracker.track(compute_fn)
+        if self._auto_track:
+            value, dependencies = ReactiveDependencyTracker.track(compute_fn)
+        else:
+            value = compute_fn()
         
-        super().__init__(compute_fn())
-        self._compute_fn = compute_fn
-        self._dependencies = dependencies or []
+        super().__init__(value, equals)
+        self._set_dependencies(dependencies)
+
+    @property
+    def value(self) -> T:
+        """
+        Pull-based Getter.
+        Recomputes the value first if it was invalidated while nobody 
+        was observing it, or if its recomputation (or the one of a value
+        it depends on) is still queued in the current change wave (a 
+        write deferred by a batch or by a running observer).
+        """
+
+        self._settle()
+        return Reactive.value.fget(self)
+    
+    @value.setter
+    def value(self, new_value: T):
+        Reactive.value.fset(self, new_value)
+
+    @property
+    def version(self) -> int:
+        """Change counter, of the value recomputed first if needed"""
+
+        self._settle()
+        return self._version
+
+    def _settle(self):
+        """Runs the pending recomputations of the value, if any"""
+
+        dirty_nodes = ReactiveScheduler._wave.dirty_nodes
+        if dirty_nodes:
+            # Settle queued ancestors first, they queue their dependents
+            for node in self._ancestors():
+                if node in dirty_nodes:
+                    dirty_nodes.discard(node)
+                    if node._subscriptions:
+                        node._update_value()
+
+        if self._dirty:
+            self._refresh()
+        elif self in dirty_nodes:
+            dirty_nodes.discard(self)
+            self._update_value()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the value is waiting to be recomputed on next read"""
+
+        return self._dirty or self in ReactiveScheduler._wave.dirty_nodes
+
+    def _ancestors(self) -> List['Computed']:
+        """Returns the computed values this one depends on, by ascending rank"""
+
+        ancestors: List[Computed] = []
+        seen = {self}
+        stack = [self]
+        while stack:
+            for dep in stack.pop()._subscriptions:
+                if dep not in seen and isinstance(dep, Computed):
+                    seen.add(dep)
+                    stack.append(dep)
+                    ancestors.append(dep)
         
-        # Subscribing to dependencies
-        for dep in self._dependencies:
-            self.logger.debug(
-                f"Subscribing to dependency: {dep.__class__.__name__}"
-            )
-            dep.listen(self._update_value)
+        ancestors.sort(key = lambda node: node._rank)
+        return ancestors
+
+    def _set_dependencies(self, dependencies):
+        """
+        Syncs dependency subscriptions.
+        Unsubscribes from dropped dependencies, subscribes to new ones
+        and updates the node rank accordingly.
+        """
+
+        dependencies = set(dependencies or ())
+
+        # Unsubscribe from old dependencies
+        for dep in list(self._subscriptions):
+            if dep not in dependencies:
+                self._subscriptions.pop(dep).dispose()
+        
+        # Subscribe to newer dependencies
+        for dep in dependencies:
+            if dep not in self._subscriptions:
+                self.logger.debug(
+                    f"Subscribing to dependency: {dep.__class__.__name__}"
+                )
+                observer = dep.listen(self._update_value)
+                observer.node = self
+                self._subscriptions[dep] = observer
+
+        self._update_rank()
+
+    def _update_rank(self):
+        """
+        Updates the node rank.
+        A computed value ranks above all of its dependencies, dependents
+        whose rank becomes stale are updated as well.
+        """
+
+        rank = max((dep._rank for dep in self._subscriptions), default = 0) + 1
+        if rank == self._rank:
+            return
+        
+        self._rank = rank
+        for observer in self._snapshot_observers():
+            if observer.node is not None and observer.node._rank <= rank:
+                observer.node._update_rank()
     
-    def _update_value(self):
+    def _evaluate(self) -> T:
         """
-        Updates the computed value
-        Recalculates and updates the value based on the current dependencies.
+        Runs the compute function.
+        Tracks dependencies on the way when they are auto detected.
         """
 
+        if not self._auto_track:
+            return self._compute_fn()
+        
         new_value, new_deps = ReactiveDependencyTracker.track(self._compute_fn)
         
         # Update dependencies if necessary
-        if new_deps != set(self._dependencies):
-            # Unsubscribe from old dependencies
-            for dep in self._dependencies:
-                dep._remove_observer(self._observer)
-            
-            # Subscribe to newer dependencies
-            self._dependencies = list(new_deps)
-            for dep in self._dependencies:
-                dep.listen(self._update_value)
+        if new_deps != self._subscriptions.keys():
+            self._set_dependencies(new_deps)
+        return new_value
+    
+    def _refresh(self):
+        """
+        Recomputes an invalidated lazy value.
+        Nobody was observing the value, so it is updated in place 
+        without notifying.
+        """
+
+        try:
+            new_value = self._evaluate()
+            self._dirty = False
+            if not self._equals(self._value, new_value):
+                self._value = new_value
+                self._version += 1
+        except Exception as e:
+            self.logger.error(f"Computed error: {e}", exc_info=True)
+
+    def _has_eager_observers(self) -> bool:
+        """Checks if anything other than a lazy computed observes the value"""
+
+        return any(
+            observer.active and (observer.node is None or not observer.node._lazy)
+            for observer in self._snapshot_observers()
+        )
+    
+    def _update_value(self):
+        """
+        Updates the computed value
+        Recalculates and updates the value based on the current dependencies.
+        Lazy values that are not observed are only invalidated.
+        """
+
+        if self._lazy and not self._has_eager_observers():
+            self._dirty = True
+
+            # Let lazy dependents decide whether they are observed
+            for observer in self._snapshot_observers():
+                if observer.active:
+                    ReactiveScheduler.schedule(observer)
+            return
+
+        try:
+            new_value = self._evaluate()
+        except Exception as e:
+            self.logger.error(f"Computed error: {e}", exc_info=True)
+            return
         
+        self._dirty = False
         self.value = new_value
         self.logger.debug(
-            f"Computed value updated: {self._value} from dependencies {self._dependencies}"
+            f"Computed value updated: {self._value} from dependencies "
+            f"{list(self._subscriptions)}"
         )
 
+    def dispose(self):
+        """Cleans up all dependencies and subscriptions"""
+
+        for observer in self._subscriptions.values():
+            observer.dispose()
+        self._subscriptions.clear()
+        super().dispose()
+
 
 ####
 ##      REACTIVE INTEGER CLASS
@@ -282,9 +936,15 @@ class RxInt(Reactive[int]):
     An integer that can be observed and updated reactively, 
     triggering automatic updates when it changes.
     """
+
+    __slots__ = ()
     
-    def __init__(self, initial_value: int = 0):
-        super().__init__(initial_value)
+    def __init__(
+        self, 
+        initial_value: int = 0, 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        super().__init__(initial_value, equals)
     
     def increment(self, step: int = 1):
         """Increment the object's value"""
@@ -303,9 +963,15 @@ class RxStr(Reactive[str]):
     A string that can be observed and updated reactively, 
     triggering automatic updates when it changes.
     """
+
+    __slots__ = ()
     
-    def __init__(self, initial_value: str = ""):
-        super().__init__(initial_value)
+    def __init__(
+        self, 
+        initial_value: str = "", 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        super().__init__(initial_value, equals)
     
     def append(self, text: str):
         """Append text to value"""
@@ -324,15 +990,67 @@ class RxBool(Reactive[bool]):
     A boolean value that can be observed and updated reactively, 
     triggering automatic updates when it changes.
     """
+
+    __slots__ = ()
     
-    def __init__(self, initial_value: bool = False):
-        super().__init__(initial_value)
+    def __init__(
+        self, 
+        initial_value: bool = False, 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        super().__init__(initial_value, equals)
     
     def toggle(self):
         """Inverts the value"""
         self.value = not self.value
 
 
+####
+##      LIST CHANGE RECORDS
+#####
+class ListChange:
+    """Base class for structured RxList change records"""
+
+    __slots__ = ()
+
+
+@dataclass(frozen = True)
+class Insert(ListChange):
+    """`items` were inserted starting at `index`"""
+
+    index: int
+    items: List[Any]
+
+
+@dataclass(frozen = True)
+class Remove(ListChange):
+    """`count` items were removed starting at `index`"""
+
+    index: int
+    count: int = 1
+
+
+@dataclass(frozen = True)
+class Replace(ListChange):
+    """The item at `index` was replaced by `item`"""
+
+    index: int
+    item: Any
+
+
+@dataclass(frozen = True)
+class Move(ListChange):
+    """The item at `from_index` was moved to `to_index`"""
+
+    from_index: int
+    to_index: int
+
+
+@dataclass(frozen = True)
+class Reset(ListChange):
+    """The whole list changed (cleared, reassigned or sliced)"""
+
+
 ####
 ##      REACTIVE LIST CLASS
 #####
@@ -341,38 +1059,172 @@ class RxList(Reactive[List[T]]):
     A list that can be observed and updated reactively, 
     triggering automatic updates when it changes, whether by adding, 
     removing, or modifying elements.
+
+    Besides the coarse notification sent to `listen` observers, 
+    observers registered with `listen_changes` receive the structured 
+    change records (`Insert`, `Remove`, `Replace`, `Move`, `Reset`) 
+    describing each mutation, in order.
     """
+
+    __slots__ = ('_changes', '_change_observers', '_change_dispatcher')
     
-    def __init__(self, initial_value: List[T] = None):
-        super().__init__(initial_value or [])
+    def __init__(
+        self, 
+        initial_value: List[T] = None, 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        super().__init__(initial_value or [], equals)
+        self._changes: List[ListChange] = []
+        self._change_observers: List[Observer] = []
+        self._change_dispatcher: Optional[Observer] = None
+
+    @property
+    def value(self) -> List[T]:
+        return Reactive.value.fget(self)
+    
+    @value.setter
+    def value(self, new_value: List[T]):
+        """Replaces the whole list, recorded as a `Reset`"""
+
+        if not self._equals(self._value, new_value):
+            self._value = new_value
+            self._record(Reset())
+            self._notify_observers()
+
+    def listen_changes(
+        self,
+        callback: Callable[[List[ListChange]], None],
+        auto_dispose: bool = True
+    ) -> Observer:
+        """
+        Listens to structured changes.
+        The callback receives the list of change records accumulated 
+        since the last notification (a single record outside of batches).
+        """
+
+        observer = Observer(callback, auto_dispose)
+        observer.add_dependency(self)
+
+        with _observers_lock:
+            self._change_observers.append(observer)
+            if self._change_dispatcher is None:
+                self._change_dispatcher = Observer(self._dispatch_changes)
+        return observer
+    
+    def _record(self, change: ListChange):
+        """Records a change for the change observers, if any"""
+
+        if self._change_observers:
+            with _observers_lock:
+                self._changes.append(change)
+
+    def _schedule_observers(self):
+        """Schedules the change dispatch along with the observers"""
+
+        if self._changes:
+            ReactiveScheduler.schedule(self._change_dispatcher)
+        super()._schedule_observers()
+
+    def _dispatch_changes(self):
+        """Sends pending change records to the change observers"""
+
+        with _observers_lock:
+            changes, self._changes = self._changes, []
+            observers = tuple(self._change_observers)
+        if not changes:
+            return
+        
+        for observer in observers:
+            if not observer.active:
+                self._remove_observer(observer)
+                continue
+            try:
+                observer.callback(changes)
+            except Exception as e:
+                self.logger.error(f"Change observer error: {e}", exc_info=True)
+
+    def _remove_observer(self, observer: Observer):
+        """Removes an observer"""
+
+        super()._remove_observer(observer)
+        with _observers_lock:
+            if observer in self._change_observers:
+                self._change_observers.remove(observer)
+
+    def dispose(self):
+        """Cleans up all dependencies, change observers included"""
+
+        with _observers_lock:
+            observers = tuple(self._change_observers)
+        for observer in observers:
+            observer.dispose()
+        with _observers_lock:
+            self._change_observers.clear()
+            self._changes.clear()
+        super().dispose()
+
+    def _normalize_index(self, index: int, size: int) -> int:
+        """Resolves a negative index the way list methods do"""
+
+        if index < 0:
+            index = max(size + index, 0)
+        return min(index, size)
     
     def append(self, item: T):
         """Append item to value"""
         self._value.append(item)
+        self._record(Insert(len(self._value) - 1, [item]))
+        self._notify_observers()
+
+    def insert(self, index: int, item: T):
+        """Insert item before index, equivalent to list.insert()"""
+
+        index = self._normalize_index(index, len(self._value))
+        self._value.insert(index, item)
+        self._record(Insert(index, [item]))
         self._notify_observers()
     
     def remove(self, item: T):
         """Remove item from value"""
         if item in self._value:
-            self._value.remove(item)
+            index = self._value.index(item)
+            del self._value[index]
+            self._record(Remove(index, 1))
             self._notify_observers()
     
     def clear(self):
         """clear value"""
         self._value.clear()
+        self._record(Reset())
         self._notify_observers()
 
     def pop(self,idx: int = -1):
         """pop an element equivalent to list.pop()"""
 
+        size = len(self._value)
         item = self._value.pop(idx)
+        self._record(Remove(idx + size if idx < 0 else idx, 1))
         self._notify_observers()
         return item
     
     def extend(self, other: list):
         """Extends current RxList with the given pthon list."""
 
+        index = len(self._value)
         self._value.extend(other)
+        if len(self._value) > index:
+            self._record(Insert(index, self._value[index:]))
+        self._notify_observers()
+
+    def move(self, from_index: int, to_index: int):
+        """Moves the item at from_index so that it ends up at to_index"""
+
+        size = len(self._value)
+        from_index = from_index + size if from_index < 0 else from_index
+        to_index = to_index + size if to_index < 0 else to_index
+        item = self._value.pop(from_index)
+        self._value.insert(to_index, item)
+        self._record(Move(from_index, to_index))
         self._notify_observers()
     
     def __len__(self):
@@ -383,6 +1235,20 @@ class RxList(Reactive[List[T]]):
     
     def __setitem__(self, index, value):
         self._value[index] = value
+        if isinstance(index, slice):
+            self._record(Reset())
+        else:
+            size = len(self._value)
+            self._record(Replace(index + size if index < 0 else index, value))
+        self._notify_observers()
+
+    def __delitem__(self, index):
+        size = len(self._value)
+        del self._value[index]
+        if isinstance(index, slice):
+            self._record(Reset())
+        else:
+            self._record(Remove(index + size if index < 0 else index, 1))
         self._notify_observers()
 
 
@@ -394,22 +1260,102 @@ class RxDict(Generic[T],Reactive[Dict[str, T]]):
     A dictionary that can be observed and updated reactively, 
     triggering automatic updates when it changes, whether by adding, 
     removing, or modifying keys or values.
+
+    Reading a key inside a tracked computation (`rx[key]`, `rx.get(key)`,
+    `key in rx`) only depends on that key, so the computation is not 
+    re-run when other keys change.
     """
+
+    __slots__ = ('_key_cells',)
+    
+    def __init__(
+        self, 
+        initial_value: Dict[str, T] = None, 
+        equals: Union[str, EqualityFn, None] = None
+    ):
+        super().__init__(initial_value or {}, equals)
+        self._key_cells: Dict[str, Reactive] = {}
+
+    @property
+    def value(self) -> Dict[str, T]:
+        return Reactive.value.fget(self)
+    
+    @value.setter
+    def value(self, new_value: Dict[str, T]):
+        """Replaces the whole dictionary, touching every watched key"""
+
+        ReactiveScheduler.hold()
+        try:
+            old_value = self._value
+            Reactive.value.fset(self, new_value)
+            if self._value is not old_value:
+                self._touch(list(self._key_cells))
+        finally:
+            ReactiveScheduler.release()
+    
+    def _key_cell(self, key: str) -> Reactive:
+        """Gets (or creates) the reactive cell tracking a single key"""
+
+        cell = self._key_cells.get(key)
+        if cell is None:
+            cell = Reactive(None)
+            self._key_cells[key] = cell
+        return cell
+    
+    def _track_key(self, key: str):
+        """Registers a dependency on a single key"""
+
+        if ReactiveDependencyTracker._current_tracker is not None:
+            ReactiveDependencyTracker._current_tracker.add(self._key_cell(key))
+    
+    def _touch(self, keys):
+        """Notifies the observers of the given keys"""
+
+        for key in keys:
+            cell = self._key_cells.get(key)
+            if cell is not None:
+                cell._notify_observers()
+
+    def _commit(self, keys):
+        """Notifies key observers and dict observers in a single wave"""
+
+        ReactiveScheduler.hold()
+        try:
+            self._touch(keys)
+            self._notify_observers()
+        finally:
+            ReactiveScheduler.release()
     
-    def __init__(self, initial_value: Dict[str, T] = None):
-        super().__init__(initial_value or {})
+    def listen_key(
+        self, 
+        key: str, 
+        callback: Callable[[], None], 
+        auto_dispose: bool = True
+    ) -> Observer:
+        """
+        Listens to changes of a single key.
+        The callback is called when the key is set, deleted or cleared,
+        but not when other keys change.
+        """
+
+        return self._key_cell(key).listen(callback, auto_dispose)
     
     def __getitem__(self, key: str):
+        self._track_key(key)
         return self._value[key]
     
     def __setitem__(self, key: str, value: T):
         self._value[key] = value
-        self._notify_observers()
+        self._commit((key,))
     
     def __delitem__(self, key: str):
         if key in self._value:
             del self._value[key]
-            self._notify_observers()
+            self._commit((key,))
+
+    def __contains__(self, key: str) -> bool:
+        self._track_key(key)
+        return key in self._value
     
     def get(self, key: str, default: T = None):
         """
@@ -418,6 +1364,7 @@ class RxDict(Generic[T],Reactive[Dict[str, T]]):
         returning a default value if the key or property does not exist.
         """
 
+        self._track_key(key)
         return self._value.get(key, default)
     
     def update(self, other: Dict[str, T]):
@@ -429,7 +1376,7 @@ class RxDict(Generic[T],Reactive[Dict[str, T]]):
         """
 
         self._value.update(other)
-        self._notify_observers()
+        self._commit(other.keys())
     
     def clear(self):
         """
@@ -437,4 +1384,13 @@ class RxDict(Generic[T],Reactive[Dict[str, T]]):
         Removes all keys and values from the dictionary, leaving it empty.
         """
         self._value.clear()
-        self._notify_observers()
\ No newline at end of file
+        self._commit(list(self._key_cells))
+
+    def dispose(self):
+        """Cleans up all dependencies, key observers included"""
+
+        for cell in self._key_cells.values():
+            cell.dispose()
+        self._key_cells.clear()
+        super().dispose()
+
@@ -42,6 +42,7 @@ class BindingConfig:
     condition: Optional[Callable[[], bool]] = None
     debounce_ms: Optional[int] = None
     throttle_ms: Optional[int] = None
+    write_interval_ms: Optional[int] = None  # Coalesces widget -> reactive writes
 
 
 ####
@@ -62,7 +63,13 @@ class ComputedBindingConfig:
 #####
 @dataclass
 class FormFieldValidationRule:
-    """Form Field Validation rule"""
+    """
+    Form Field Validation rule.
+    `validate_fn` may return an awaitable (async validator). Rules with
+    `depends_on` are called with the field value and a dict of the values
+    of these fields, and are rerun whenever one of them changes.
+    """
 
-    validate_fn: Union[str, Callable[[Union[str,int,float,bool]],bool]] 
-    err_message: str
+    validate_fn: Union[str, Callable[..., Any]] 
+    err_message: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
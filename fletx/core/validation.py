@@ -0,0 +1,396 @@
+"""
+Form Validation Engine.
+
+Validates form fields incrementally: results are cached by field value
+(and the values of the fields its rules depend on), async validators
+run on the event loop and are cancelled when superseded, and only the
+fields whose value or dependencies changed are revalidated.
+"""
+
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import (
+    Any, Awaitable, Callable, Dict, Hashable, List,
+    Optional, Set, Tuple, Union
+)
+
+from fletx.core.types import FormFieldValidationRule
+from fletx.utils import get_logger, get_running_event_loop
+
+
+FieldRules = Union[str, Callable[..., Any], List[FormFieldValidationRule]]
+
+
+####
+##      VALIDATION RESULT
+#####
+@dataclass(frozen=True)
+class ValidationResult:
+    """Result of a field validation"""
+
+    is_valid: bool
+    errors: Tuple[str, ...] = field(default_factory=tuple)
+
+
+####
+##      FORM VALIDATOR
+#####
+class FormValidator:
+    """
+    Incremental Form Validator.
+    Validates the fields of a form against their rules. A rule may be
+    synchronous or return an awaitable (async validators). Synchronous
+    rules run first and async ones only run when they all pass.
+
+    Results are cached per field, by field value and dependency values
+    (`FormFieldValidationRule.depends_on`), so unchanged fields are not
+    revalidated. A new validation of a field cancels its pending async
+    run, whose result is then discarded.
+    """
+
+    _logger = get_logger('FletX.FormValidator')
+
+    def __init__(
+        self,
+        rules: Dict[str, FieldRules],
+        get_value: Callable[[str], Any],
+        on_result: Callable[[str, ValidationResult], None],
+        resolve_rule: Optional[Callable[[str], Optional[Callable]]] = None,
+        cache_size: int = 128,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Args:
+            rules: Validation rules for each field
+            get_value: Returns the current value of a field
+            on_result: Called with each (field, result), async results
+                included, except for superseded runs
+            resolve_rule: Resolves rules given by name (form methods)
+            cache_size: Number of cached results per field
+            loop: Event loop running async validators,
+                defaults to the app loop
+        """
+
+        self._rules: Dict[str, List[FormFieldValidationRule]] = {
+            name: self._normalize_rules(field_rules)
+            for name, field_rules in rules.items()
+        }
+        self._get_value = get_value
+        self._on_result = on_result
+        self._resolve_rule = resolve_rule
+        self._cache_size = cache_size
+        self._loop = loop
+
+        self._cache: Dict[str, OrderedDict] = {name: OrderedDict() for name in self._rules}
+        self._pending: Dict[str, Tuple[int, Future]] = {}
+        self._runs: Dict[str, int] = {}
+        self._settled_callbacks: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+
+        # Fields to revalidate when a field changes
+        self._dependents: Dict[str, Set[str]] = {}
+        for name, field_rules in self._rules.items():
+            for rule in field_rules:
+                for dependency in rule.depends_on:
+                    self._dependents.setdefault(dependency, set()).add(name)
+
+    @staticmethod
+    def _normalize_rules(rules: FieldRules) -> List[FormFieldValidationRule]:
+        """Turns the rules of a field into a list of validation rules"""
+
+        if isinstance(rules, list):
+            return rules
+        return [FormFieldValidationRule(validate_fn = rules, err_message = None)]
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields having validation rules"""
+        return list(self._rules)
+
+    @property
+    def watched_fields(self) -> Set[str]:
+        """Fields whose changes trigger a validation"""
+        return set(self._rules) | set(self._dependents)
+
+    @property
+    def pending(self) -> Set[str]:
+        """Fields with a running async validation"""
+
+        with self._lock:
+            return set(self._pending)
+
+    def dependencies_of(self, name: str) -> List[str]:
+        """Fields the rules of `name` depend on"""
+
+        return [
+            dependency
+            for rule in self._rules.get(name, ())
+            for dependency in rule.depends_on
+        ]
+
+    def field_changed(self, name: str):
+        """Revalidates a changed field and the fields depending on it"""
+
+        if name in self._rules:
+            self.validate(name)
+        for dependent in sorted(self._dependents.get(name, ())):
+            self.validate(dependent)
+
+    def validate(self, name: str) -> Optional[ValidationResult]:
+        """
+        Validates a field.
+        Returns the result, or None while async validators are running
+        (the result is then reported through `on_result`).
+        """
+
+        if name not in self._rules:
+            return ValidationResult(True)
+
+        value = self._get_value(name)
+        dependencies = {
+            dependency: self._get_value(dependency)
+            for dependency in self.dependencies_of(name)
+        }
+        key = self._cache_key(value, dependencies)
+
+        with self._lock:
+            run = self._runs.get(name, 0) + 1
+            self._runs[name] = run
+            self._cancel_pending(name)
+
+            cached = self._cache[name].get(key) if key is not None else None
+            if cached is not None:
+                self._cache[name].move_to_end(key)
+
+        if cached is not None:
+            self._report(name, cached)
+            self._notify_if_settled()
+            return cached
+
+        errors, awaitables = self._run_sync_rules(name, value, dependencies)
+
+        # Async validators only run when synchronous rules pass
+        if errors or not awaitables:
+            for _, awaitable in awaitables:
+                _close(awaitable)
+            result = ValidationResult(not errors, tuple(errors))
+            self._store(name, key, result)
+            self._report(name, result)
+            self._notify_if_settled()
+            return result
+
+        return self._start_async(name, run, key, value, awaitables)
+
+    def _run_sync_rules(
+        self,
+        name: str,
+        value: Any,
+        dependencies: Dict[str, Any]
+    ) -> Tuple[List[str], List[Tuple[FormFieldValidationRule, Awaitable]]]:
+        """Runs the rules of a field, collecting errors and async checks"""
+
+        errors: List[str] = []
+        awaitables = []
+
+        for rule in self._rules[name]:
+            validate_fn = rule.validate_fn
+
+            # Form method given by name
+            if isinstance(validate_fn, str):
+                resolved = self._resolve_rule(validate_fn) if self._resolve_rule else None
+                if not callable(resolved):
+                    self._logger.warning(
+                        f'Rule {validate_fn} ignored for "{name}" field '
+                        f'because the form has no method {validate_fn}.'
+                    )
+                    continue
+                validate_fn = resolved
+
+            check = (
+                validate_fn(value, dependencies) if rule.depends_on
+                else validate_fn(value)
+            )
+
+            if inspect.isawaitable(check):
+                awaitables.append((rule, check))
+            elif not check:
+                errors.append(self._error_message(rule, name, value))
+
+        return errors, awaitables
+
+    def _start_async(
+        self,
+        name: str,
+        run: int,
+        key: Optional[Hashable],
+        value: Any,
+        awaitables: List[Tuple[FormFieldValidationRule, Awaitable]]
+    ) -> Optional[ValidationResult]:
+        """
+        Runs async validators, reporting their result unless superseded.
+        Returns the result when it could be computed synchronously.
+        """
+
+        async def run_checks():
+            checks = await asyncio.gather(*(check for _, check in awaitables))
+            return [
+                self._error_message(rule, name, value)
+                for (rule, _), check in zip(awaitables, checks)
+                if not check
+            ]
+
+        def on_done(future: Future) -> Optional[ValidationResult]:
+            with self._lock:
+                current = self._pending.get(name)
+                if current is None or current[0] != run:
+                    return None
+                del self._pending[name]
+
+            if future.cancelled():
+                return None
+
+            error = future.exception()
+            if error is not None:
+                self._logger.error(
+                    f'Async validation of "{name}" failed: {error}',
+                    exc_info = error
+                )
+                result = ValidationResult(False, (f"Invalid {name} value",))
+            else:
+                errors = future.result()
+                result = ValidationResult(not errors, tuple(errors))
+                self._store(name, key, result)
+
+            self._report(name, result)
+            self._notify_if_settled()
+            return result
+
+        loop = self._get_loop()
+        if loop is None:
+            # No event loop to run on, validate synchronously
+            future = Future()
+            with self._lock:
+                self._pending[name] = (run, future)
+            try:
+                future.set_result(asyncio.run(run_checks()))
+            except Exception as e:
+                future.set_exception(e)
+            return on_done(future)
+
+        future = asyncio.run_coroutine_threadsafe(run_checks(), loop)
+        with self._lock:
+            self._pending[name] = (run, future)
+        future.add_done_callback(on_done)
+        return None
+
+    def _get_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Returns the running loop async validators run on, if any"""
+
+        loop = get_running_event_loop(self._loop)
+        if loop is not None:
+            return loop
+        
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _cancel_pending(self, name: str):
+        """Cancels the running async validation of a field"""
+
+        pending = self._pending.pop(name, None)
+        if pending is not None:
+            pending[1].cancel()
+
+    def validate_all(self) -> bool:
+        """
+        Validates every field (from cache when unchanged).
+        Fields still being validated asynchronously count as invalid,
+        see `when_settled`.
+        """
+
+        results = [self.validate(name) for name in self._rules]
+        return all(result is not None and result.is_valid for result in results)
+
+    def when_settled(self, callback: Callable[[], None]):
+        """Calls `callback` once no async validation is running"""
+
+        with self._lock:
+            if self._pending:
+                self._settled_callbacks.append(callback)
+                return
+        callback()
+
+    def _notify_if_settled(self):
+        with self._lock:
+            if self._pending:
+                return
+            callbacks, self._settled_callbacks = self._settled_callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    def invalidate(self, name: Optional[str] = None):
+        """Clears cached results, of one field or of all fields"""
+
+        with self._lock:
+            for field_name, cache in self._cache.items():
+                if name is None or field_name == name:
+                    cache.clear()
+
+    def cancel(self):
+        """Cancels every running async validation"""
+
+        with self._lock:
+            for name in list(self._pending):
+                self._cancel_pending(name)
+            self._settled_callbacks.clear()
+
+    def _store(self, name: str, key: Optional[Hashable], result: ValidationResult):
+        """Caches a result"""
+
+        if key is None:
+            return
+
+        with self._lock:
+            cache = self._cache[name]
+            cache[key] = result
+            cache.move_to_end(key)
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+    def _report(self, name: str, result: ValidationResult):
+        try:
+            self._on_result(name, result)
+        except Exception as e:
+            self._logger.error(f'Error reporting "{name}" validation: {e}', exc_info=True)
+
+    @staticmethod
+    def _cache_key(value: Any, dependencies: Dict[str, Any]) -> Optional[Hashable]:
+        """Cache key of a value and its dependencies, None if unhashable"""
+
+        key = (value, tuple(dependencies.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _error_message(rule: FormFieldValidationRule, name: str, value: Any) -> str:
+        if rule.err_message is None:
+            return f"Invalid {name} value"
+        return rule.err_message.format(field = name, value = value)
+
+
+# CLOSE
+def _close(awaitable: Awaitable):
+    """Closes an awaitable that will never be awaited"""
+
+    close = getattr(awaitable, 'close', None)
+    if close is not None:
+        close()
@@ -16,6 +16,7 @@ from fletx.core.state import (
 )
 from fletx.utils import get_logger, get_page
 from fletx.core.factory import FletXWidgetRegistry
+from fletx.core.scheduling import request_update
 # from fletx.utils.context import AppContext
 
 
@@ -176,7 +177,7 @@ class FletXWidget(ABC):
                     self.build()
             
             # Finally, update the widget
-            self.update()
+            request_update(self)
         return callback
 
     def _dispose_reactives(self):
@@ -197,7 +198,7 @@ class FletXWidget(ABC):
 
         self._props.update(kwargs)
         if self._is_mounted:
-            self.update()
+            request_update(self)
 
     # Override ft.Control's methods
     # def _get_control_name(self):
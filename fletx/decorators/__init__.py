@@ -1,11 +1,12 @@
 from fletx.decorators.widgets import (
     reactive_control, simple_reactive,
     reactive_form, reactive_list, 
+    reactive_virtual_list,
     reactive_state_machine, two_way_reactive,
-    computed_reactive, obx
+    computed_reactive, obx, memo_obx
 )
 from fletx.decorators.reactive import (
-    reactive_batch, reactive_debounce,
+    reactive_batch, batch_scope, reactive_debounce,
     reactive_effect, reactive_memo, 
     reactive_select, reactive_throttle,
     reactive_when, reactive_computed
@@ -21,14 +22,17 @@ __all__ = [
     "simple_reactive",
     "reactive_form",
     "reactive_list",
+    "reactive_virtual_list",
     "reactive_state_machine",
     "two_way_reactive",
     "computed_reactive",
     "obx",
+    "memo_obx",
 
     # Reactives
     "reactive_property",
     "reactive_batch",
+    "batch_scope",
     "reactive_debounce",
     "reactive_effect",
     "reactive_memo",
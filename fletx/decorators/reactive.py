@@ -7,11 +7,13 @@ facilitating seamless UI updates.
 """
 
 import flet as ft
-import asyncio
 import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import (
     Callable, Any, TypeVar, Dict, Union,
-    List, Optional, Tuple, Set
+    List, Optional, Tuple, Set, Hashable
 )
 from functools import wraps
 from weakref import WeakSet
@@ -21,7 +23,8 @@ from fletx.core.state import (
     Reactive, ReactiveDependencyTracker, Computed,
     Observer
 )
-from fletx.utils import get_logger, get_event_loop
+from fletx.core.scheduling import DebouncedCall, call_later
+from fletx.utils import get_logger, make_call_key
 
 
 T = TypeVar('T')
@@ -34,30 +37,125 @@ logger = get_logger('FletX.Decorators.Reactive')
 ##      REACTIVE BATCH DECORATOR
 #####
 class BatchManager:
-    """Manages batched reactive updates"""
+    """
+    Manages batched reactive updates.
+    Updates are queued in insertion order, an update queued again 
+    before the flush replaces the previous one (keeping its position),
+    and the queue is flushed on the next tick of the app event loop
+    (a timer thread when it is not running). Updates can be queued 
+    from any thread.
+
+    Updates queued while a batch scope is open (see `scope`) are held
+    until the last scope with that name closes, then flushed together.
+    """
     
     def __init__(self):
-        self.pending_updates: Set[Callable] = set()
+        self.pending_updates: 'OrderedDict[Hashable, Callable]' = OrderedDict()
         self.batch_scheduled = False
+        self._scoped_updates: Dict[Hashable, 'OrderedDict[Hashable, Callable]'] = {}
+        self._open_scopes: Dict[Hashable, int] = {}
+        self._local = threading.local()
+        self._lock = threading.RLock()
+    
+    def add_update(
+        self, 
+        update_fn: Callable, 
+        key: Optional[Hashable] = None,
+        scope: Optional[Hashable] = None
+    ):
+        """
+        Queues an update.
+        Args:
+            update_fn: The update to run
+            key: Deduplication key, defaults to the update itself
+            scope: Name of an open scope to join, even from another thread.
+                Updates join the outermost scope of the current thread
+                otherwise.
+        """
+
+        key = update_fn if key is None else key
+        stack = self._scope_stack()
+
+        with self._lock:
+            if scope is None or scope not in self._open_scopes:
+                scope = stack[0] if stack else None
+
+            if scope is not None:
+                self._scoped_updates.setdefault(scope, OrderedDict())[key] = update_fn
+                return
+            
+            self.pending_updates[key] = update_fn
+            self._schedule_flush()
     
-    def add_update(self, update_fn: Callable):
-        self.pending_updates.add(update_fn)
+    def _schedule_flush(self):
         if not self.batch_scheduled:
             self.batch_scheduled = True
-            asyncio.create_task(self._flush_batch())
-    
-    async def _flush_batch(self):
-        await asyncio.sleep(0)  # Next tick
-        updates = list(self.pending_updates)
-        self.pending_updates.clear()
-        self.batch_scheduled = False
+            call_later(0, self.flush)
+    
+    @contextmanager
+    def scope(self, name: Optional[Hashable] = None):
+        """
+        Opens a batch scope.
+        Scopes nest: updates queued in the current thread join its
+        outermost scope. Scopes with the same name, possibly opened 
+        by several threads, are flushed together when the last one 
+        closes.
+
+        Usage:
+        ```python
+        with batch_manager.scope('sync'):
+            for item in items:
+                refresh_item(item)
+        ```
+        """
+
+        name = object() if name is None else name
+        stack = self._scope_stack()
+        stack.append(name)
+
+        with self._lock:
+            self._open_scopes[name] = self._open_scopes.get(name, 0) + 1
+        
+        try:
+            yield name
+        finally:
+            stack.pop()
+            with self._lock:
+                self._open_scopes[name] -= 1
+                if self._open_scopes[name] == 0:
+                    del self._open_scopes[name]
+                    updates = self._scoped_updates.pop(name, None)
+
+                    # Join the enclosing scope or the next flush
+                    if updates:
+                        queue = (
+                            self._scoped_updates.setdefault(stack[0], OrderedDict())
+                            if stack else self.pending_updates
+                        )
+                        queue.update(updates)
+                        if not stack:
+                            self._schedule_flush()
+    
+    def _scope_stack(self) -> List[Hashable]:
+        stack = getattr(self._local, 'scopes', None)
+        if stack is None:
+            stack = self._local.scopes = []
+        return stack
+    
+    def flush(self):
+        """Runs the queued updates, in insertion order"""
+
+        with self._lock:
+            updates = list(self.pending_updates.values())
+            self.pending_updates.clear()
+            self.batch_scheduled = False
         
         logger.debug(f"Flushing batch of {len(updates)} updates")
         for update in updates:
             try:
                 update()
             except Exception as e:
-                logger.error(f"Error in batched update: {e}")
+                logger.error(f"Error in batched update: {e}", exc_info=True)
 
 _batch_manager = BatchManager()
 
@@ -65,9 +163,16 @@ _batch_manager = BatchManager()
 ####
 ##      BATCH DECORATOR
 #####
-def reactive_batch():
+def reactive_batch(
+    scope: Optional[Hashable] = None,
+    key_fn: Optional[Callable[..., Hashable]] = None
+):
     """
     Batches reactive updates to execute on the next tick.
+    Calls with the same arguments (equal values, the same object for 
+    unhashable ones) or the same `key_fn` key made before the flush 
+    are merged into one, run with the latest arguments. Calls can come 
+    from any thread, and join the `scope` batch scope while it is open.
     
     Usage:
     ```python
@@ -80,8 +185,9 @@ def reactive_batch():
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs) if key_fn else make_call_key(args, kwargs)
             update_fn = lambda: func(*args, **kwargs)
-            _batch_manager.add_update(update_fn)
+            _batch_manager.add_update(update_fn, key = (func, key), scope = scope)
             logger.debug(f"Batched {func.__name__} for next tick")
         
         return wrapper
@@ -89,40 +195,158 @@ def reactive_batch():
     return decorator
 
 
+def batch_scope(name: Optional[Hashable] = None):
+    """
+    Opens a batch scope on the shared batch manager, 
+    see `BatchManager.scope`.
+    
+    Usage:
+    ```python
+    with batch_scope():
+        batch_update(items)
+        batch_update(items)  # Merged with the first call
+    # Flushed here, on the next tick
+    ```
+    """
+
+    return _batch_manager.scope(name)
+
+
 ####
-##      REACTIVE MEMO DECORATOR
+##      REACTIVE MEMO CACHE
 #####
+class MemoCacheEntry:
+    """
+    A memoized result with its dependencies, their versions when it
+    was computed and its invalidation observers
+    """
+
+    __slots__ = ('value', 'dependencies', 'versions', 'observers', 'expires_at')
+
+    def __init__(
+        self,
+        value: Any,
+        dependencies: Set[Reactive],
+        versions: Dict[Reactive, int],
+        observers: List[Observer],
+        expires_at: Optional[float]
+    ):
+        self.value = value
+        self.dependencies = dependencies
+        self.versions = versions
+        self.observers = observers
+        self.expires_at = expires_at
+
+
 class ReactiveMemoryCache:
-    """Cache for memoized reactive computations"""
+    """
+    Cache for memoized reactive computations.
+    LRU cache backed by an OrderedDict (O(1) get, set and eviction) with
+    an optional time to live. An entry whose dependency versions changed
+    is a miss, even while its invalidation is deferred by a batch. The
+    dependency observers of an entry, which free it as soon as a
+    dependency changes, are disposed when it is invalidated, evicted, 
+    expired or replaced.
+    """
     
-    def __init__(self, maxsize: int = 128):
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
         self.maxsize = maxsize
-        self.cache: Dict[str, Tuple[Any, Set[Reactive]]] = {}
-        self.access_order: List[str] = []
-    
-    def get(self, key: str) -> Optional[Tuple[Any, Set[Reactive]]]:
-        if key in self.cache:
+        self.ttl = ttl
+        self.cache: 'OrderedDict[Hashable, MemoCacheEntry]' = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> Optional[Tuple[Any, Set[Reactive]]]:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            # Changed since computed, its observers may not have run yet
+            if any(dep.version != version for dep, version in entry.versions.items()):
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            
             # Move to end (most recently used)
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]
-        return None
-    
-    def set(self, key: str, value: Any, dependencies: Set[Reactive]):
-        if len(self.cache) >= self.maxsize and key not in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry.value, entry.dependencies
+    
+    def set(
+        self, 
+        key: Hashable, 
+        value: Any, 
+        dependencies: Set[Reactive],
+        observers: Optional[List[Observer]] = None,
+        versions: Optional[Dict[Reactive, int]] = None
+    ):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+            
+            self.cache[key] = MemoCacheEntry(
+                value, dependencies, versions or {}, observers or [], expires_at
+            )
+            
             # Remove least recently used
-            oldest_key = self.access_order.pop(0)
-            del self.cache[oldest_key]
-        
-        self.cache[key] = (value, dependencies)
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
-    
-    def invalidate(self, key: str):
-        if key in self.cache:
-            del self.cache[key]
-            self.access_order.remove(key)
+            while len(self.cache) > self.maxsize:
+                self._remove(next(iter(self.cache)))
+                self.evictions += 1
+    
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            for key in list(self.cache):
+                self._remove(key)
+
+    def _remove(self, key: Hashable):
+        """Removes an entry and disposes its dependency observers"""
+
+        entry = self.cache.pop(key)
+        for observer in entry.observers:
+            observer.dispose()
+
+    def info(self) -> Dict[str, int]:
+        """Cache statistics"""
+
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'expirations': self.expirations,
+                'size': len(self.cache),
+                'maxsize': self.maxsize
+            }
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.cache
 
 
 ####
@@ -130,26 +354,32 @@ class ReactiveMemoryCache:
 #####
 def reactive_memo(
     maxsize: int = 128,
-    key_fn: Optional[Callable[..., str]] = None
+    key_fn: Optional[Callable[..., Hashable]] = None,
+    ttl: Optional[float] = None
 ):
     """
     Memoizes reactive computations with dependency tracking.
+    A cached result is dropped as soon as one of the reactives read
+    while computing it changes, and is never served once their versions
+    changed (e.g. inside a batch, before the invalidation runs).
     
     Args:
         maxsize: Maximum number of cached results
         key_fn: Custom function to generate cache keys
+        ttl: Time to live of cached results, in seconds
     
     Usage:
     ```python
     @reactive_memo(maxsize=64)
     def expensive_computation(rx_a: RxInt, rx_b: RxInt):
         return rx_a.value * rx_b.value + complex_calculation()
+
+    expensive_computation.cache_info()  # hits, misses, evictions...
     ```
     """
-    cache = ReactiveMemoryCache(maxsize)
+    cache = ReactiveMemoryCache(maxsize, ttl)
     
     def decorator(func: F) -> F:
-        dependency_observers: Dict[str, List[Observer]] = {}
         
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -157,54 +387,123 @@ def reactive_memo(
             if key_fn:
                 cache_key = key_fn(*args, **kwargs)
             else:
-                cache_key = f"{func.__name__}_{hash((args, tuple(kwargs.items())))}"
+                cache_key = (func.__name__, args, tuple(sorted(kwargs.items())))
             
             # Check cache
             cached = cache.get(cache_key)
-            if cached:
+            if cached is not None:
                 result, deps = cached
                 logger.debug(f"Cache hit for {cache_key}")
                 return result
             
             # Track dependencies during computation
-            from fletx.core import ReactiveDependencyTracker
             result, dependencies = ReactiveDependencyTracker.track(
                 lambda: func(*args, **kwargs)
             )
             
-            # Cache result
-            cache.set(cache_key, result, dependencies)
-            
-            # Set up invalidation observers
-            observers = []
-            for dep in dependencies:
-                observer = dep.listen(
+            versions = {dep: dep.version for dep in dependencies}
+
+            # Set up invalidation observers, freeing the entry early
+            observers = [
+                dep.listen(
                     lambda k=cache_key: cache.invalidate(k),
                     auto_dispose=False
                 )
-                observers.append(observer)
+                for dep in dependencies
+            ]
             
-            dependency_observers[cache_key] = observers
+            # Cache result
+            cache.set(cache_key, result, dependencies, observers, versions)
             logger.debug(f"Cached {cache_key} with {len(dependencies)} dependencies")
             
             return result
         
         wrapper.cache = cache
-        wrapper.clear_cache = lambda: cache.cache.clear()
+        wrapper.cache_info = cache.info
+        wrapper.clear_cache = cache.clear
         return wrapper
     
     return decorator
 
 
+# RATE LIMITED
+def _rate_limited(
+    func: F,
+    wait: float,
+    leading: bool,
+    trailing: bool,
+    max_wait: Optional[float],
+    key_fn: Optional[Callable[..., Hashable]]
+) -> F:
+    """
+    Wraps `func` with one DebouncedCall per call key. Keys are built
+    from the arguments (see `make_call_key`) unless `key_fn` is given,
+    and a key is dropped once its burst of calls is over.
+    """
+
+    calls: Dict[Hashable, DebouncedCall] = {}
+    lock = threading.Lock()
+
+    def drop(key: Hashable):
+        with lock:
+            call = calls.get(key)
+            if call is not None and not call.active:
+                del calls[key]
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> DebouncedCall:
+        key = key_fn(*args, **kwargs) if key_fn else make_call_key(args, kwargs)
+
+        with lock:
+            call = calls.get(key)
+            if call is None:
+                call = DebouncedCall(
+                    func, wait, 
+                    leading = leading, 
+                    trailing = trailing, 
+                    max_wait = max_wait,
+                    on_idle = lambda: drop(key)
+                )
+                calls[key] = call
+        
+        call.trigger(*args, **kwargs)
+        return call
+    
+    def for_each(method: str):
+        with lock:
+            pending = list(calls.values())
+        for call in pending:
+            getattr(call, method)()
+    
+    wrapper.flush = lambda: for_each('flush')
+    wrapper.cancel = lambda: for_each('cancel')
+    return wrapper
+
+
 ####
 ##      DEBOUNCE DECORATOR
 #####
-def reactive_debounce(delay: float):
+def reactive_debounce(
+    delay: float,
+    leading: bool = False,
+    trailing: bool = True,
+    max_wait: Optional[float] = None,
+    key_fn: Optional[Callable[..., Hashable]] = None
+):
     """
     Debounces reactive updates with a specified delay.
+    Calls are grouped by arguments (equal values, the same object for 
+    unhashable ones) or by `key_fn`, each group runs on a shared timer
+    wheel (see DebouncedCall). The decorated 
+    function returns the group handle (`flush()`, `cancel()`), and 
+    `flush()`/`cancel()` on the function apply to every group.
     
     Args:
         delay: Delay in seconds before executing the function
+        leading: Whether to execute on the first call of a burst
+        trailing: Whether to execute after the last call of a burst
+        max_wait: Maximum time a call can be delayed by a burst
+        key_fn: Returns the key grouping debounced calls
     
     Usage:
     ```python
@@ -215,54 +514,29 @@ def reactive_debounce(delay: float):
     ```
     """
     def decorator(func: F) -> F:
-        pending_calls: Dict[str, asyncio.Task] = {}
-        
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            call_id = f"{id(func)}_{hash((args, tuple(kwargs.items())))}"
-            
-            # Cancel previous call if exists
-            if call_id in pending_calls and not pending_calls[call_id].done():
-                pending_calls[call_id].cancel()
-            
-            async def delayed_call():
-                await asyncio.sleep(delay)
-                try:
-                    if asyncio.iscoroutinefunction(func):
-                        await func(*args, **kwargs)
-                    else:
-                        func(*args, **kwargs)
-
-                except asyncio.CancelledError:
-                    logger.debug(f"Debounced call {call_id} was cancelled")
-
-                except Exception as e:
-                    logger.exception(f"Error in debounced function: {e}")
-
-                finally:
-                    if call_id in pending_calls:
-                        del pending_calls[call_id]
-
-            # loop = get_event_loop()
-            # Schedule new call
-            task = get_event_loop().create_task(delayed_call())
-            pending_calls[call_id] = task
-            
-            logger.debug(f"Debounced {func.__name__} with delay {delay}s")
-        
-        return wrapper
+        return _rate_limited(func, delay, leading, trailing, max_wait, key_fn)
     
     return decorator
 
 ####
 ##      THROTTLE DECORATOR
 #####
-def reactive_throttle(interval: float):
+def reactive_throttle(
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    key_fn: Optional[Callable[..., Hashable]] = None
+):
     """
     Throttles reactive updates to execute at most once per interval.
+    Unless `trailing` is disabled, the last call made within an interval
+    is executed at the end of it, so the final update is never lost.
     
     Args:
         interval: Minimum time between executions in seconds
+        leading: Whether to execute the first call of a burst right away
+        trailing: Whether to execute the last call of a burst
+        key_fn: Returns the key grouping throttled calls
     
     Usage:
     ```python
@@ -273,21 +547,7 @@ def reactive_throttle(interval: float):
     ```
     """
     def decorator(func: F) -> F:
-        last_called: Dict[str, float] = {}
-        
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            call_id = f"{id(func)}_{hash((args, tuple(kwargs.items())))}"
-            now = time.time()
-            
-            if call_id not in last_called or now - last_called[call_id] >= interval:
-                last_called[call_id] = now
-                logger.debug(f"Throttled execution of {func.__name__}")
-                return func(*args, **kwargs)
-            else:
-                logger.debug(f"Throttled {func.__name__} - too soon")
-        
-        return wrapper
+        return _rate_limited(func, interval, leading, trailing, interval, key_fn)
     
     return decorator
 
@@ -444,12 +704,16 @@ def reactive_effect(
 ####
 ##      REACTIVE COMPUTED DECORATOR
 #####
-def reactive_computed(dependencies: Optional[List[Reactive]] = None):
+def reactive_computed(
+    dependencies: Optional[List[Reactive]] = None,
+    lazy: bool = False
+):
     """
     Creates a computed reactive value from a function.
     
     Args:
         dependencies: List of reactive dependencies (auto-detected if None)
+        lazy: Whether to recompute only when the value is read or observed
     
     Usage:
     ```python
@@ -464,6 +728,6 @@ def reactive_computed(dependencies: Optional[List[Reactive]] = None):
     """
     def decorator(func: F) -> Reactive:
         from fletx.core.state import Computed
-        return Computed(func, dependencies)
+        return Computed(func, dependencies, lazy = lazy)
     
     return decorator
@@ -5,34 +5,48 @@ This module provides advanced decorators for creating reactive widgets
 with custom bindings, transformations, and lifecycle callbacks.
 """
 
+import time
 import flet as ft
 from functools import wraps
+from collections import OrderedDict, deque
 from typing import (
     Tuple, get_type_hints, Dict, Callable, Any,
-    Optional, Union, List, TypeVar
+    Optional, Union, List, TypeVar, Hashable, Set
 )
 from dataclasses import dataclass
 from enum import Enum
 
 from fletx.core import (
     Reactive, RxInt, RxStr, RxBool, RxList, RxDict,
-    FletXWidget
+    FletXWidget, ListChange, Insert, Replace
 )
 from fletx.core import (
     BindingType, BindingConfig, ComputedBindingConfig,
     FormFieldValidationRule
 )
+from fletx.core.validation import FormValidator, ValidationResult
+from fletx.core.scheduling import (
+    request_update, RebuildPriority, TrailingCall, DebouncedCall
+)
 from fletx.widgets import Obx
-from fletx.utils import get_logger #, get_page
+from fletx.utils import get_logger, make_call_key #, get_page
 
 logger = get_logger("FletX.WidgetDecorators")
 
+_MISSING = object()
+
 
 ####
 ##      REACTIVE BUILDER DECORATOR
 #####
 def obx(
-        builder_fn: Callable[...,Union[ft.Control,List[ft.Control]]]
+        builder_fn: Optional[Callable[...,Union[ft.Control,List[ft.Control]]]] = None,
+        *,
+        select: Optional[Callable[..., Any]] = None,
+        equals: Union[str, Callable[[Any, Any], bool], None] = None,
+        priority: Optional[RebuildPriority] = None,
+        memo: bool = False,
+        memo_size: int = 128
     ) -> Callable[[], ft.Control]:
     """
     Decorator that creates a reactive widget from a builder function.
@@ -40,6 +54,19 @@ def obx(
 
     Args:
         builder_fn: Function that return a flet control
+        select: Optional selector, called with the builder arguments.
+            Only the reactives it reads are tracked, and the builder
+            only runs when its result changes.
+        equals: Equality strategy comparing selected values
+        priority: Defers rebuilds to the event loop in this priority
+            lane (see RebuildScheduler) instead of running them
+            inside the reactive write
+        memo: Reuses the Obx built for the same arguments (compared by
+            value when hashable, by identity otherwise) as long as it is
+            not disposed. The reused Obx is already up to date with the
+            reactives it tracks, so its builder does not run again.
+        memo_size: Maximum number of memoized Obx, least recently used
+            ones are dropped first
 
     Returns:
         Function that returns the actual Control (preserves widget identity)
@@ -54,23 +81,88 @@ def obx(
             weight = "bold",
             color = 'red' if self.ctrl.count.value % 2 == 0 else 'white'
         )
+
+    @obx(select=lambda self: self.ctrl.user.value.name)
+    def user_name(self):
+        return ft.Text(self.ctrl.user.value.name)
+
+    @obx(priority=RebuildPriority.IDLE)
+    def history_chart(self):
+        return build_chart(self.ctrl.history.value)
+
+    @obx(memo=True)
+    def product_card(self, product_id):
+        return ft.Card(...)
     ```
     """
 
+    # Used as @obx(select=...)
+    if builder_fn is None:
+        return lambda fn: obx(
+            fn, select=select, equals=equals, priority=priority,
+            memo=memo, memo_size=memo_size
+        )
+
+    cache: Optional[OrderedDict] = OrderedDict() if memo else None
+
     @wraps(builder_fn)
     def wrapper(*args, **kwargs):
 
+        if cache is not None:
+            key = make_call_key(args, kwargs)
+            entry = cache.get(key)
+            if entry is not None:
+                if not entry[0].is_disposed:
+                    cache.move_to_end(key)
+                    return entry[0]
+                del cache[key]
+
         # Create a new builder function that calls the original with args
         def internal_builder():
             return builder_fn(*args, **kwargs)
         
+        internal_select = None
+        if select is not None:
+            def internal_select():
+                return select(*args, **kwargs)
+        
         # Create Obx wrapper and return the actual widget
-        obx_wrapper = Obx(internal_builder)
+        obx_wrapper = Obx(
+            internal_builder, 
+            select = internal_select, 
+            equals = equals,
+            priority = priority
+        )
+
+        if cache is not None:
+            # Arguments are kept so that identity keys stay valid
+            cache[key] = (obx_wrapper, args, kwargs)
+            if len(cache) > memo_size:
+                cache.popitem(last=False)
+
+            # Release the arguments (often a page or controller) on unmount
+            def forget():
+                entry = cache.get(key)
+                if entry is not None and entry[0] is obx_wrapper:
+                    del cache[key]
+            obx_wrapper.on_dispose(forget)
         return obx_wrapper 
     
+    if cache is not None:
+        wrapper.cache_clear = cache.clear
     return wrapper
 
 
+# MEMO OBX
+def memo_obx(
+        builder_fn: Optional[Callable[...,Union[ft.Control,List[ft.Control]]]] = None,
+        **options
+    ) -> Callable[[], ft.Control]:
+    """Shortcut for `@obx(memo=True, ...)`"""
+
+    return obx(builder_fn, memo=True, **options)
+
+
 ####
 ##      REACTIVE CONTROL DECORATOR
 #####
@@ -99,7 +191,8 @@ def reactive_control(
                 transform_to_widget=lambda x: str(x),
                 validation=lambda x: x >= 0,
                 on_change=lambda old, new: print(f"Changed: {old} -> {new}"),
-                debounce_ms=300
+                debounce_ms=300,
+                write_interval_ms=150
             ),
             'visible': 'rx_visible'  # Simple binding
         },
@@ -154,7 +247,10 @@ def reactive_control(
 
             # Storage for binding observers and timers
             self._binding_observers = {}
-            self._binding_timers = {}
+            self._binding_timers: Dict[Callable, DebouncedCall] = {}
+            self._binding_writers: Dict[str, TrailingCall] = {}
+            self._pending_writes: Dict[str, Any] = {}
+            self._binding_echoes: Dict[str, Any] = {}
             self._computed_reactives = {}
 
             # Validate reactive attributes
@@ -241,11 +337,16 @@ def reactive_control(
             """Create a callback for reactive binding"""
 
             def callback():
-                if not self._is_mounted:
-                    return
-                
                 reactive_obj = getattr(self, config.reactive_attr)
                 new_value = reactive_obj.value
+
+                # Skip the echo of a value written by the widget itself
+                echo = self._binding_echoes.pop(widget_prop, _MISSING)
+                if echo is not _MISSING and _same_item(echo, new_value):
+                    return
+                
+                if not self._is_mounted:
+                    return
                 
                 # Apply condition check
                 if config.condition and not config.condition():
@@ -275,7 +376,7 @@ def reactive_control(
                 # self.content = self.build()
                 
                 # Update the widget
-                self.update()
+                request_update(self)
 
                 logger.debug(
                     f"Updated {widget_prop} from reactive "
@@ -306,28 +407,72 @@ def reactive_control(
             config: BindingConfig, 
             reactive_obj: Reactive
         ):
-            """Setup two-way binding for supported widgets"""
+            """
+            Setup two-way binding for supported widgets.
+            Widget changes are written to the reactive right away, or at
+            most once per `write_interval_ms` (the last value is always
+            written, at the latest on blur, submit or unmount). The 
+            reactive -> widget update they trigger is skipped, since the 
+            widget already shows the value.
+            """
 
             # This is a simplified implementation 
             # we'd need to handle specific widget events Later :-)
-            if hasattr(self, 'on_change'):
-                original_on_change = self.on_change
+            if not hasattr(self, 'on_change'):
+                return
+            
+            def write():
+                value = self._pending_writes.pop(widget_prop, _MISSING)
+                if value is _MISSING or _same_item(reactive_obj.value, value):
+                    return
                 
-                def on_change_handler(e):
-                    widget_value = getattr(self, widget_prop)
-                    
-                    # Transform value from widget
-                    if config.transform_from_widget:
-                        widget_value = config.transform_from_widget(widget_value)
-                    
-                    # Update reactive
-                    reactive_obj.value = widget_value
-                    
-                    # Call original handler
-                    if original_on_change:
-                        original_on_change(e)
+                self._binding_echoes[widget_prop] = value
+                reactive_obj.value = value
+            
+            writer = None
+            if config.write_interval_ms:
+                writer = TrailingCall(write, config.write_interval_ms)
+                self._binding_writers[widget_prop] = writer
+
+            original_on_change = self.on_change
+            
+            def on_change_handler(e):
+                widget_value = getattr(self, widget_prop)
+                
+                # Transform value from widget
+                if config.transform_from_widget:
+                    widget_value = config.transform_from_widget(widget_value)
                 
-                self.on_change = on_change_handler
+                # Update reactive, now or on the trailing edge
+                self._pending_writes[widget_prop] = widget_value
+                if writer:
+                    writer.trigger()
+                else:
+                    write()
+                
+                # Call original handler
+                if original_on_change:
+                    original_on_change(e)
+            
+            self.on_change = on_change_handler
+
+            if not writer:
+                return
+            
+            # Commit pending input as soon as the user leaves the field
+            def flush_on(event_name: str):
+                original_handler = getattr(self, event_name)
+
+                def handler(e):
+                    writer.flush()
+                    if original_handler:
+                        original_handler(e)
+                
+                setattr(self, event_name, handler)
+            
+            for event_name in ('on_blur', 'on_submit'):
+                if hasattr(self, event_name):
+                    flush_on(event_name)
 
         def _setup_computed_bindings(self):
             """Setup computed reactive bindings"""
@@ -360,7 +505,7 @@ def reactive_control(
                     if config.on_change:
                         config.on_change(old_value, value)
                     
-                    self.update()
+                    request_update(self)
                 
                 observer = computed.listen(computed_callback, auto_dispose=False)
                 self._binding_observers[f"computed_{widget_prop}"] = observer
@@ -369,40 +514,23 @@ def reactive_control(
                 computed_callback()
 
         def _debounce(self, func: Callable, delay_ms: int):
-            """Create debounced version of function"""
-            import asyncio
-            
-            def debounced():
-                if hasattr(self, '_debounce_tasks'):
-                    if func in self._debounce_tasks:
-                        self._debounce_tasks[func].cancel()
-                else:
-                    self._debounce_tasks = {}
-                
-                async def delayed_call():
-                    await asyncio.sleep(delay_ms / 1000)
-                    func()
-                
-                task = asyncio.create_task(delayed_call())
-                self._debounce_tasks[func] = task
-            
-            return debounced
+            """Create debounced version of function, reusing a single timer"""
+
+            call = DebouncedCall(func, delay_ms / 1000)
+            self._binding_timers[func] = call
+            return call.trigger
         
         def _throttle(self, func: Callable, interval_ms: int):
-            """Create throttled version of function"""
-            import time
-            
-            def throttled():
-                now = time.time()
-                if not hasattr(self, '_throttle_last_calls'):
-                    self._throttle_last_calls = {}
-                
-                if (func not in self._throttle_last_calls or 
-                    now - self._throttle_last_calls[func] >= interval_ms / 1000):
-                    self._throttle_last_calls[func] = now
-                    func()
-            
-            return throttled
+            """
+            Create throttled version of function.
+            Runs at most once per interval, the last call of a burst
+            is always run on the trailing edge.
+            """
+
+            interval = interval_ms / 1000
+            call = DebouncedCall(func, interval, leading=True, max_wait=interval)
+            self._binding_timers[func] = call
+            return call.trigger
         
         def did_mount(self):
             """Enhanced did_mount with lifecycle callbacks"""
@@ -422,6 +550,12 @@ def reactive_control(
             if 'will_unmount' in lifecycle_callbacks:
                 lifecycle_callbacks['will_unmount'](self)
             
+            # Write pending widget values, then drop debounced updates
+            for writer in self._binding_writers.values():
+                writer.flush()
+            for timer in self._binding_timers.values():
+                timer.cancel()
+            
             # Cleanup binding observers
             for observer in self._binding_observers.values():
                 observer.dispose()
@@ -432,11 +566,6 @@ def reactive_control(
                 computed.dispose()
             self._computed_reactives.clear()
             
-            # Cleanup debounce tasks
-            if hasattr(self, '_debounce_tasks'):
-                for task in self._debounce_tasks.values():
-                    task.cancel()
-            
             if original_will_unmount:
                 original_will_unmount(self)
             
@@ -553,7 +682,10 @@ def reactive_form(
     
     Args:
         form_fields: Mapping of form field names to reactive attributes
-        validation_rules: Validation functions for each field
+        validation_rules: Validation functions for each field. Results
+            are cached by value, async validators are supported and only
+            changed fields (or fields depending on them) are revalidated,
+            see FormValidator.
         on_submit: Callback when form is submitted
         auto_validate: Whether to validate fields on change
     
@@ -578,6 +710,11 @@ def reactive_form(
                 FormFieldValidationRule(
                     validate_fn = lambda value : value != 'azerty',
                     err_message = '{field} value cannot be "azerty".'
+                ),
+                FormFieldValidationRule(
+                    validate_fn = lambda value, deps: value == deps['password'],
+                    err_message = 'Passwords do not match.',
+                    depends_on = ['password']   # Revalidated when password changes
                 )
             ]
         },
@@ -599,6 +736,10 @@ def reactive_form(
             # Validation logic here...
             return True
 
+        async def validate_email_available(self, value) -> bool:
+            # Async rules are awaited on the event loop, e.g. HTTPClient calls
+            return True
+
         # Other handler methods ...
     ```
     """
@@ -632,7 +773,9 @@ def reactive_form(
             
             self.get_errors = lambda: self._form_errors.copy()
             
-            self.is_valid = lambda: len(self._form_errors) == 0
+            self.is_valid = lambda: (
+                len(self._form_errors) == 0 and not self._validator.pending
+            )
             
             self.submit = lambda: self._handle_submit()
             
@@ -643,107 +786,84 @@ def reactive_form(
         def _setup_form_bindings(self):
             """Setup reactive bindings for form fields"""
 
-            for field, rx_attr in form_fields.items():
-                reactive_obj = getattr(self, rx_attr)
-                
-                if auto_validate and field in validation_rules:
-                    # Setup validation on change
-                    def create_validator(field_name):
-                        def validator():
-                            self._validate_field(field_name)
-                        return validator
-                    
-                    observer = reactive_obj.listen(create_validator(field), auto_dispose=False)
-                    self._validation_observers.append(observer)
-
-        def _validate_field(self, field: str) -> bool:
-            """Validate a single field"""
-
-            if field not in validation_rules:
-                return True
-            
-            rx_attr = form_fields[field]
-            value = getattr(self, rx_attr).value
-
-            # Get field validation rules
-            rules = validation_rules[field]
-            is_valid = False
-            errors: List[str] = []
+            self._validator = FormValidator(
+                rules = validation_rules,
+                get_value = lambda field: getattr(self, form_fields[field]).value,
+                on_result = self._apply_validation_result,
+                resolve_rule = lambda name: getattr(self, name, None)
+            )
 
-            # 1. rules is Callable
-            if callable(rules):
-                # Then call it with the value
-                is_valid = rules(value)
+            if not auto_validate:
+                return
 
-            # 2. FormClass Callable attribute (function)
-            elif isinstance(rules, str): 
-                if hasattr(self,rules):
-                    is_valid = getattr(self,rules)(value)
+            # Revalidate fields when their value or a dependency changes
+            for field in self._validator.watched_fields:
+                reactive_obj = getattr(self, form_fields[field])
+                
+                def create_validator(field_name):
+                    def validator():
+                        self._validator.field_changed(field_name)
+                    return validator
+                
+                observer = reactive_obj.listen(create_validator(field), auto_dispose=False)
+                self._validation_observers.append(observer)
 
-                # otherwise ignore the rule
-                else:
-                    logger.warning(
-                        f'Rule {rules} ignored beacause for {field} field'
-                        f'{FormClass.__name__} has no attribute {rules}.'
-                    )
+        def _apply_validation_result(self, field: str, result: ValidationResult):
+            """Apply a (possibly async) field validation result"""
 
-            # 3. There are multiple rules for the field (FormFieldValidationRules)
-            elif isinstance(rules,list):
-                checks: List[bool] = []
-                for rule in rules:
-                    check: bool = True
-                    # FormClass Callable attribute (function)
-                    if isinstance(rule.validate_fn, str):
-                        if hasattr(self,rule.validate_fn):
-                            check = getattr(self,rule.validate_fn)(value)
-
-                        # otherwise ignore the rule
-                        else:
-                            logger.warning(
-                                f'Rule {rules} ignored for "{field}" field beacause '
-                                f'{FormClass.__name__} has no attribute {rules}.'
-                            )
-                    # Validation function (callable)
-                    elif callable(rule.validate_fn):
-                        check = rule.validate_fn(value)
-
-                    # Add rule message if rule fails
-                    if not check:
-                        errors.append(rule.err_message.format(field = field, value = value)) 
-
-                    # finally append validatio result
-                    checks.append(check)
-                is_valid = all(checks)
-            
-            if is_valid:
+            if result.is_valid:
                 self._form_errors.pop(field, None)
             else:
-                self._form_errors[field] = errors or f"Invalid {field} value"
-                if auto_validate:
+                # Single rule fields report a message, rule lists a list of them
+                if isinstance(validation_rules[field], list):
+                    self._form_errors[field] = list(result.errors)
+                else:
+                    self._form_errors[field] = f"Invalid {field} value"
+                if auto_validate and on_submit_failed:
                     self._call_handler(on_submit_failed, self.get_errors())
             
             # Update form validity if rx_is_valid exists
             if hasattr(self, 'rx_is_valid'):
                 self.rx_is_valid.value = self.is_valid()
             
-            logger.debug(f"Validated {field}: {is_valid}")
-            return is_valid
+            logger.debug(f"Validated {field}: {result.is_valid}")
+
+        def _validate_field(self, field: str) -> bool:
+            """
+            Validate a single field.
+            Returns False while async validators of the field are running.
+            """
+
+            result = self._validator.validate(field)
+            return result is not None and result.is_valid
 
         def _validate_all_fields(self) -> bool:
-            """Validate all form fields"""
+            """Validate all form fields, unchanged ones from cache"""
 
-            all_valid = True
-            for field in form_fields.keys():
-                if not self._validate_field(field):
-                    all_valid = False
-            return all_valid
+            return self._validator.validate_all()
 
-        def _handle_submit(self):
-            """Handle form submission in a reactive and extensible way."""
+        def _handle_submit(self, settled: bool = False):
+            """
+            Handle form submission in a reactive and extensible way.
+            When async validators are running, the submission waits for
+            them once and is then decided on their results (`settled`),
+            without validating again.
+            """
 
             try:
                 # Validation des champs
-                is_valid = self._validate_all_fields()
+                if settled:
+                    is_valid = self.is_valid()
+                else:
+                    is_valid = self._validate_all_fields()
+
+                    # Submit again once async validators are done
+                    if self._validator.pending:
+                        logger.debug("Waiting for async validators before submitting")
+                        self._validator.when_settled(
+                            lambda: self._handle_submit(settled = True)
+                        )
+                        return
 
                 if not is_valid:
                     logger.warning("Form submission failed due to validation errors")
@@ -787,6 +907,7 @@ def reactive_form(
         def will_unmount(self):
             """Cleanup form observers"""
 
+            self._validator.cancel()
             for observer in self._validation_observers:
                 observer.dispose()
             self._validation_observers.clear()
@@ -802,6 +923,7 @@ def reactive_form(
         # Inject methods
         FormClass.__init__ = __init__
         FormClass._setup_form_bindings = _setup_form_bindings
+        FormClass._apply_validation_result = _apply_validation_result
         FormClass._validate_field = _validate_field
         FormClass._validate_all_fields = _validate_all_fields
         FormClass._handle_submit = _handle_submit
@@ -813,6 +935,18 @@ def reactive_form(
     return decorator
 
 
+# SAME ITEM
+def _same_item(previous: Any, item: Any) -> bool:
+    """Whether a keyed list item is unchanged (identity or equality)"""
+
+    if previous is item:
+        return True
+    try:
+        return bool(previous == item)
+    except Exception:
+        return False
+
+
 ####
 ##      REACTIVE LIST WIDGET DECORATOR
 #####
@@ -820,7 +954,8 @@ def reactive_list(
     items_attr: str,
     item_builder: Callable[[Any, int], ft.Control],
     empty_builder: Optional[Callable[[], ft.Control]] = None,
-    animate_changes: bool = True
+    animate_changes: bool = True,
+    key_fn: Optional[Callable[[Any], Hashable]] = None
 ):
     """
     Creates a reactive list widget that automatically updates when items change.
@@ -830,6 +965,10 @@ def reactive_list(
         item_builder: Function to build each item widget
         empty_builder: Function to build empty state widget
         animate_changes: Whether to animate list changes
+        key_fn: Returns a stable key for an item. When set, the list is
+            reconciled by key: controls of unchanged items are reused
+            (and keep the index they were built with), only new or
+            changed items are built and stale controls are removed.
     
     Usage:
     ```python
@@ -860,6 +999,8 @@ def reactive_list(
             
             self._list_observer = None
             self._current_controls = []
+            self._showing_empty = False
+            self._keyed_controls: Dict[Hashable, Tuple[Any, ft.Control]] = {}
 
             # Setup a basic size animation
             if animate_changes:
@@ -872,11 +1013,133 @@ def reactive_list(
             if not isinstance(items_list, RxList):
                 raise TypeError(f"{items_attr} must be an RxList")
             
-            self._list_observer = items_list.listen(self._rebuild_list, auto_dispose=False)
+            self._list_observer = items_list.listen_changes(
+                self._apply_list_changes, 
+                auto_dispose=False
+            )
             
             # Initial build
             self._rebuild_list()
 
+        def _apply_list_changes(self, changes: List[ListChange]):
+            """
+            Apply structured list changes.
+            Appended and replaced items only build their own controls,
+            any other change falls back to a full rebuild since it shifts
+            the index passed to item_builder.
+            """
+            if not self._is_mounted:
+                return
+            
+            # Keyed lists are reconciled as a whole, replaced items 
+            # are rebuilt even when they were mutated in place
+            if key_fn is not None:
+                self._reconcile_list({
+                    key_fn(change.item) 
+                    for change in changes if isinstance(change, Replace)
+                })
+                return
+
+            items_list = getattr(self, items_attr)
+            for change in changes:
+                if self._showing_empty:
+                    break
+
+                if (
+                    isinstance(change, Insert) 
+                    and change.index == len(self._current_controls)
+                ):
+                    for offset, item in enumerate(change.items):
+                        control = item_builder(item, change.index + offset)
+                        self.controls.append(control)
+                        self._current_controls.append(control)
+                
+                elif (
+                    isinstance(change, Replace) 
+                    and change.index < len(self._current_controls)
+                ):
+                    control = item_builder(change.item, change.index)
+                    self.controls[change.index] = control
+                    self._current_controls[change.index] = control
+
+                else:
+                    break
+
+            # Some change cannot be applied incrementally
+            else:
+                if len(self._current_controls) == len(items_list):
+                    request_update(self)
+                    logger.debug(f"Applied {len(changes)} list changes")
+                    return
+            
+            self._rebuild_list()
+
+        def _reconcile_list(self, changed_keys: Optional[Set[Hashable]] = None):
+            """
+            Keyed diff of the list controls.
+            Reuses the control of every key whose item is unchanged,
+            builds controls for new or changed items (and `changed_keys`)
+            only, drops stale ones and reorders the rest, then requests 
+            a single update.
+            """
+            if not self._is_mounted:
+                return
+
+            items = getattr(self, items_attr).value
+            if not items:
+                self._rebuild_list()
+                return
+            
+            previous = self._keyed_controls
+            keyed: Dict[Hashable, Tuple[Any, ft.Control]] = {}
+            controls = []
+            built = 0
+
+            for index, item in enumerate(items):
+                key = key_fn(item)
+
+                if key in keyed:
+                    logger.warning(
+                        f"Duplicate key {key!r} in {items_attr}, "
+                        "its controls will not be reused"
+                    )
+                    controls.append(item_builder(item, index))
+                    built += 1
+                    continue
+
+                entry = previous.get(key)
+                if (
+                    entry is not None 
+                    and not (changed_keys and key in changed_keys)
+                    and _same_item(entry[0], item)
+                ):
+                    control = entry[1]
+                else:
+                    control = item_builder(item, index)
+                    built += 1
+
+                keyed[key] = (item, control)
+                controls.append(control)
+
+            self._keyed_controls = keyed
+
+            # Nothing moved, nothing rebuilt
+            if (
+                not self._showing_empty
+                and len(controls) == len(self.controls)
+                and all(a is b for a, b in zip(controls, self.controls))
+            ):
+                return
+            
+            self.controls[:] = controls
+            self._current_controls = list(controls)
+            self._showing_empty = False
+            request_update(self)
+
+            logger.debug(
+                f"Reconciled list with {len(items)} items ({built} built)"
+            )
+
         def _rebuild_list(self):
             """Rebuild the list controls"""
             if not self._is_mounted:
@@ -884,16 +1147,23 @@ def reactive_list(
             
             items_list = getattr(self, items_attr)
             items = items_list.value
+
+            if key_fn is not None and items:
+                self._reconcile_list()
+                return
             
             # Clear current controls
             self.controls.clear()
             self._current_controls.clear()
+            self._keyed_controls = {}
+            self._showing_empty = False
             
             # Build new controls
             if not items and empty_builder:
                 empty_control = empty_builder()
                 self.controls.append(empty_control)
                 self._current_controls.append(empty_control)
+                self._showing_empty = True
             else:
                 for index, item in enumerate(items):
                     control = item_builder(item, index)
@@ -901,7 +1171,7 @@ def reactive_list(
                     self._current_controls.append(control)
             
             # Update the widget
-            self.update()
+            request_update(self)
             
             logger.debug(f"Rebuilt list with {len(items)} items")
 
@@ -933,6 +1203,8 @@ def reactive_list(
         ListClass.__init__ = __init__
         ListClass._setup_list_binding = _setup_list_binding
         ListClass._rebuild_list = _rebuild_list
+        ListClass._apply_list_changes = _apply_list_changes
+        ListClass._reconcile_list = _reconcile_list
         ListClass.did_mount = did_mount
         ListClass.will_unmount = will_unmount
 
@@ -942,24 +1214,308 @@ def reactive_list(
 
 
 ####
-##      REACTIVE STATE MACHINE DECORATOR
+##      VIRTUALIZED LIST WIDGET DECORATOR
+#####
+def reactive_virtual_list(
+    items_attr: str,
+    item_builder: Callable[[Any, int], ft.Control],
+    item_extent: float,
+    item_updater: Optional[Callable[[ft.Control, Any, int], None]] = None,
+    empty_builder: Optional[Callable[[], ft.Control]] = None,
+    overscan: int = 10,
+    viewport_extent: float = 800,
+    pool_size: int = 50
+):
+    """
+    Creates a windowed reactive list that only builds controls for the
+    visible items (plus `overscan` items on each side). The hidden part
+    of the list is replaced by two spacers sized from `item_extent`, and
+    the window follows the scroll offset reported by `on_scroll`.
+    
+    Args:
+        items_attr: Name of the RxList attribute
+        item_builder: Function to build each item widget
+        item_extent: Fixed (or estimated) height of an item, in pixels
+        item_updater: Function rebinding an existing item control to
+            another item, `(control, item, index)`. When provided, controls
+            leaving the window are pooled and recycled instead of rebuilt.
+        empty_builder: Function to build empty state widget
+        overscan: Number of items built before and after the visible range
+        viewport_extent: Viewport height used until the first scroll event
+        pool_size: Maximum number of recycled controls kept aside
+    
+    Usage:
+    ```python
+    @reactive_virtual_list(
+        items_attr='rx_logs',
+        item_builder=lambda line, index: ft.Text(line, height=20),
+        item_updater=lambda control, line, index: setattr(control, 'value', line),
+        item_extent=20
+    )
+    class LogView(ft.ListView):
+        def __init__(self):
+            self.rx_logs = RxList([f"line {i}" for i in range(100_000)])
+            super().__init__(expand=True)
+    ```
+    """
+
+    if item_extent <= 0:
+        raise ValueError("item_extent must be a positive number")
+    
+    def decorator(ListClass):
+        original_init = ListClass.__init__
+        original_did_mount = getattr(ListClass, 'did_mount', None)
+        
+        # Add FletXWidget as parent
+        ListClass.__bases__ = (*ListClass.__bases__, FletXWidget)
+        
+        @wraps(original_init)
+        def __init__(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            FletXWidget.__init__(self)
+            
+            self._list_observer = None
+            self._rows: Dict[int, Tuple[Any, ft.Control]] = {}
+            self._row_pool: List[ft.Control] = []
+            self._window: Tuple[int, int] = (0, 0)
+            self._scroll_offset = 0.0
+            self._viewport_extent = viewport_extent
+            self._top_spacer = ft.Container(height=0)
+            self._bottom_spacer = ft.Container(height=0)
+
+            # Follow the scroll offset, keeping any user handler
+            self._user_on_scroll = self.on_scroll
+            self.on_scroll = self._handle_scroll
+
+        def _setup_list_binding(self):
+            """Setup reactive binding for list items"""
+            items_list = getattr(self, items_attr)
+            
+            if not isinstance(items_list, RxList):
+                raise TypeError(f"{items_attr} must be an RxList")
+            
+            self._list_observer = items_list.listen_changes(
+                lambda changes: self._render_window(force=True), 
+                auto_dispose=False
+            )
+            
+            # Initial build
+            self._render_window(force=True)
+
+        def _handle_scroll(self, e):
+            """Moves the window along with the scroll offset"""
+
+            self._scroll_offset = max(0.0, e.pixels or 0.0)
+            if e.viewport_dimension:
+                self._viewport_extent = e.viewport_dimension
+            
+            self._render_window()
+
+            if self._user_on_scroll:
+                self._user_on_scroll(e)
+
+        def _get_window(self, count: int) -> Tuple[int, int]:
+            """Index range of the items to build"""
+
+            first = int(self._scroll_offset // item_extent)
+            last = int(
+                (self._scroll_offset + self._viewport_extent) // item_extent
+            ) + 1
+            return (
+                max(0, min(first - overscan, count)),
+                min(count, last + overscan)
+            )
+
+        def _acquire_row(self, item: Any, index: int) -> ft.Control:
+            """Gets a control for an item, recycled from the pool if possible"""
+
+            if item_updater and self._row_pool:
+                control = self._row_pool.pop()
+                item_updater(control, item, index)
+                return control
+            return item_builder(item, index)
+
+        def _release_row(self, control: ft.Control):
+            """Keeps a control leaving the window for later reuse"""
+
+            if item_updater and len(self._row_pool) < pool_size:
+                self._row_pool.append(control)
+
+        def _render_window(self, force: bool = False):
+            """
+            Renders the items of the current window.
+            Rows that are still visible and whose item did not change are
+            kept as is, the others are recycled or built.
+            """
+            if not self._is_mounted:
+                return
+            
+            items = getattr(self, items_attr).value
+            count = len(items)
+            start, end = self._get_window(count)
+
+            if not force and (start, end) == self._window:
+                return
+            
+            previous = self._rows
+            rows: Dict[int, Tuple[Any, ft.Control]] = {}
+
+            # Release rows leaving the window first, so they can be recycled
+            for index, (_, control) in previous.items():
+                if not start <= index < end:
+                    self._release_row(control)
+
+            for index in range(start, end):
+                item = items[index]
+                entry = previous.get(index)
+
+                if entry is None:
+                    control = self._acquire_row(item, index)
+                elif _same_item(entry[0], item):
+                    control = entry[1]
+                elif item_updater:
+                    control = entry[1]
+                    item_updater(control, item, index)
+                else:
+                    control = item_builder(item, index)
+                
+                rows[index] = (item, control)
+            
+            self._rows = rows
+            self._window = (start, end)
+
+            if not count and empty_builder:
+                self.controls[:] = [empty_builder()]
+            else:
+                self._top_spacer.height = start * item_extent
+                self._bottom_spacer.height = (count - end) * item_extent
+                self.controls[:] = [
+                    self._top_spacer,
+                    *(rows[index][1] for index in range(start, end)),
+                    self._bottom_spacer
+                ]
+            
+            request_update(self)
+
+            logger.debug(
+                f"Rendered items {start}-{end} of {count} "
+                f"({len(self._row_pool)} pooled)"
+            )
+
+        def did_mount(self):
+            """Enhanced did_mount with lifecycle callbacks"""
+
+            if original_did_mount:
+                original_did_mount(self)
+
+            # Call FletXWidget did mount
+            FletXWidget.did_mount(self)
+
+            # Setup list binding, once the widget is mounted
+            self._setup_list_binding()
+            
+            logger.debug(f"Mounted virtual List control {ListClass.__name__}")
+
+        def will_unmount(self):
+            """Cleanup list observer and recycled controls"""
+            if self._list_observer:
+                self._list_observer.dispose()
+                self._list_observer = None
+            
+            self._rows.clear()
+            self._row_pool.clear()
+            
+            # Call Super's will_mount method if any
+            super(ListClass,self).will_unmount()
+            FletXWidget.will_unmount(self)
+
+        # Inject methods
+        ListClass.__init__ = __init__
+        ListClass._setup_list_binding = _setup_list_binding
+        ListClass._handle_scroll = _handle_scroll
+        ListClass._get_window = _get_window
+        ListClass._acquire_row = _acquire_row
+        ListClass._release_row = _release_row
+        ListClass._render_window = _render_window
+        ListClass.did_mount = did_mount
+        ListClass.will_unmount = will_unmount
+
+        return ListClass
+    
+    return decorator
+
+
 ####
+##      STATE TRANSITION RECORD
+#####
+@dataclass(frozen=True)
+class StateTransition:
+    """A state machine transition, as recorded in the transition log"""
+
+    from_state: Enum
+    to_state: Enum
+    action: Optional[str]
+    timestamp: float
+
+
+####
+##      STATE REACTIVE
+#####
+class StateReactive(Reactive[Enum]):
+    """
+    Reactive holding a state machine state.
+    Written values (states or state values) are stored as the state 
+    enum, and the state held before the last change is kept.
+    """
+
+    __slots__ = ('_resolve_state', 'previous')
+
+    def __init__(self, initial_state: Enum, resolve_state: Callable[[Any], Optional[Enum]]):
+        super().__init__(initial_state, equals = 'identity')
+        self._resolve_state = resolve_state
+        self.previous: Optional[Enum] = None
+
+    @property
+    def value(self) -> Enum:
+        return Reactive.value.fget(self)
+    
+    @value.setter
+    def value(self, new_value: Any):
+        state = self._resolve_state(new_value)
+        if state is None:
+            raise ValueError(f"Invalid state: {new_value!r}")
+        
+        if state is not self._value:
+            self.previous = self._value
+            Reactive.value.fset(self, state)
+
+
+####
+##      REACTIVE STATE MACHINE DECORATOR
+#####
 def reactive_state_machine(
     states: Enum,
     initial_state: Enum,
     transitions: Dict[Tuple[Enum, str], Enum],
     state_attr: str = 'rx_state',
-    on_state_change: Optional[Callable[[Enum, Enum], None]] = None
+    on_state_change: Optional[Callable[[Enum, Enum], None]] = None,
+    history_size: int = 0
 ):
     """
     Creates a reactive state machine for widgets.
+    The machine is compiled once into lookup tables (state values to
+    states, (state, action) to target state, actions per state), and
+    the state reactive (a StateReactive) holds the state enum itself,
+    direct writes of state values included.
     
     Args:
         states: Enum defining possible states
         initial_state: Initial state
         transitions: Valid transitions {(from_state, action): to_state}
         state_attr: Name of the reactive state attribute
-        on_state_change: Callback when state changes
+        on_state_change: Callback when state changes, `(old, new)`
+        history_size: Number of transitions kept in the transition log
+            (see `get_transition_log`), disabled when 0
     
     Usage:
     ```python
@@ -979,13 +1535,39 @@ def reactive_state_machine(
             (LoadingState.SUCCESS, 'reset'): LoadingState.IDLE,
             (LoadingState.ERROR, 'retry'): LoadingState.LOADING,
         },
-        on_state_change=lambda old, new: print(f"State: {old} -> {new}")
+        on_state_change=lambda old, new: print(f"State: {old} -> {new}"),
+        history_size=20
     )
     class LoadingWidget(ft.Container):
         def __init__(self):
             super().__init__()
     ```
     """
+
+    # Compile lookup tables
+    state_by_value: Dict[Any, Enum] = {state.value: state for state in states}
+    transition_table: Dict[Tuple[Enum, str], Enum] = {}
+    actions_by_state: Dict[Enum, Tuple[str, ...]] = {state: () for state in states}
+
+    if initial_state not in actions_by_state:
+        raise ValueError(f"Initial state {initial_state} is not a {states.__name__}")
+
+    for (from_state, action), to_state in transitions.items():
+        for state in (from_state, to_state):
+            if state not in actions_by_state:
+                raise ValueError(
+                    f"Invalid transition {from_state} + {action} -> {to_state}: "
+                    f"{state} is not a {states.__name__}"
+                )
+        transition_table[(from_state, action)] = to_state
+        actions_by_state[from_state] += (action,)
+
+    def resolve_state(value: Any) -> Optional[Enum]:
+        """State of a reactive value (a state or a state value)"""
+
+        if isinstance(value, states):
+            return value
+        return state_by_value.get(value)
     
     def decorator(WidgetClass):
         original_init = WidgetClass.__init__
@@ -995,9 +1577,14 @@ def reactive_state_machine(
         
         @wraps(original_init)
         def __init__(self, *args, **kwargs):
-            # Initialize state reactive
-            state_reactive = RxStr(initial_state.value)
+            # Initialize state reactive, states are singletons
+            state_reactive = StateReactive(initial_state, resolve_state)
             setattr(self, state_attr, state_reactive)
+
+            # Last state reported to on_state_change and the log
+            self._notified_state: Enum = initial_state
+            self._pending_action: Optional[str] = None
+            self._transition_log = deque(maxlen=history_size) if history_size else None
             
             original_init(self, *args, **kwargs)
             FletXWidget.__init__(self)
@@ -1009,63 +1596,65 @@ def reactive_state_machine(
             """Setup state machine reactive binding"""
             state_reactive = getattr(self, state_attr)
             
-            if on_state_change:
-                def state_change_handler():
-                    current_state_value = state_reactive.value
-                    current_state = next(
-                        (s for s in states if s.value == current_state_value),
-                        None
+            def state_change_handler():
+                new_state = state_reactive.value
+                action, self._pending_action = self._pending_action, None
+                
+                old_state = self._notified_state
+                if new_state is old_state:
+                    return
+                
+                self._notified_state = new_state
+
+                if self._transition_log is not None:
+                    self._transition_log.append(
+                        StateTransition(old_state, new_state, action, time.monotonic())
                     )
-                    if current_state:
-                        on_state_change(None, current_state)  # TODO: Track previous state
                 
-                self._state_observer = state_reactive.listen(
-                    state_change_handler, 
-                    auto_dispose=False
-                )
+                if on_state_change:
+                    on_state_change(old_state, new_state)
+            
+            self._state_observer = state_reactive.listen(
+                state_change_handler, 
+                auto_dispose=False
+            )
 
         def transition(self, action: str) -> bool:
             """Attempt to transition to a new state"""
-            state_reactive = getattr(self, state_attr)
-            current_state_value = state_reactive.value
-            current_state = next(
-                (s for s in states if s.value == current_state_value),
-                None
-            )
-            
-            if not current_state:
-                logger.error(f"Invalid current state: {current_state_value}")
-                return False
+
+            # The stored state, observers may not have been notified yet
+            current_state = getattr(self, state_attr)._value
+            new_state = transition_table.get((current_state, action))
             
-            transition_key = (current_state, action)
-            if transition_key not in transitions:
+            if new_state is None:
                 logger.warning(f"Invalid transition: {current_state} + {action}")
                 return False
             
-            new_state = transitions[transition_key]
-            old_state = current_state
+            self._pending_action = action
+            getattr(self, state_attr).value = new_state
             
-            state_reactive.value = new_state.value
-            
-            if on_state_change:
-                on_state_change(old_state, new_state)
-            
-            logger.info(f"State transition: {old_state} -> {new_state} (action: {action})")
+            logger.debug(f"State transition: {current_state} -> {new_state} (action: {action})")
             return True
 
         def get_current_state(self) -> Enum:
             """Get current state as enum"""
-            state_reactive = getattr(self, state_attr)
-            current_state_value = state_reactive.value
-            return next(
-                (s for s in states if s.value == current_state_value),
-                initial_state
-            )
+            return getattr(self, state_attr).value
+
+        def get_previous_state(self) -> Optional[Enum]:
+            """Get the state before the last transition"""
+            return getattr(self, state_attr).previous
 
         def can_transition(self, action: str) -> bool:
             """Check if transition is possible"""
-            current_state = self.get_current_state()
-            return (current_state, action) in transitions
+            return (self.get_current_state(), action) in transition_table
+
+        def get_available_actions(self) -> Tuple[str, ...]:
+            """Actions allowed from the current state"""
+            return actions_by_state[self.get_current_state()]
+
+        def get_transition_log(self) -> List[StateTransition]:
+            """Recorded transitions, oldest first (empty without history_size)"""
+            return list(self._transition_log or ())
 
         def will_unmount(self):
             """Cleanup state machine observer"""
@@ -1073,17 +1662,20 @@ def reactive_state_machine(
                 self._state_observer.dispose()
                 self._state_observer = None
             
-            if hasattr(super(), 'will_unmount'):
-                super().will_unmount()
+            if hasattr(super(WidgetClass, self), 'will_unmount'):
+                super(WidgetClass, self).will_unmount()
 
         # Inject methods
         WidgetClass.__init__ = __init__
         WidgetClass._setup_state_machine = _setup_state_machine
         WidgetClass.transition = transition
         WidgetClass.get_current_state = get_current_state
+        WidgetClass.get_previous_state = get_previous_state
         WidgetClass.can_transition = can_transition
+        WidgetClass.get_available_actions = get_available_actions
+        WidgetClass.get_transition_log = get_transition_log
         WidgetClass.will_unmount = will_unmount
 
         return WidgetClass
     
-    return decorator
\ No newline at end of file
+    return decorator
@@ -3,7 +3,7 @@ from pathlib import Path
 from types import ModuleType
 import flet
 import asyncio
-from typing import Callable, Awaitable, Any, Union
+from typing import Callable, Awaitable, Any, Optional, Union
 from importlib import import_module
 
 from fletx.utils.context import AppContext
@@ -51,6 +51,40 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
     """
     return AppContext.get_data('event_loop')
 
+# GET RUNNING EVENT LOOP
+def get_running_event_loop(
+    loop: Optional[asyncio.AbstractEventLoop] = None
+) -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Returns `loop` (the app event loop by default) if it is running,
+    None otherwise.
+    """
+
+    loop = loop or get_event_loop()
+    if loop is not None and not loop.is_closed() and loop.is_running():
+        return loop
+    return None
+
+# MAKE CALL KEY
+def make_call_key(args: tuple, kwargs: dict) -> tuple:
+    """
+    Builds a hashable key from call arguments.
+    Hashable arguments are compared by value (and type),
+    unhashable ones by identity.
+    """
+
+    def part(value: Any):
+        try:
+            hash(value)
+        except TypeError:
+            return ('id', id(value))
+        return (type(value), value)
+    
+    return (
+        tuple(part(arg) for arg in args),
+        tuple((name, part(value)) for name, value in sorted(kwargs.items()))
+    )
+
 # RUN ASYNC
 def run_async(callback: Callable[[], Awaitable[Any]]) -> Any:
     """
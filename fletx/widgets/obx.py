@@ -6,15 +6,21 @@ import weakref, time
 from uuid import uuid4
 from typing import (
     Set, Union, List, Callable, Optional, Any,
-    Type, Dict
+    Type, Dict, Tuple
 )
 from functools import wraps
 
 import flet as ft
 from flet import Control, Ref
-from fletx.core.state import Reactive, ReactiveDependencyTracker
-from fletx.utils import get_logger, get_page
+from fletx.core.state import (
+    Reactive, ReactiveDependencyTracker, Observer, resolve_equality
+)
+from fletx.core.scheduling import (
+    request_update, RebuildScheduler, RebuildPriority
+)
+from fletx.utils import get_logger
 
+_MISSING = object()
 
 ####
 ##      OBX CONTROLLER
@@ -25,12 +31,22 @@ class ObxController:
     def __init__(self):
         self._widget_ref: Optional[Ref] = None
         self._uid: Optional[str] = None
-        self._dependencies: Set[Reactive] = set()
+        self._dependencies: Dict[Reactive, Observer] = {}
         self._builder: Optional[Callable] = None
+        self._select: Optional[Callable[[], Any]] = None
+        self._select_equals: Callable[[Any, Any], bool] = resolve_equality(None)
+        self._selected: Any = _MISSING
+        self._priority: Optional[RebuildPriority] = None
         # self._current_uid = None 
         self._logger = get_logger("FletX.ObxController")
         self._is_building = False
 
+    # Copy plans cache, per (source, target) control classes
+    _copy_plans: Dict[Tuple[type, type], Tuple[str, ...]] = {}
+
+    # Attributes never copied from the rebuilt widget
+    _excluded_attrs = frozenset({'parent', 'page', 'ref'})
+
     @property
     def logger(self):
         if not self._logger:
@@ -47,6 +63,58 @@ class ObxController:
 
         self._builder = builder_fn
 
+    def set_priority(self, priority: Optional[RebuildPriority]):
+        """
+        Set the rebuild priority lane. With a priority, rebuilds are 
+        deferred to the event loop (see RebuildScheduler) instead of
+        running inside the reactive write.
+        """
+
+        self._priority = priority
+
+    def set_selector(
+        self, 
+        select_fn: Callable[[], Any], 
+        equals: Union[str, Callable[[Any, Any], bool], None] = None
+    ):
+        """
+        Set a selector function. Only the reactives read by the selector
+        are tracked, and the builder only runs when the selected value
+        changes (according to `equals`).
+        """
+
+        self._select = select_fn
+        self._select_equals = resolve_equality(equals)
+        self._selected = _MISSING
+
+    def build(self) -> Control:
+        """Run the builder function, tracking its dependencies"""
+
+        if self._select is None:
+            with ObserverContext(self):
+                return self._builder()
+        
+        # Dependencies come from the selector only
+        with ObserverContext(self):
+            self._selected = self._select()
+        content, _ = ReactiveDependencyTracker.track(self._builder)
+        return content
+
+    def _selection_changed(self) -> bool:
+        """Evaluate the selector, whether its value changed"""
+
+        with ObserverContext(self):
+            selected = self._select()
+        
+        if (
+            self._selected is not _MISSING 
+            and self._select_equals(self._selected, selected)
+        ):
+            return False
+        
+        self._selected = selected
+        return True
+
     def set_widget_ref(self, widget_ref: Ref):
         """Set the widget reference"""
 
@@ -56,12 +124,30 @@ class ObxController:
         """Add a reactive object as dependency"""
 
         if reactive_obj not in self._dependencies:
-            # Subscribe to rebuild on changes
-            reactive_obj.listen(self._rebuild, auto_dispose=True)
-            # Add to dependencies list
-            self._dependencies.add(reactive_obj)
+            # Subscribe to rebuild on changes, without keeping
+            # a discarded controller alive
+            self._dependencies[reactive_obj] = reactive_obj.listen(
+                self._on_dependency_changed, auto_dispose=True, weak=True
+            )
             self.logger.debug(f"Added dependency: {reactive_obj}")
 
+    def prune_dependencies(self, active: Set[Reactive]):
+        """Unsubscribe from the dependencies no longer read by the builder"""
+
+        for reactive_obj in [
+            dep for dep in self._dependencies if dep not in active
+        ]:
+            self._dependencies.pop(reactive_obj).dispose()
+            self.logger.debug(f"Removed dependency: {reactive_obj}")
+
+    def _on_dependency_changed(self):
+        """Rebuild now, or schedule the rebuild in its priority lane"""
+
+        if self._priority is None:
+            self._rebuild()
+        else:
+            RebuildScheduler.schedule(self._rebuild, self._priority)
+
     def _rebuild(self):
         """Rebuild the widget when dependencies change"""
 
@@ -82,6 +168,11 @@ class ObxController:
         try:
             self._is_building = True
 
+            # Skip the builder if the selected value is unchanged
+            if self._select is not None and not self._selection_changed():
+                self.logger.debug("Skipping rebuild - selection unchanged")
+                return
+
             preserved_attrs = {
                 'ref': self._widget_ref,
                 '_Control__uid': current_widget.uid,
@@ -91,8 +182,7 @@ class ObxController:
             }
             
             # Track dependencies during rebuild
-            with ObserverContext(self):
-                new_content = self._builder()
+            new_content = self.build()
             
             # For other widget types, try to copy properties
             self._copy_widget_properties(new_content, current_widget)
@@ -102,9 +192,9 @@ class ObxController:
                 if hasattr(current_widget, attr):
                     setattr(current_widget, attr, value)
             
-            # Trigger UI update
+            # Trigger UI update (coalesced with the next frame)
             if current_widget.page:
-                current_widget.update()
+                request_update(current_widget)
                 
             self.logger.debug("Widget rebuilt successfully")
             
@@ -113,30 +203,88 @@ class ObxController:
         finally:
             self._is_building = False
 
+    @classmethod
+    def _get_copy_plan(
+        cls,
+        source_type: Type[Control],
+        target_type: Type[Control]
+    ) -> Tuple[str, ...]:
+        """
+        Returns the names of the properties that can be copied from
+        `source_type` to `target_type` instances: public class properties
+        having a setter on both sides. Plans are computed once per
+        (source, target) class pair.
+        """
+
+        key = (source_type, target_type)
+        plan = cls._copy_plans.get(key)
+
+        if plan is None:
+            names = []
+            for name in dir(source_type):
+                if name.startswith('_') or name in cls._excluded_attrs:
+                    continue
+
+                source_attr = getattr(source_type, name, None)
+                target_attr = getattr(target_type, name, None)
+                if (
+                    isinstance(source_attr, property)
+                    and source_attr.fset is not None
+                    and isinstance(target_attr, property)
+                    and target_attr.fset is not None
+                ):
+                    names.append(name)
+
+            plan = tuple(names)
+            cls._copy_plans[key] = plan
+
+        return plan
+
     def _copy_widget_properties(
         self, 
         source: Control, 
         target: Control
     ):
-        """Copy properties from source widget to target widget"""
+        """
+        Copy properties from source widget to target widget.
+        Only values that differ from the target ones are assigned,
+        so unchanged properties do not end up in the update diff.
+        """
 
-        for attr_name in dir(source):
-            if not attr_name.startswith('_') and hasattr(target, attr_name):
-                try:
-                    attr_value = getattr(source, attr_name)
-                    if not callable(attr_value):
-                        setattr(target, attr_name, attr_value)
-                except (AttributeError, TypeError):
+        names = list(self._get_copy_plan(type(source), type(target)))
+
+        # Plain public instance attributes (custom controls)
+        names.extend(
+            name for name in vars(source)
+            if not name.startswith('_') 
+            and name not in self._excluded_attrs
+            and hasattr(target, name)
+        )
+
+        for attr_name in names:
+            try:
+                attr_value = getattr(source, attr_name)
+                if callable(attr_value):
+                    continue
+
+                current_value = getattr(target, attr_name, _MISSING)
+                if current_value is attr_value:
                     continue
+                try:
+                    if current_value == attr_value:
+                        continue
+                except Exception:
+                    pass
+
+                setattr(target, attr_name, attr_value)
+            except (AttributeError, TypeError):
+                continue
 
     def dispose(self):
         """Clean up resources"""
 
-        for dep in list(self._dependencies):
-            try:
-                dep._remove_observer(self)
-            except:
-                pass
+        for observer in self._dependencies.values():
+            observer.dispose()
         self._dependencies.clear()
         self._widget_ref = None
         self._builder = None
@@ -146,33 +294,52 @@ class ObxController:
 ##      OBSERVER CONTEXT
 #####
 class ObserverContext:
-    """Context manager for tracking reactive dependencies"""
+    """
+    Context manager for tracking reactive dependencies.
+    Collects the reactives read within the context, subscribes the
+    controller to the new ones and, on a successful exit, unsubscribes
+    it from the ones that were not read this time. The previous tracker
+    is restored on exit, so contexts can be nested.
+    """
 
     def __init__(self, controller: ObxController):
         self.controller: ObxController = controller
         self._previous_tracker = None
+        self._tracker: Optional[ObxDependencyTracker] = None
 
     def __enter__(self):
         # Save previous tracker
         self._previous_tracker = ReactiveDependencyTracker._current_tracker
         
-        # Create a custom tracker that adds dependencies to the controller
-        class CustomTracker:
-            def __init__(self, controller: ObxController):
-                self.controller = controller
-                self.dependencies = set()
-            
-            def add(self, reactive_obj):
-                self.dependencies.add(reactive_obj)
-                self.controller.add_dependency(reactive_obj)
-        
-        ReactiveDependencyTracker._current_tracker = CustomTracker(self.controller)
+        self._tracker = ObxDependencyTracker(self.controller)
+        ReactiveDependencyTracker._current_tracker = self._tracker
         return self.controller
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restore previous tracker when exiting Obx Context"""
-        # Restore previous tracker
-        # ReactiveDependencyTracker._current_tracker = self._previous_tracker
+
+        ReactiveDependencyTracker._current_tracker = self._previous_tracker
+
+        # Keep the previous subscriptions if the builder failed midway
+        if exc_type is None:
+            self.controller.prune_dependencies(self._tracker.dependencies)
+        self._tracker = None
+
+
+# OBX DEPENDENCY TRACKER
+class ObxDependencyTracker:
+    """Tracker adding the reactives read to an Obx controller"""
+
+    __slots__ = ('controller', 'dependencies')
+
+    def __init__(self, controller: ObxController):
+        self.controller = controller
+        self.dependencies: Set[Reactive] = set()
+    
+    def add(self, reactive_obj: Reactive):
+        if reactive_obj not in self.dependencies:
+            self.dependencies.add(reactive_obj)
+            self.controller.add_dependency(reactive_obj)
 
 
 ####
@@ -187,18 +354,38 @@ class Obx:
 
     def __init__(
         self,
-        builder_fn: Callable[[], Control]
+        builder_fn: Callable[[], Control],
+        select: Optional[Callable[[], Any]] = None,
+        equals: Union[str, Callable[[Any, Any], bool], None] = None,
+        priority: Optional[RebuildPriority] = None
     ):
+        """
+        Args:
+            builder_fn: Function building the wrapped control
+            select: Optional selector projecting the state the control
+                depends on. When set, only the selector's dependencies
+                are tracked and the builder only runs when the selected
+                value changes.
+            equals: Equality strategy comparing selected values
+                ('identity', 'shallow', 'deep' or a callable)
+            priority: When set, rebuilds are deferred to the event loop
+                in this priority lane instead of running synchronously
+        """
         self.builder_fn = builder_fn
         self.controller = ObxController()
         self._widget = None
         self.ref: Optional[Ref] = None
         self._final_uid = f"obx_{id(self)}"  
         self._is_mounted = False
+        self._is_disposed = False
+        self._dispose_callbacks: List[Callable[[], None]] = []
         self._logger = get_logger("FletX.Obx")
         
         # Set up controller
         self.controller.set_builder(builder_fn)
+        if select is not None:
+            self.controller.set_selector(select, equals)
+        self.controller.set_priority(priority)
 
     @property
     def logger(self):
@@ -210,12 +397,20 @@ class Obx:
     def widget(self) -> Control:
         """Get the actual widget"""
         return self._widget
+    
+    @property
+    def is_disposed(self) -> bool:
+        """Whether the wrapper has been disposed"""
+        return self._is_disposed
+    
+    def on_dispose(self, callback: Callable[[], None]):
+        """Registers a callback called when the wrapper is disposed"""
+        self._dispose_callbacks.append(callback)
 
     def _build_widget(self):
         """Build the widget with dependency tracking"""
         try:
-            with ObserverContext(self.controller):
-                self._widget = self.builder_fn()
+            self._widget = self.controller.build()
             
             # Set up reference for the actual widget
             if not hasattr(self._widget, 'ref') or self._widget.ref is None:
@@ -273,6 +468,14 @@ class Obx:
     def dispose(self):
         """Clean up resources when wrapper is disposed"""
 
+        self._is_disposed = True
+        callbacks, self._dispose_callbacks = self._dispose_callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in dispose callback: {e}", exc_info=True)
+
         if hasattr(self, 'controller') and self.controller:
             self.controller.dispose()
         
@@ -0,0 +1,17 @@
+import asyncio
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def loop():
+    """An event loop running on a background thread"""
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(2)
+    loop.close()
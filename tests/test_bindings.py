@@ -0,0 +1,100 @@
+import time
+
+import flet as ft
+from fletx.core import (
+    RxStr, BindingConfig, BindingType, FrameScheduler, TrailingCall
+)
+from fletx.decorators.widgets import reactive_control
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def make_search_box(write_interval_ms=None):
+    @reactive_control(
+        bindings={
+            'value': BindingConfig(
+                reactive_attr='rx_query',
+                binding_type=BindingType.TWO_WAY,
+                write_interval_ms=write_interval_ms
+            )
+        }
+    )
+    class SearchBox(ft.TextField):
+        def __init__(self):
+            self.rx_query = RxStr("")
+            super().__init__()
+
+    box = SearchBox()
+    box._is_mounted = True
+    return box
+
+
+def type_text(box, text):
+    for end in range(1, len(text) + 1):
+        box.value = text[:end]
+        box.on_change(None)
+
+
+def test_trailing_call_reuses_timer_and_keeps_last_call():
+    calls = []
+    call = TrailingCall(lambda: calls.append(time.monotonic()), 20)
+    for _ in range(10):
+        call.trigger()
+    assert call.pending
+    assert wait_for(lambda: calls)
+    time.sleep(0.05)
+    assert len(calls) == 1
+
+
+def test_trailing_call_flush_and_cancel():
+    calls = []
+    call = TrailingCall(lambda: calls.append(1), 1000)
+    call.trigger()
+    call.flush()
+    assert calls == [1]
+    call.trigger()
+    call.cancel()
+    call.flush()
+    assert calls == [1]
+
+
+def test_two_way_writes_are_coalesced_with_trailing_value():
+    box = make_search_box(write_interval_ms=20)
+    writes = []
+    box.rx_query.listen(lambda: writes.append(box.rx_query.value))
+
+    type_text(box, "fletx")
+    assert writes == []
+    assert wait_for(lambda: writes)
+    assert writes == ["fletx"]
+
+
+def test_two_way_write_does_not_echo_to_widget():
+    box = make_search_box()
+    FrameScheduler.flush()
+
+    type_text(box, "ab")
+    assert box.rx_query.value == "ab"
+    assert box not in FrameScheduler._dirty
+
+    # Writes from code still reach the widget
+    box.rx_query.value = "code"
+    assert box.value == "code"
+    assert box in FrameScheduler._dirty
+    FrameScheduler.flush()
+
+
+def test_pending_write_is_flushed_on_blur_and_unmount():
+    box = make_search_box(write_interval_ms=10_000)
+    type_text(box, "abc")
+    box.on_blur(None)
+    assert box.rx_query.value == "abc"
+
+    type_text(box, "abcd")
+    box.will_unmount()
+    assert box.rx_query.value == "abcd"
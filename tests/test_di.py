@@ -6,7 +6,10 @@ import pytest
 
 
 def _load_di_and_errors():
-    # Stub minimal 'fletx.utils' and 'fletx.utils.exceptions' to avoid heavy deps
+    # Stub minimal 'fletx.utils' and 'fletx.utils.exceptions' to avoid heavy deps,
+    # the real modules are restored once di.py is loaded
+    stubbed = ('fletx', 'fletx.utils', 'fletx.utils.exceptions')
+    previous = {name: sys.modules.get(name) for name in stubbed}
     if 'fletx' not in sys.modules:
         sys.modules['fletx'] = types.ModuleType('fletx')
 
@@ -43,6 +46,12 @@ def _load_di_and_errors():
         module.DI.logger = simple_logger  # override descriptor on class
     except Exception:
         pass
+
+    for name, mod in previous.items():
+        if mod is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = mod
     return module.DI, DependencyNotFoundError
 
 
@@ -0,0 +1,221 @@
+import asyncio
+
+import pytest
+
+from fletx.core.controller import EventBus, ControllerEvent
+
+
+def emit_all(bus, types):
+    for index, event_type in enumerate(types):
+        bus.emit(event_type, index)
+
+
+def test_history_is_bounded_and_indexed():
+    bus = EventBus(history_size=3)
+    emit_all(bus, ['a', 'b', 'a', 'c', 'b'])
+
+    assert [e.data for e in bus.get_history()] == [2, 3, 4]
+    assert [e.data for e in bus.get_history('a')] == [2]
+    assert [e.data for e in bus.get_history('b')] == [4]
+    assert bus.last_event.value.data == 4
+
+
+def test_event_history_view_is_bounded():
+    bus = EventBus(history_size=2)
+    bus.emit('a', 0)
+    history = bus.event_history
+    emit_all(bus, ['b', 'c'])
+    assert [e.type for e in history.value] == ['b', 'c']
+
+
+def test_listen_reactive_updates_incrementally():
+    bus = EventBus(history_size=3)
+    bus.emit('click', 'first')
+    clicks = bus.listen_reactive('click')
+    assert bus.listen_reactive('click') is clicks
+    assert [e.data for e in clicks.value] == ['first']
+
+    changes = []
+    clicks.listen_changes(changes.extend)
+    emit_all(bus, ['click', 'move', 'move'])
+
+    # 'first' was evicted, the new click appended
+    assert [e.data for e in clicks.value] == [0]
+    assert [type(change).__name__ for change in changes] == ['Insert', 'Remove']
+
+
+def test_history_can_be_disabled():
+    bus = EventBus(history_size=0)
+    bus.emit(ControllerEvent('a'))
+    assert bus.get_history() == []
+    assert bus.last_event.value.type == 'a'
+
+
+def test_clear_history():
+    bus = EventBus()
+    clicks = bus.listen_reactive('click')
+    emit_all(bus, ['click', 'click'])
+    bus.clear_history()
+    assert bus.get_history() == []
+    assert clicks.value == []
+
+
+def collect(bus, pattern, received):
+    bus.on(pattern, lambda event: received.append((pattern, event.type)))
+
+
+def test_topic_patterns():
+    bus = EventBus()
+    received = []
+    for pattern in ['orders.*', 'orders.#', 'orders.created', '#.added', 'users']:
+        collect(bus, pattern, received)
+
+    bus.emit('orders.created')
+    bus.emit('orders')
+    bus.emit('orders.item.added')
+    bus.emit('users')
+    assert received == [
+        ('orders.*', 'orders.created'), 
+        ('orders.#', 'orders.created'),
+        ('orders.created', 'orders.created'),
+        ('orders.#', 'orders'),
+        ('orders.#', 'orders.item.added'),
+        ('#.added', 'orders.item.added'),
+        ('users', 'users'),
+    ]
+
+
+def test_dispatch_cache_is_invalidated_on_subscribe_and_unsubscribe():
+    bus = EventBus()
+    received = []
+    bus.emit('orders.created')
+    assert bus._match('orders.created') == ()
+
+    handler = lambda event: received.append(event.type)
+    bus.on('orders.*', handler)
+    bus.emit('orders.created')
+    assert received == ['orders.created']
+
+    bus.off('orders.*', handler)
+    bus.emit('orders.created')
+    assert received == ['orders.created']
+    assert bus._topics.children == {}
+
+
+def test_once_pattern_listener_runs_once():
+    bus = EventBus()
+    received = []
+    bus.once('jobs.#', lambda event: received.append(event.data))
+    bus.emit('jobs.done', 1)
+    bus.emit('jobs.done', 2)
+    assert received == [1]
+    assert bus._match('jobs.done') == ()
+
+
+def run_on(loop, coroutine_fn):
+    return asyncio.run_coroutine_threadsafe(coroutine_fn(), loop).result(2)
+
+
+def test_sync_dispatch_runs_coroutine_once_listeners():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event.data)
+
+    bus.once('ready', handler)
+    bus.emit('ready', 1)
+    bus.emit('ready', 2)
+    assert received == [1]
+
+
+def test_async_dispatch_limits_concurrency(loop):
+    bus = EventBus(dispatch='async', concurrency=2, loop=loop)
+    running, peak, received = [0], [0], []
+
+    async def handler(event):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        received.append(event.data)
+
+    bus.on('tick', handler)
+
+    async def emit_and_drain():
+        for value in range(6):
+            bus.emit('tick', value)
+        assert received == []
+        await bus.drain()
+
+    run_on(loop, emit_and_drain)
+    assert sorted(received) == list(range(6))
+    assert peak[0] == 2
+
+
+def test_async_dispatch_drop_and_coalesce_policies(loop):
+    for overflow, expected in [('drop', [0, 1]), ('coalesce', [0, 3])]:
+        bus = EventBus(dispatch='async', queue_size=2, overflow=overflow, loop=loop)
+        received = []
+        bus.on('price', lambda event: received.append(event.data))
+
+        async def burst():
+            for value in range(4):
+                bus.emit('price', value)
+            await bus.drain()
+
+        run_on(loop, burst)
+        assert received == expected, overflow
+        assert bus.get_history('price')[-1].data == 3
+
+
+def test_async_dispatch_block_policy_waits_for_room(loop):
+    bus = EventBus(dispatch='async', queue_size=1, overflow='block', loop=loop)
+    received = []
+    bus.on('job', lambda event: received.append(event.data))
+
+    for value in range(5):
+        bus.emit('job', value)
+    
+    async def drain():
+        await bus.drain()
+    
+    run_on(loop, drain)
+    assert received == list(range(5))
+    assert bus.dropped == 0
+
+
+def test_dispatcher_task_is_tracked_until_drained(loop):
+    bus = EventBus(dispatch='async', loop=loop)
+    bus.on('tick', lambda event: None)
+
+    async def emit_and_drain():
+        bus.emit('tick')
+        await asyncio.sleep(0)
+        assert len(bus._tasks) == 1
+        await bus.drain()
+        assert not bus._tasks
+
+    run_on(loop, emit_and_drain)
+
+
+def test_history_views_are_read_only():
+    bus = EventBus()
+    clicks = bus.listen_reactive('click')
+    for mutate in (
+        lambda: clicks.append(None),
+        lambda: clicks.clear(),
+        lambda: clicks.__delitem__(0),
+        lambda: setattr(clicks, 'value', []),
+        lambda: bus.event_history.pop(),
+    ):
+        with pytest.raises(TypeError):
+            mutate()
+
+    # Disposing a shared view does not break it for other callers
+    clicks.dispose()
+    received = []
+    bus.listen_reactive('click').listen(lambda: received.append(True))
+    bus.emit('click')
+    assert received == [True]
+    assert len(clicks) == 1
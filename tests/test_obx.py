@@ -0,0 +1,167 @@
+import flet as ft
+from fletx.core.state import (
+    Reactive, RxInt, RxStr, RxBool, ReactiveDependencyTracker
+)
+from fletx.decorators.widgets import obx, memo_obx
+from fletx.widgets.obx import Obx, ObxController
+
+
+def build(wrapper: Obx) -> ft.Control:
+    wrapper._build_widget()
+    return wrapper.widget
+
+
+def test_rebuild_keeps_widget_identity():
+    count = RxInt(0)
+    wrapper = Obx(lambda: ft.Text(f"Count: {count.value}", size=12))
+    widget = build(wrapper)
+
+    count.value = 3
+    assert wrapper.widget is widget
+    assert widget.value == "Count: 3"
+    assert widget.size == 12
+
+
+def test_copy_plan_is_cached_and_settable_only():
+    plan = ObxController._get_copy_plan(ft.Text, ft.Text)
+    assert plan is ObxController._get_copy_plan(ft.Text, ft.Text)
+    assert 'value' in plan
+    assert 'page' not in plan and 'parent' not in plan
+    for name in plan:
+        assert getattr(ft.Text, name).fset is not None
+
+
+def test_copy_only_assigns_changed_values():
+    assigned = []
+
+    class TrackedText(ft.Text):
+        def __setattr__(self, name, value):
+            assigned.append(name)
+            super().__setattr__(name, value)
+
+    target = TrackedText("a", size=10)
+    source = TrackedText("b", size=10)
+    assigned.clear()
+
+    ObxController()._copy_widget_properties(source, target)
+    assert assigned == ['value']
+    assert target.value == "b"
+
+
+def test_select_skips_builder_when_selection_unchanged():
+    user = Reactive({'name': "Ada", 'visits': 0})
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return ft.Text(user.value['name'])
+
+    wrapper = Obx(builder, select=lambda: user.value['name'])
+    widget = build(wrapper)
+
+    user.value = {'name': "Ada", 'visits': 1}
+    assert len(calls) == 1
+
+    user.value = {'name': "Grace", 'visits': 1}
+    assert len(calls) == 2
+    assert widget.value == "Grace"
+
+
+def test_obx_decorator_select():
+    count = RxInt(0)
+    calls = []
+
+    @obx(select=lambda step: count.value // step)
+    def bucket(step):
+        calls.append(step)
+        return ft.Text(f"Bucket {count.value // step}")
+
+    # Held by the control tree in an app
+    wrapper = bucket(10)
+    widget = build(wrapper)
+    for value in range(1, 12):
+        count.value = value
+    assert len(calls) == 2
+    assert widget.value == "Bucket 1"
+
+
+def test_tracker_is_restored_after_build():
+    count = RxInt(0)
+    build(Obx(lambda: ft.Text(str(count.value))))
+    assert ReactiveDependencyTracker._current_tracker is None
+
+
+def test_stale_branch_dependencies_are_pruned():
+    show_details = RxBool(False)
+    summary, details = RxStr("summary"), RxStr("details")
+    wrapper = Obx(
+        lambda: ft.Text(details.value if show_details.value else summary.value)
+    )
+    widget = build(wrapper)
+    assert set(wrapper.controller._dependencies) == {show_details, summary}
+
+    for _ in range(5):
+        show_details.toggle()
+    assert set(wrapper.controller._dependencies) == {show_details, details}
+    assert len(summary._observers) == 0
+    assert len(details._observers) == 1
+    assert widget.value == "details"
+
+    summary.value = "changed"
+    assert widget.value == "details"
+
+
+def test_dispose_unsubscribes_dependencies():
+    count = RxInt(0)
+    wrapper = Obx(lambda: ft.Text(str(count.value)))
+    build(wrapper)
+    wrapper.dispose()
+    assert len(count._observers) == 0
+
+
+def test_memo_obx_reuses_wrapper_per_arguments():
+    calls = []
+
+    @obx(memo=True, memo_size=2)
+    def card(title, tags):
+        calls.append(title)
+        return ft.Text(title)
+
+    tags = ['a']
+    first = card("one", tags)
+    assert card("one", tags) is first
+    assert card("one", ['a']) is not first
+    assert card(1, tags) is not card(True, tags)
+
+    # Least recently used entries are dropped
+    card("two", tags)
+    assert card("one", tags) is not first
+
+
+def test_memo_obx_never_reuses_disposed_wrapper():
+    @memo_obx
+    def label(text):
+        return ft.Text(text)
+
+    first = label("a")
+    first.dispose()
+    assert label("a") is not first
+
+
+def test_memo_obx_releases_arguments_on_dispose():
+    import gc, weakref
+
+    class Page:
+        pass
+
+    @memo_obx
+    def header(page):
+        return ft.Text("header")
+
+    page = Page()
+    page_ref = weakref.ref(page)
+    wrapper = header(page)
+    wrapper.dispose()
+    del page, wrapper
+    gc.collect()
+    assert page_ref() is None
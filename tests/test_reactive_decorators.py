@@ -0,0 +1,211 @@
+import time
+import threading
+
+from fletx.core import RxInt, Reactive, Computed
+from fletx.decorators.reactive import (
+    reactive_memo, ReactiveMemoryCache, reactive_debounce, reactive_throttle,
+    reactive_batch, batch_scope, BatchManager
+)
+
+
+def test_memo_hits_and_invalidation_disposes_observers():
+    rx = RxInt(2)
+    calls = []
+
+    @reactive_memo(maxsize=4)
+    def double(factor):
+        calls.append(factor)
+        return rx.value * factor
+
+    assert double(3) == 6
+    assert double(3) == 6
+    assert calls == [3]
+    assert len(rx._observers) == 1
+
+    rx.value = 5
+    assert len(rx._observers) == 0
+    assert double(3) == 15
+    info = double.cache_info()
+    assert (info['hits'], info['misses'], info['invalidations']) == (1, 2, 1)
+
+
+def test_memo_is_fresh_inside_a_batch():
+    rx = RxInt(2)
+    doubled = Computed(lambda: rx.value * 2)
+
+    @reactive_memo()
+    def read(source):
+        return source.value
+
+    assert read(rx) == 2
+    assert read(doubled) == 4
+    with Reactive.batch():
+        rx.value = 5
+        # The invalidation observers are deferred until the batch exits
+        assert read(rx) == 5
+        assert read(doubled) == 10
+    assert read(rx) == 5
+    assert read.cache_info()['invalidations'] == 2
+
+
+def test_memo_eviction_is_lru_and_disposes_observers():
+    rx = RxInt(1)
+
+    @reactive_memo(maxsize=2)
+    def add(n):
+        return rx.value + n
+
+    add(1)
+    add(2)
+    add(1)
+    add(3)
+    assert (add.__name__, (2,), ()) not in add.cache
+    assert (add.__name__, (1,), ()) in add.cache
+    assert add.cache_info()['evictions'] == 1
+    assert len(rx._observers) == 2
+
+    add.clear_cache()
+    assert len(rx._observers) == 0
+
+
+def test_memo_ttl_expires_entries():
+    cache = ReactiveMemoryCache(maxsize=4, ttl=0.01)
+    cache.set('key', 1, set())
+    assert cache.get('key') == (1, set())
+    time.sleep(0.02)
+    assert cache.get('key') is None
+    assert cache.info()['expirations'] == 1
+
+
+def test_debounce_groups_calls_by_argument_identity():
+    calls = []
+
+    @reactive_debounce(10)
+    def save(record):
+        calls.append(dict(record))
+
+    first, second = {'id': 1}, {'id': 2}
+    handle = save(first)
+    save(second)
+    first['saved'] = True
+    assert save(first) is handle
+
+    save.flush()
+    assert sorted(call['id'] for call in calls) == [1, 2]
+    assert {'id': 1, 'saved': True} in calls
+
+
+def test_debounce_merges_equal_arguments():
+    calls = []
+
+    @reactive_debounce(10)
+    def save(name):
+        calls.append(name)
+
+    for _ in range(5):
+        save("".join(["do", "c"]))
+    save.flush()
+    assert calls == ["doc"]
+
+
+def test_debounce_cancel_drops_pending_calls():
+    calls = []
+
+    @reactive_debounce(10, key_fn=lambda value: 'all')
+    def log(value):
+        calls.append(value)
+
+    log(1)
+    log(2)
+    log.cancel()
+    log.flush()
+    assert calls == []
+
+
+def test_throttle_keeps_the_last_call():
+    calls = []
+
+    counter = RxInt(0)
+
+    @reactive_throttle(0.05)
+    def update(rx):
+        calls.append(rx.value)
+
+    for value in range(5):
+        counter.value = value
+        update(counter)
+    assert calls == [0]
+    time.sleep(0.15)
+    assert calls == [0, 4]
+
+
+def test_batch_preserves_order_and_merges_calls():
+    manager = BatchManager()
+    calls = []
+    manager.add_update(lambda: calls.append('a'), key='a')
+    manager.add_update(lambda: calls.append('b'), key='b')
+    manager.add_update(lambda: calls.append('a2'), key='a')
+    manager.flush()
+    assert calls == ['a2', 'b']
+
+
+def test_batch_flushes_off_loop_from_threads():
+    calls = []
+    done = threading.Event()
+
+    @reactive_batch()
+    def refresh(rx):
+        calls.append(rx.value)
+        done.set()
+
+    counter = RxInt(0)
+    workers = [
+        threading.Thread(target=refresh, args=(counter,)) for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert done.wait(2)
+    time.sleep(0.05)
+    assert len(calls) <= 4 and calls[0] == 0
+
+
+def test_nested_named_scopes_flush_together():
+    manager = BatchManager()
+    calls = []
+
+    with manager.scope('sync'):
+        manager.add_update(lambda: calls.append(1))
+        with manager.scope('inner'):
+            manager.add_update(lambda: calls.append(2))
+        
+        # Another thread joins the open scope by name
+        worker = threading.Thread(
+            target=manager.add_update, 
+            args=(lambda: calls.append(3),), 
+            kwargs={'scope': 'sync'}
+        )
+        worker.start()
+        worker.join()
+        manager.flush()
+        assert calls == []
+
+    manager.flush()
+    assert calls == [1, 2, 3]
+
+
+def test_batch_scope_merges_decorated_calls():
+    calls = []
+    counter = RxInt(0)
+
+    @reactive_batch()
+    def refresh(rx):
+        calls.append(rx.value)
+
+    with batch_scope():
+        for value in range(3):
+            counter.value = value
+            refresh(counter)
+    time.sleep(0.05)
+    assert calls == [2]
@@ -0,0 +1,164 @@
+import pytest
+from types import SimpleNamespace
+
+import flet as ft
+from fletx.core import RxList
+from fletx.decorators.widgets import reactive_list, reactive_virtual_list
+
+
+def make_list(items, key_fn=None):
+    built = []
+
+    def item_builder(item, index):
+        built.append(item['id'])
+        return ft.Text(item['name'])
+
+    @reactive_list(
+        items_attr='rx_items',
+        item_builder=item_builder,
+        empty_builder=lambda: ft.Text("Empty"),
+        key_fn=key_fn
+    )
+    class ItemList(ft.Column):
+        def __init__(self):
+            self.rx_items = RxList(items)
+            super().__init__()
+
+    widget = ItemList()
+    widget._is_mounted = True
+    widget._setup_list_binding()
+    built.clear()
+    return widget, built
+
+
+@pytest.fixture
+def keyed():
+    return make_list(
+        [{'id': i, 'name': f"item {i}"} for i in range(5)],
+        key_fn=lambda item: item['id']
+    )
+
+
+def names(widget):
+    return [control.value for control in widget.controls]
+
+
+def test_keyed_append_builds_only_new_item(keyed):
+    widget, built = keyed
+    first = widget.controls[0]
+    widget.rx_items.append({'id': 5, 'name': "item 5"})
+    assert built == [5]
+    assert widget.controls[0] is first
+    assert len(widget.controls) == 6
+
+
+def test_keyed_reorder_and_remove_reuse_controls(keyed):
+    widget, built = keyed
+    before = {c.value: c for c in widget.controls}
+    widget.rx_items.value = list(reversed(widget.rx_items.value[1:]))
+    assert built == []
+    assert names(widget) == ["item 4", "item 3", "item 2", "item 1"]
+    assert all(before[c.value] is c for c in widget.controls)
+
+
+def test_keyed_changed_item_is_rebuilt(keyed):
+    widget, built = keyed
+    widget.rx_items[2] = {'id': 2, 'name': "renamed"}
+    assert built == [2]
+    assert names(widget)[2] == "renamed"
+
+
+def test_keyed_item_mutated_in_place_is_rebuilt(keyed):
+    widget, built = keyed
+    item = widget.rx_items[1]
+    item['name'] = "X"
+    widget.rx_items[1] = item
+    assert built == [1]
+    assert names(widget)[1] == "X"
+
+
+def test_keyed_empty_and_refill(keyed):
+    widget, built = keyed
+    widget.rx_items.clear()
+    assert names(widget) == ["Empty"]
+    widget.rx_items.append({'id': 1, 'name': "again"})
+    assert names(widget) == ["again"]
+
+
+def test_unkeyed_append_is_incremental():
+    widget, built = make_list([{'id': 0, 'name': "item 0"}])
+    widget.rx_items.append({'id': 1, 'name': "item 1"})
+    assert built == [1]
+    assert names(widget) == ["item 0", "item 1"]
+
+
+def make_virtual_list(count, recycle=True):
+    built = []
+
+    def item_builder(item, index):
+        built.append(index)
+        return ft.Text(item, height=20)
+
+    def item_updater(control, item, index):
+        control.value = item
+
+    @reactive_virtual_list(
+        items_attr='rx_lines',
+        item_builder=item_builder,
+        item_updater=item_updater if recycle else None,
+        item_extent=20,
+        overscan=2,
+        viewport_extent=100
+    )
+    class LogView(ft.ListView):
+        def __init__(self):
+            self.rx_lines = RxList([f"line {i}" for i in range(count)])
+            super().__init__()
+
+    widget = LogView()
+    widget._is_mounted = True
+    widget._setup_list_binding()
+    return widget, built
+
+
+def scroll(widget, pixels, viewport=100):
+    widget._handle_scroll(SimpleNamespace(pixels=pixels, viewport_dimension=viewport))
+
+
+def rows(widget):
+    return [control.value for control in widget.controls[1:-1]]
+
+
+def test_virtual_list_only_builds_visible_window():
+    widget, built = make_virtual_list(100_000)
+    # 6 visible rows (100px / 20px + 1) and 2 overscan rows after them
+    assert len(built) == 8
+    assert rows(widget)[0] == "line 0"
+    assert widget.controls[-1].height == (100_000 - 8) * 20
+
+
+def test_virtual_list_recycles_rows_on_scroll():
+    widget, built = make_virtual_list(1_000)
+    built.clear()
+    scroll(widget, 10_000)
+    # The 8 initial rows are recycled, the window grew by 2 overscan rows
+    assert len(built) == 2
+    assert len(rows(widget)) == 10
+    assert rows(widget)[0] == "line 498"
+    assert widget.controls[0].height == 498 * 20
+
+
+def test_virtual_list_without_updater_builds_entering_rows():
+    widget, built = make_virtual_list(1_000, recycle=False)
+    built.clear()
+    scroll(widget, 40)
+    assert built == [8, 9]
+    assert rows(widget)[0] == "line 0"
+
+
+def test_virtual_list_follows_list_changes():
+    widget, built = make_virtual_list(10)
+    widget.rx_lines.insert(0, "first")
+    assert rows(widget)[:2] == ["first", "line 0"]
+    widget.rx_lines.clear()
+    assert rows(widget) == []
@@ -1,7 +1,11 @@
+import gc
+import asyncio
+import threading
 import pytest
 from fletx.core.state import (
     ReactiveDependencyTracker, Observer, Reactive, Computed,
-    RxInt, RxStr, RxBool, RxList, RxDict
+    RxInt, RxStr, RxBool, RxList, RxDict, ReactiveScheduler, batched,
+    Insert, Remove, Replace, Move, Reset
 )
 
 # --- ReactiveDependencyTracker ---
@@ -37,6 +41,37 @@ def test_observer_auto_dispose():
     rx.value = 1
     assert not called
 
+def test_weak_observer_is_pruned_when_collected():
+    rx = Reactive(0)
+    class Subscriber:
+        def __init__(self):
+            self.calls = 0
+        def on_change(self):
+            self.calls += 1
+    sub = Subscriber()
+    obs = rx.listen(sub.on_change, weak=True)
+    rx.value = 1
+    assert sub.calls == 1
+    del sub
+    gc.collect()
+    assert not obs.active
+    assert obs not in rx._observers
+
+def test_reactive_primitives_are_slotted():
+    for rx in (Reactive(0), RxInt(), RxStr(), RxBool(), RxList(), RxDict()):
+        assert not hasattr(rx, '__dict__')
+    assert not hasattr(Observer(lambda: None), '__dict__')
+
+def test_observer_set_is_allocated_on_first_listen():
+    rx = RxInt(0)
+    assert rx._observers is None
+    rx.value = 1
+    rx.dispose()
+    assert rx._observers is None
+
+    observer = rx.listen(lambda: None)
+    assert rx._observers == {observer}
+
 # --- Reactive ---
 def test_reactive_value_and_observers():
     rx = Reactive(10)
@@ -48,6 +83,42 @@ def test_reactive_value_and_observers():
     rx.value = 30
     assert called[-1] == 30
 
+def test_reactive_equality_strategies():
+    items = [1, 2, 3]
+    calls = []
+    by_version = Reactive(items, equals="version")
+    by_version.listen(lambda: calls.append("version"))
+    items.append(4)
+    by_version.value = items
+    assert calls == ["version"]
+    assert by_version.version == 1
+
+    by_identity = Reactive([1], equals="identity")
+    by_identity.listen(lambda: calls.append("identity"))
+    by_identity.value = [1]
+    assert calls[-1] == "identity"
+
+    shallow = Reactive([items], equals="shallow")
+    shallow.listen(lambda: calls.append("shallow"))
+    shallow.value = [items]
+    assert calls[-1] == "identity"
+
+    custom = RxInt(0, equals=lambda old, new: abs(old - new) < 5)
+    custom.listen(lambda: calls.append("custom"))
+    custom.value = 3
+    assert calls[-1] == "identity"
+    custom.value = 10
+    assert calls[-1] == "custom"
+
+    with pytest.raises(ValueError):
+        Reactive(0, equals="unknown")
+
+def test_version_counts_in_place_mutations():
+    rx = RxList([])
+    rx.append(1)
+    rx[0] = 2
+    assert rx.version == 2
+
 # --- Computed ---
 def test_computed_tracks_and_updates():
     rx1 = Reactive(2)
@@ -59,6 +130,171 @@ def test_computed_tracks_and_updates():
     rx2.value = 10
     assert comp.value == 15
 
+def test_computed_diamond_is_glitch_free():
+    a = RxInt(1)
+    runs = []
+    b = Computed(lambda: a.value + 1)
+    c = Computed(lambda: a.value * 2)
+    def compute_d():
+        runs.append((b.value, c.value))
+        return b.value + c.value
+    d = Computed(compute_d)
+    seen = []
+    d.listen(lambda: seen.append((a.value, d.value)))
+    runs.clear()
+    a.value = 5
+    assert runs == [(6, 10)]
+    assert seen == [(5, 16)]
+
+def test_computed_switches_dependencies():
+    flag = RxBool(True)
+    x = RxInt(1)
+    y = RxInt(2)
+    comp = Computed(lambda: x.value if flag.value else y.value)
+    flag.value = False
+    assert comp.value == 2
+    calls = []
+    comp.listen(lambda: calls.append(comp.value))
+    x.value = 10
+    assert calls == []
+    y.value = 20
+    assert calls == [20]
+
+def test_computed_is_fresh_after_deferred_write():
+    x = RxInt(1)
+    doubled = Computed(lambda: x.value * 2)
+    trigger = RxBool(False)
+    seen = []
+    def on_trigger():
+        x.value = 100
+        seen.append(doubled.value)
+    trigger.listen(on_trigger)
+    trigger.value = True
+    assert seen == [200]
+
+    with Reactive.batch():
+        x.value = 3
+        assert doubled.value == 6
+    assert doubled.value == 6
+
+    # Only the first level is queued by the write
+    a = RxInt(1)
+    b = Computed(lambda: a.value * 2)
+    c = Computed(lambda: b.value + 1)
+    with Reactive.batch():
+        a.value = 10
+        assert c.value == 21
+        assert b.value == 20
+    assert c.value == 21
+
+    seen.clear()
+    other = RxBool(False)
+    def on_other():
+        a.value = 5
+        seen.append(c.value)
+    other.listen(on_other)
+    other.value = True
+    assert seen == [11]
+
+def test_lazy_computed_recomputes_on_read_only():
+    rx = RxInt(1)
+    runs = []
+    def compute():
+        runs.append(rx.value)
+        return rx.value * 10
+    comp = Computed(compute, lazy=True)
+    assert runs == []
+    assert comp.value == 10
+    rx.value = 2
+    rx.value = 3
+    assert runs == [1]
+    assert comp.is_dirty
+    assert comp.value == 30
+    assert runs == [1, 3]
+
+def test_lazy_computed_is_eager_when_observed():
+    rx = RxInt(1)
+    base = Computed(lambda: rx.value + 1, lazy=True)
+    top = Computed(lambda: base.value * 2, lazy=True)
+    assert top.value == 4
+    calls = []
+    top.listen(lambda: calls.append(top.value))
+    rx.value = 2
+    assert calls == [6]
+    assert not base.is_dirty
+
+# --- Thread dispatch ---
+def test_waves_are_per_thread_without_dispatch():
+    rx = RxInt(0)
+    calls = []
+    rx.listen(lambda: calls.append(threading.get_ident()))
+    with Reactive.batch():
+        worker = threading.Thread(target=lambda: setattr(rx, 'value', 1))
+        worker.start()
+        worker.join()
+        # Not held back by the batch of another thread
+        assert calls == [worker.ident]
+    assert calls == [worker.ident]
+
+
+def test_off_loop_writes_are_marshalled_and_coalesced():
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    ReactiveScheduler.set_thread_dispatch(True, loop=loop)
+    try:
+        rx = RxInt(0)
+        calls = []
+        rx.listen(lambda: calls.append((threading.get_ident(), rx.value)))
+
+        # Keep the loop busy so the burst can't be drained halfway
+        gate = threading.Event()
+        loop.call_soon_threadsafe(gate.wait, 2)
+        for i in range(1, 51):
+            rx.value = i
+        gate.set()
+        done = threading.Event()
+        loop.call_soon_threadsafe(done.set)
+        assert done.wait(2)
+        assert calls == [(loop_thread.ident, 50)]
+    finally:
+        ReactiveScheduler.set_thread_dispatch(False)
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join(2)
+        loop.close()
+
+def test_off_loop_writes_do_not_wait_for_a_loop_wave():
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    ReactiveScheduler.set_thread_dispatch(True, loop=loop)
+    try:
+        rx = RxInt(0)
+        calls, unblocked = [], []
+        rx.listen(lambda: calls.append(rx.value))
+
+        def wave():
+            # The loop holds the wave lock until the batch exits
+            with Reactive.batch():
+                written = threading.Event()
+                worker = threading.Thread(
+                    target=lambda: (setattr(rx, 'value', 1), written.set())
+                )
+                worker.start()
+                unblocked.append(written.wait(1))
+
+        loop.call_soon_threadsafe(wave)
+        done = threading.Event()
+        loop.call_soon_threadsafe(lambda: loop.call_soon(done.set))
+        assert done.wait(3)
+        assert unblocked == [True]
+        assert calls == [1]
+    finally:
+        ReactiveScheduler.set_thread_dispatch(False)
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join(2)
+        loop.close()
+
 # --- RxInt ---
 def test_rxint_increment_decrement():
     rx = RxInt(5)
@@ -98,6 +334,43 @@ def test_rxlist_append_remove_clear():
     assert rx[0] == 10
     assert len(rx) == 1
 
+def test_rxlist_change_records():
+    rx = RxList([1, 2, 3])
+    changes = []
+    rx.listen_changes(changes.extend)
+    rx.append(4)
+    rx.insert(0, 0)
+    rx.pop()
+    rx.remove(2)
+    rx[0] = 9
+    rx.move(0, 2)
+    rx.extend([7, 8])
+    rx.value = [1]
+    rx.clear()
+    assert changes == [
+        Insert(3, [4]),
+        Insert(0, [0]),
+        Remove(4, 1),
+        Remove(2, 1),
+        Replace(0, 9),
+        Move(0, 2),
+        Insert(3, [7, 8]),
+        Reset(),
+        Reset(),
+    ]
+
+def test_rxlist_change_records_are_batched():
+    rx = RxList([])
+    received = []
+    coarse = []
+    rx.listen_changes(received.append)
+    rx.listen(lambda: coarse.append(len(rx)))
+    with Reactive.batch():
+        rx.append("a")
+        rx.append("b")
+    assert received == [[Insert(0, ["a"]), Insert(1, ["b"])]]
+    assert coarse == [2]
+
 # --- RxDict ---
 def test_rxdict_set_get_del_update_clear():
     rx = RxDict({"a": 1})
@@ -109,4 +382,83 @@ def test_rxdict_set_get_del_update_clear():
     rx.update({"c": 3})
     assert rx["c"] == 3
     rx.clear()
-    assert rx.value == {} 
\ No newline at end of file
+    assert rx.value == {}
+
+def test_rxdict_tracks_keys_independently():
+    rx = RxDict({"user": "ann", "total": 0})
+    runs = []
+    def compute():
+        runs.append(1)
+        return rx.get("user")
+    comp = Computed(compute)
+    key_calls = []
+    rx.listen_key("user", lambda: key_calls.append(rx["user"]))
+    runs.clear()
+    rx["total"] = 10
+    rx.update({"total": 20})
+    assert runs == []
+    assert key_calls == []
+    rx["user"] = "bob"
+    assert comp.value == "bob"
+    assert runs == [1]
+    assert key_calls == ["bob"]
+    del rx["user"]
+    assert comp.value is None
+
+def test_rxdict_contains_is_reactive():
+    rx = RxDict({})
+    has_key = Computed(lambda: "a" in rx)
+    assert has_key.value is False
+    rx["a"] = 1
+    assert has_key.value is True
+    rx.clear()
+    assert has_key.value is False
+
+# --- Batch ---
+def test_batch_defers_and_deduplicates_notifications():
+    a = RxInt(0)
+    b = RxStr("")
+    calls = []
+    def callback():
+        calls.append((a.value, b.value))
+    a.listen(callback)
+    b.listen(callback)
+    with Reactive.batch():
+        a.value = 1
+        b.value = "x"
+        a.value = 2
+        assert calls == []
+    assert calls == [(2, "x")]
+
+def test_nested_batch_flushes_on_outermost_exit():
+    rx = RxInt(0)
+    calls = []
+    rx.listen(lambda: calls.append(rx.value))
+    with Reactive.batch():
+        with Reactive.batch():
+            rx.value = 1
+        assert calls == []
+        rx.value = 2
+    assert calls == [2]
+
+def test_batch_flushes_on_error():
+    rx = RxInt(0)
+    calls = []
+    rx.listen(lambda: calls.append(rx.value))
+    with pytest.raises(ValueError):
+        with Reactive.batch():
+            rx.value = 5
+            raise ValueError()
+    assert calls == [5]
+
+def test_batched_decorator():
+    rx = RxList([])
+    calls = []
+    rx.listen(lambda: calls.append(len(rx)))
+    @batched
+    def fill():
+        for i in range(10):
+            rx.append(i)
+        return "done"
+    assert fill() == "done"
+    assert calls == [10]
@@ -0,0 +1,301 @@
+import time
+import asyncio
+import threading
+
+import pytest
+import flet as ft
+from fletx.core.state import RxInt
+from fletx.core.scheduling import (
+    FrameScheduler, request_update,
+    RebuildScheduler, RebuildPriority,
+    TimerWheel, DebouncedCall, run_awaitable
+)
+from fletx.utils.context import AppContext
+from fletx.widgets.obx import Obx
+
+
+class FakePage:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, *controls):
+        self.updates.append(controls)
+
+
+class FakeControl:
+    def __init__(self, page):
+        self.page = page
+        self.direct_updates = 0
+
+    def update(self):
+        self.direct_updates += 1
+
+
+@pytest.fixture
+def scheduler():
+    FrameScheduler.configure(fps=1, enabled=True)
+    # Start a frame so that the next flush is a second away
+    FrameScheduler.flush()
+    yield FrameScheduler
+    FrameScheduler.flush()
+    FrameScheduler.configure(fps=60)
+
+
+def test_updates_are_coalesced_per_page(scheduler):
+    page = FakePage()
+    a, b = FakeControl(page), FakeControl(page)
+    for _ in range(5):
+        request_update(a)
+        request_update(b)
+    assert page.updates == []
+    scheduler.flush()
+    assert page.updates == [(a, b)]
+    assert a.direct_updates == 0
+
+
+def test_detached_controls_are_skipped(scheduler):
+    page = FakePage()
+    control = FakeControl(page)
+    request_update(control)
+    control.page = None
+    scheduler.flush()
+    assert page.updates == []
+
+
+def test_immediate_update_bypasses_frame(scheduler):
+    page = FakePage()
+    control = FakeControl(page)
+    request_update(control)
+    request_update(control, immediate=True)
+    assert control.direct_updates == 1
+    scheduler.flush()
+    assert page.updates == []
+
+
+@pytest.fixture
+def app_loop():
+    """An app event loop, only running inside run_until_complete()"""
+
+    loop = asyncio.new_event_loop()
+    AppContext.set_data('event_loop', loop)
+    yield loop
+    AppContext.remove_data('event_loop')
+    loop.close()
+
+
+def test_frames_are_flushed_after_the_loop_stopped(app_loop):
+    FrameScheduler.flush()
+    page = FakePage()
+    a, b = FakeControl(page), FakeControl(page)
+
+    async def write():
+        request_update(a)
+
+    # The loop stops before the frame is due
+    app_loop.run_until_complete(write())
+    request_update(b)
+    assert wait_until(lambda: page.updates)
+    assert page.updates == [(a, b)]
+
+
+def test_invalid_fps():
+    with pytest.raises(ValueError):
+        FrameScheduler.configure(fps=0)
+
+
+@pytest.fixture
+def loop(loop):
+    RebuildScheduler.configure(loop=loop)
+    yield loop
+    RebuildScheduler.configure(budget=0.008)
+    RebuildScheduler._loop = None
+
+
+def run_on(loop, fn):
+    done = threading.Event()
+
+    def step():
+        fn()
+        # Runs after the rebuild slice scheduled by fn
+        loop.call_soon(lambda: loop.call_soon(done.set))
+
+    loop.call_soon_threadsafe(step)
+    assert done.wait(2)
+
+
+def test_configure_keeps_the_loop_unless_given(loop):
+    RebuildScheduler.configure(budget=0.004)
+    assert RebuildScheduler._loop is loop
+
+
+def test_rebuilds_run_synchronously_without_loop():
+    calls = []
+    RebuildScheduler.schedule(lambda: calls.append(1))
+    assert calls == [1]
+
+
+def test_rebuilds_are_coalesced_and_run_by_lane(loop):
+    calls = []
+    idle = lambda: calls.append('idle')
+    normal = lambda: calls.append('normal')
+    visible = lambda: calls.append('visible')
+
+    def schedule():
+        for _ in range(3):
+            RebuildScheduler.schedule(idle, RebuildPriority.IDLE)
+            RebuildScheduler.schedule(normal, RebuildPriority.NORMAL)
+            RebuildScheduler.schedule(visible, RebuildPriority.USER_VISIBLE)
+
+    run_on(loop, schedule)
+    assert calls == ['visible', 'normal', 'idle']
+    assert RebuildScheduler.pending() == 0
+
+
+def test_rescheduling_promotes_to_more_urgent_lane(loop):
+    calls = []
+    first = lambda: calls.append('first')
+    second = lambda: calls.append('second')
+
+    def schedule():
+        RebuildScheduler.schedule(first, RebuildPriority.IDLE)
+        RebuildScheduler.schedule(second, RebuildPriority.NORMAL)
+        RebuildScheduler.schedule(first, RebuildPriority.USER_VISIBLE)
+
+    run_on(loop, schedule)
+    assert calls == ['first', 'second']
+
+
+def test_background_rebuilds_yield_to_the_loop(loop):
+    RebuildScheduler.configure(budget=0.001, loop=loop)
+    calls = []
+
+    def slow(name):
+        def rebuild():
+            time.sleep(0.002)
+            calls.append(name)
+        return rebuild
+    
+    def schedule():
+        for name in ('a', 'b', 'c'):
+            RebuildScheduler.schedule(slow(name), RebuildPriority.IDLE)
+        loop.call_soon(lambda: calls.append('input'))
+
+    run_on(loop, schedule)
+    deadline = time.monotonic() + 2
+    while len(calls) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert calls.index('input') < calls.index('c')
+
+
+def test_obx_priority_defers_rebuild(loop):
+    count = RxInt(0)
+    wrapper = Obx(
+        lambda: ft.Text(str(count.value)), 
+        priority = RebuildPriority.USER_VISIBLE
+    )
+    wrapper._build_widget()
+
+    def write():
+        for value in range(1, 6):
+            count.value = value
+        assert wrapper.widget.value == "0"
+
+    run_on(loop, write)
+    assert wrapper.widget.value == "5"
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_timer_wheel_never_fires_early():
+    wheel = TimerWheel(tick=0.01, size=8)
+    fired = []
+    start = time.monotonic()
+    wheel.schedule(0.05, lambda: fired.append(time.monotonic() - start))
+    cancelled = wheel.schedule(0.02, lambda: fired.append(None))
+    cancelled.cancel()
+
+    assert wait_until(lambda: fired)
+    time.sleep(0.05)
+    assert len(fired) == 1 and fired[0] >= 0.05
+
+
+def test_timer_wheel_survives_a_stopped_loop(app_loop):
+    wheel = TimerWheel(tick=0.01, size=8)
+    fired = []
+
+    async def schedule():
+        wheel.schedule(0.05, lambda: fired.append("first"))
+
+    app_loop.run_until_complete(schedule())
+    wheel.schedule(0.01, lambda: fired.append("second"))
+    assert wait_until(lambda: len(fired) == 2)
+    assert sorted(fired) == ["first", "second"]
+
+
+def test_debounce_runs_latest_call_on_trailing_edge():
+    calls = []
+    call = DebouncedCall(calls.append, 0.03)
+    for value in range(5):
+        call(value)
+    assert calls == []
+    assert wait_until(lambda: calls)
+    time.sleep(0.05)
+    assert calls == [4]
+    assert not call.active
+
+
+def test_throttle_runs_leading_and_trailing_edges():
+    calls = []
+    call = DebouncedCall(calls.append, 0.05, leading=True, max_wait=0.05)
+    call(1)
+    call(2)
+    call(3)
+    assert calls == [1]
+    assert wait_until(lambda: len(calls) == 2)
+    assert calls == [1, 3]
+
+
+def test_max_wait_bounds_a_continuous_burst():
+    calls = []
+    call = DebouncedCall(calls.append, 0.05, max_wait=0.1)
+    start = time.monotonic()
+    while time.monotonic() - start < 0.3:
+        call(time.monotonic())
+        time.sleep(0.01)
+    # The burst never paused for 50ms, max_wait still flushed it
+    assert len(calls) >= 2
+    call.cancel()
+
+
+def test_flush_and_cancel():
+    calls, idle = [], []
+    call = DebouncedCall(calls.append, 10, on_idle=lambda: idle.append(True))
+    call("a")
+    call.flush()
+    assert calls == ["a"]
+    assert not call.pending
+
+    call("b")
+    call.cancel()
+    call.flush()
+    assert calls == ["a"]
+    assert idle == [True, True]
+
+
+def test_run_awaitable_inside_another_running_loop():
+    received = []
+
+    async def handler():
+        received.append(True)
+
+    async def main():
+        run_awaitable(handler())
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert received == [True]
@@ -0,0 +1,110 @@
+from enum import Enum
+
+import pytest
+import flet as ft
+from fletx.core import RxBool
+from fletx.decorators.widgets import reactive_state_machine
+
+
+class LoadingState(Enum):
+    IDLE = "idle"
+    LOADING = "loading"
+    SUCCESS = "success"
+    ERROR = "error"
+
+
+TRANSITIONS = {
+    (LoadingState.IDLE, 'start'): LoadingState.LOADING,
+    (LoadingState.LOADING, 'success'): LoadingState.SUCCESS,
+    (LoadingState.LOADING, 'error'): LoadingState.ERROR,
+    (LoadingState.ERROR, 'retry'): LoadingState.LOADING,
+}
+
+
+def make_widget(**kwargs):
+    changes = []
+
+    @reactive_state_machine(
+        states = LoadingState,
+        initial_state = LoadingState.IDLE,
+        transitions = TRANSITIONS,
+        on_state_change = lambda old, new: changes.append((old, new)),
+        **kwargs
+    )
+    class LoadingWidget(ft.Container):
+        def __init__(self):
+            super().__init__()
+
+    return LoadingWidget(), changes
+
+
+def test_transitions_track_previous_state():
+    widget, changes = make_widget()
+    assert widget.transition('start')
+    assert widget.rx_state.value is LoadingState.LOADING
+    assert widget.get_previous_state() is LoadingState.IDLE
+    assert changes == [(LoadingState.IDLE, LoadingState.LOADING)]
+
+    assert not widget.transition('retry')
+    assert widget.get_current_state() is LoadingState.LOADING
+    assert set(widget.get_available_actions()) == {'success', 'error'}
+
+
+def test_direct_writes_accept_state_values():
+    widget, changes = make_widget()
+    widget.rx_state.value = "error"
+    assert widget.get_current_state() is LoadingState.ERROR
+    assert widget.can_transition('retry')
+    assert changes == [(LoadingState.IDLE, LoadingState.ERROR)]
+
+
+def test_transition_log_is_bounded():
+    widget, _ = make_widget(history_size=2)
+    for action in ('start', 'error', 'retry'):
+        widget.transition(action)
+
+    log = widget.get_transition_log()
+    assert [(t.from_state, t.action, t.to_state) for t in log] == [
+        (LoadingState.LOADING, 'error', LoadingState.ERROR),
+        (LoadingState.ERROR, 'retry', LoadingState.LOADING),
+    ]
+
+
+def test_invalid_transition_table():
+    class Other(Enum):
+        X = "x"
+
+    with pytest.raises(ValueError):
+        reactive_state_machine(
+            states = LoadingState,
+            initial_state = LoadingState.IDLE,
+            transitions = {(LoadingState.IDLE, 'go'): Other.X}
+        )
+
+
+def test_transitions_chained_inside_an_observer():
+    widget, changes = make_widget()
+    trigger = RxBool(False)
+    results = []
+
+    def on_trigger():
+        results.append(widget.transition('start'))
+        results.append(widget.transition('success'))
+
+    observer = trigger.listen(on_trigger)
+    trigger.value = True
+
+    assert results == [True, True]
+    assert widget.get_current_state() is LoadingState.SUCCESS
+    assert widget.get_previous_state() is LoadingState.LOADING
+    assert changes[-1][1] is LoadingState.SUCCESS
+    observer.dispose()
+
+
+def test_direct_writes_store_the_state_enum():
+    widget, _ = make_widget()
+    widget.rx_state.value = "error"
+    assert widget.rx_state.value is LoadingState.ERROR
+    with pytest.raises(ValueError):
+        widget.rx_state.value = "unknown"
+    assert widget.get_current_state() is LoadingState.ERROR
@@ -0,0 +1,154 @@
+import time
+import asyncio
+import threading
+
+import flet as ft
+from fletx.core import (
+    RxStr, RxBool, FormFieldValidationRule, FormValidator, ValidationResult
+)
+from fletx.decorators.widgets import reactive_form
+from fletx.utils.context import AppContext
+
+
+def make_validator(rules, values, **kwargs):
+    results = []
+    validator = FormValidator(
+        rules = rules,
+        get_value = values.__getitem__,
+        on_result = lambda name, result: results.append((name, result)),
+        **kwargs
+    )
+    return validator, results
+
+
+def test_results_are_cached_by_value():
+    calls = []
+    values = {'name': "ab"}
+
+    def min_length(value):
+        calls.append(value)
+        return len(value) >= 3
+
+    validator, results = make_validator({'name': min_length}, values)
+    assert not validator.validate('name').is_valid
+    assert not validator.validate('name').is_valid
+    values['name'] = "abc"
+    assert validator.validate('name').is_valid
+    assert calls == ["ab", "abc"]
+    assert len(results) == 3
+
+
+def test_dependent_fields_are_revalidated():
+    values = {'password': "secret", 'confirm': "secret"}
+    rules = {
+        'confirm': [
+            FormFieldValidationRule(
+                validate_fn = lambda value, deps: value == deps['password'],
+                err_message = "Passwords do not match",
+                depends_on = ['password']
+            )
+        ]
+    }
+    validator, results = make_validator(rules, values)
+    assert validator.watched_fields == {'password', 'confirm'}
+
+    values['password'] = "changed"
+    validator.field_changed('password')
+    assert results == [
+        ('confirm', ValidationResult(False, ("Passwords do not match",)))
+    ]
+
+
+def test_async_validator_superseded_runs_are_discarded(loop):
+    values = {'email': "taken@x.io"}
+    started = []
+
+    async def is_available(value):
+        started.append(value)
+        await asyncio.sleep(0.05 if value == "taken@x.io" else 0)
+        return value != "taken@x.io"
+
+    done = threading.Event()
+    validator, results = make_validator(
+        {'email': [FormFieldValidationRule(is_available, "{value} is taken")]},
+        values,
+        loop = loop
+    )
+
+    assert validator.validate('email') is None
+    values['email'] = "free@x.io"
+    assert validator.validate('email') is None
+    validator.when_settled(done.set)
+    assert done.wait(2)
+
+    assert results == [('email', ValidationResult(True))]
+    assert validator.pending == set()
+    # Cached from now on
+    assert validator.validate('email') == ValidationResult(True)
+
+
+def test_async_validator_without_loop_runs_synchronously():
+    async def check(value):
+        return value == "ok"
+
+    validator, results = make_validator({'code': check}, {'code': "ko"})
+    assert validator.validate('code') == ValidationResult(False, ("Invalid code value",))
+
+
+def test_reactive_form_uses_validator():
+    calls = []
+
+    def username_rule(value):
+        calls.append(value)
+        return len(value) >= 3
+
+    @reactive_form(
+        form_fields = {'username': 'rx_username', 'nickname': 'rx_nickname'},
+        validation_rules = {'username': username_rule}
+    )
+    class SignupForm(ft.Column):
+        def __init__(self):
+            self.rx_username = RxStr("")
+            self.rx_nickname = RxStr("")
+            self.rx_is_valid = RxBool(False)
+            super().__init__()
+
+    form = SignupForm()
+    form.rx_username.value = "ada"
+    assert form.rx_is_valid.value
+    form.rx_nickname.value = "countess"
+
+    # Submit reuses the cached result
+    assert form.validate_all()
+    assert calls == ["ada"]
+    assert form.get_errors() == {}
+
+
+def test_submit_with_failing_async_validator_fails_once(loop):
+    calls, failures = [], []
+
+    async def is_available(value):
+        calls.append(value)
+        raise RuntimeError("server down")
+
+    @reactive_form(
+        form_fields = {'email': 'rx_email'},
+        validation_rules = {'email': [FormFieldValidationRule(is_available)]},
+        on_submit_failed = failures.append,
+        auto_validate = False
+    )
+    class EmailForm(ft.Column):
+        def __init__(self):
+            self.rx_email = RxStr("ada@x.io")
+            super().__init__()
+
+    AppContext.set_data('event_loop', loop)
+    try:
+        form = EmailForm()
+        form.submit()
+        time.sleep(0.3)
+    finally:
+        AppContext.remove_data('event_loop')
+
+    assert calls == ["ada@x.io"]
+    assert failures == [{'email': ["Invalid email value"]}]